@@ -4,6 +4,8 @@ import logging
 from bqpl.edge_node import EdgeNode
 from bqpl.biosensor import Biosensor
 
+READING_BITS = 16  # 8 bits of heart rate and 8 of scaled temperature
+
 class BQPLManager:
     """
     Manages interactions between components of the Bio-Quantum Privacy Layer (BQPL).
@@ -36,6 +38,25 @@ class BQPLManager:
 
         return encrypted_data
 
+    def collect_and_process_many(self, count):
+        """
+        Collect several readings and encrypt them together.
+
+        :param count: Number of readings to collect.
+        :return: Ciphertexts, one row per reading.
+        """
+        readings = [self.convert_data_to_binary(self.biosensor.read_data()) for _ in range(count)]
+        return self.edge_node.process_batch(readings)
+
+    def decrypt_many(self, encrypted_data):
+        """
+        Decrypt ciphertexts produced by collect_and_process_many.
+
+        :param encrypted_data: Ciphertexts, one row per reading.
+        :return: List of binary reading strings.
+        """
+        return self.edge_node.decrypt_batch(encrypted_data, READING_BITS)
+
     def convert_data_to_binary(self, data):
         """
         Convert collected biological data to a binary string.
@@ -49,7 +70,7 @@ class BQPLManager:
 
         # Combine the binary representations
         binary_string = heart_rate_binary + temperature_binary
-        logging.info(f"Converted data to binary: {binary_string}")
+        logging.debug(f"Converted data to binary: {binary_string}")
         return binary_string
 
     def decrypt_data(self, encrypted_data):
@@ -59,7 +80,7 @@ class BQPLManager:
         :param encrypted_data: The encrypted data to decrypt.
         :return: The decrypted plaintext data.
         """
-        decrypted_data = self.edge_node.decrypt_data(encrypted_data)
+        decrypted_data = self.edge_node.decrypt_data(encrypted_data, READING_BITS)
         return decrypted_data
 
 # Example usage
@@ -67,8 +88,8 @@ if __name__ == "__main__":
     # Define encryption parameters
     encryption_params = {
         'p': 3,
-        'q': 32,
-        'N': 11
+        'q': 2048,
+        'N': 509
     }
 
     # Create a BQPL Manager instance
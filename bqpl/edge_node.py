@@ -19,7 +19,7 @@ class EdgeNode:
         """
         self.node_id = node_id
         self.encryption = QuantumResistantEncryption(**encryption_params)
-        self.biosensor = Biosensor()
+        self.biosensor = Biosensor(node_id)
         logging.basicConfig(level=logging.INFO)
 
     def collect_data(self):
@@ -42,14 +42,43 @@ class EdgeNode:
         logging.info(f"Edge Node {self.node_id}: Encrypted data: {ciphertext}")
         return ciphertext
 
-    def decrypt_data(self, ciphertext):
+    def process_batch(self, data):
+        """
+        Encrypt many binary strings in one call.
+
+        :param data: List of binary strings, each at most N bits.
+        :return: Ciphertexts, one row per input.
+        """
+        N = self.encryption.N
+        messages = np.zeros((len(data), N), dtype=np.int64)
+        for row, bits in enumerate(data):
+            if len(bits) > N:
+                raise ValueError(f"Data of {len(bits)} bits exceeds the ring degree {N}.")
+            messages[row, :len(bits)] = np.frombuffer(bits.encode('ascii'), dtype=np.uint8) - ord('0')
+        ciphertexts = self.encryption.encrypt_batch(messages)
+        logging.info(f"Edge Node {self.node_id}: Encrypted {len(data)} readings.")
+        return ciphertexts
+
+    def decrypt_batch(self, ciphertexts, length=None):
+        """
+        Decrypt many ciphertexts in one call.
+
+        :param ciphertexts: Ciphertexts, one row per message.
+        :param length: Number of bits to keep from each message (defaults to N).
+        :return: List of binary strings.
+        """
+        bits = self.encryption.decrypt_batch(ciphertexts)[:, :length] + ord('0')
+        return [row.tobytes().decode('ascii') for row in bits]
+
+    def decrypt_data(self, ciphertext, length=None):
         """
         Decrypt the ciphertext to retrieve the original data.
 
         :param ciphertext: The encrypted data to decrypt.
+        :param length: Number of plaintext bits to return (defaults to N).
         :return: The decrypted plaintext.
         """
-        decrypted_data = self.encryption.decrypt(ciphertext)
+        decrypted_data = self.encryption.decrypt(ciphertext, length)
         logging.info(f"Edge Node {self.node_id}: Decrypted data: {decrypted_data}")
         return decrypted_data
 
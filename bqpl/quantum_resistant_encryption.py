@@ -1,74 +1,261 @@
 # bqpl/quantum_resistant_encryption.py
 
 import numpy as np
-from hashlib import sha256
+
+LENGTH_BITS = 16  # Each streamed block starts with its payload byte count
+
+
+def cyclic_convolve(a, b, N):
+    """
+    Multiply polynomials in Z[x]/(x^N - 1), i.e. a cyclic convolution of length N.
+
+    Works on single polynomials or on rows of 2-D arrays (either argument may be a batch).
+    The product is computed with a length-N real FFT and rounded back to integers, which is
+    exact while coefficients stay far below 2^52.
+
+    :param a: Coefficients, shape (N,) or (batch, N).
+    :param b: Coefficients, shape (N,) or (batch, N).
+    :param N: Ring degree.
+    :return: Integer coefficients of the product, broadcast to the batch shape.
+    """
+    spectrum = np.fft.rfft(a, N, axis=-1) * np.fft.rfft(b, N, axis=-1)
+    return np.rint(np.fft.irfft(spectrum, N, axis=-1)).astype(np.int64)
+
+
+def _carryless_multiply(a, b):
+    """Multiply GF(2) polynomials held as Python ints (bit i is the coefficient of x^i)."""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        b >>= 1
+    return result
+
+
+def _poly_inverse_mod2(a, N):
+    """
+    Invert a polynomial in GF(2)[x]/(x^N - 1) with the extended Euclidean algorithm.
+
+    :return: The inverse as N coefficients, or None if it does not exist.
+    """
+    r0 = (1 << N) | 1  # x^N - 1 = x^N + 1 over GF(2)
+    r1 = int(''.join('1' if coefficient % 2 else '0' for coefficient in reversed(a)), 2)
+    s0, s1 = 0, 1
+    while r1:
+        quotient, remainder = 0, r0
+        while remainder.bit_length() >= r1.bit_length():
+            shift = remainder.bit_length() - r1.bit_length()
+            quotient ^= 1 << shift
+            remainder ^= r1 << shift
+        r0, r1 = r1, remainder
+        s0, s1 = s1, s0 ^ _carryless_multiply(quotient, s1)
+    if r0 != 1:
+        return None  # gcd is not a constant
+    mask = (1 << N) - 1
+    while s0 > mask:
+        s0 = (s0 & mask) ^ (s0 >> N)  # x^N = 1
+    return np.array([(s0 >> i) & 1 for i in range(N)], dtype=np.int64)
+
 
 class QuantumResistantEncryption:
     """
     Class to implement quantum-resistant encryption using a simplified version of NTRU.
+
+    Arithmetic is in the ring Z[x]/(x^N - 1). The private key is f = 1 + p*F with F ternary,
+    so f is invertible mod p with inverse 1 and decryption needs no second multiplication.
+    The public key is h = p * g * f^-1 mod q. Messages are N-bit polynomials.
     """
 
-    def __init__(self, p=3, q=32, N=11):
+    def __init__(self, p=3, q=2048, N=509, weight=None, seed=None):
         """
         Initialize the encryption parameters.
 
-        :param p: The polynomial degree for the encryption.
-        :param q: The modulus for the encryption.
-        :param N: The degree of the polynomial ring.
+        :param p: The small modulus for message coefficients.
+        :param q: The large modulus, a power of two (2048 for N = 509 or 677).
+        :param N: The degree of the polynomial ring, and the message size in bits.
+        :param weight: Number of +1 (and of -1) coefficients in F, g and r. Defaults to the
+                       largest weight for which decryption can never fail.
+        :param seed: Seed for the key and encryption randomness, for reproducible runs.
         """
+        if q & (q - 1):
+            raise ValueError("q must be a power of two.")
         self.p = p
         self.q = q
         self.N = N
+        # |p*r*g + f*m| <= 4*p*weight + 1 must stay below q/2 for the centred lift to recover it
+        max_weight = (q // 2 - 2) // (4 * p)
+        self.weight = min(N // 3, max_weight) if weight is None else weight
+        if self.weight < 1:
+            raise ValueError(f"q={q} is too small for p={p}: no weight guarantees correct decryption.")
+        self.rng = np.random.default_rng(seed)
         self.private_key = self.generate_private_key()
         self.public_key = self.generate_public_key()
+        self._public_spectrum = np.fft.rfft(self.public_key, N)
+        self._private_spectrum = np.fft.rfft(self.private_key, N)
+
+    def _ternary(self, count=None):
+        """Random ternary polynomial(s) with exactly `weight` coefficients of +1 and of -1."""
+        shape = (count, self.N) if count is not None else (self.N,)
+        base = np.zeros(self.N, dtype=np.int64)
+        base[:self.weight] = 1
+        base[self.weight:2 * self.weight] = -1
+        return self.rng.permuted(np.broadcast_to(base, shape).copy(), axis=-1)
 
     def generate_private_key(self):
         """
         Generate a private key.
 
-        :return: A randomly generated private key.
+        :return: The private key f = 1 + p*F, invertible mod q.
         """
-        return np.random.randint(-1, 2, self.N)  # Coefficients in {-1, 0, 1}
+        while True:
+            f = self.p * self._ternary()
+            f[0] += 1
+            inverse = _poly_inverse_mod2(f, self.N)
+            if inverse is None:
+                continue
+            # Newton iteration lifts the inverse mod 2 to mod 4, 16, 256, ... up to q = 2^k
+            modulus = 2
+            while modulus < self.q:
+                modulus = min(modulus * modulus, self.q)
+                correction = -cyclic_convolve(f, inverse, self.N)
+                correction[0] += 2
+                inverse = cyclic_convolve(inverse, correction % modulus, self.N) % modulus
+            self._private_inverse_q = inverse
+            return f
 
     def generate_public_key(self):
         """
         Generate a public key based on the private key.
 
-        :return: The public key.
+        :return: The public key h = p * g * f^-1 mod q.
+        """
+        g = self._ternary()
+        return self.p * cyclic_convolve(g, self._private_inverse_q, self.N) % self.q
+
+    def encrypt_batch(self, messages):
+        """
+        Encrypt many messages at once.
+
+        :param messages: Array of bits, shape (batch, N).
+        :return: Ciphertexts as uint16, shape (batch, N).
+        """
+        messages = np.asarray(messages, dtype=np.int64)
+        blinding = self._ternary(len(messages))
+        spectrum = np.fft.rfft(blinding, self.N, axis=-1) * self._public_spectrum
+        ciphertexts = np.rint(np.fft.irfft(spectrum, self.N, axis=-1)).astype(np.int64) + messages
+        return (ciphertexts % self.q).astype(np.uint16)
+
+    def decrypt_batch(self, ciphertexts):
         """
-        # For simplicity, we will use a random polynomial as the public key
-        return np.random.randint(0, self.q, self.N)
+        Decrypt many ciphertexts at once.
+
+        :param ciphertexts: Array of shape (batch, N).
+        :return: Message bits as uint8, shape (batch, N).
+        """
+        spectrum = np.fft.rfft(np.asarray(ciphertexts, dtype=np.float64), self.N, axis=-1) * self._private_spectrum
+        a = np.rint(np.fft.irfft(spectrum, self.N, axis=-1)).astype(np.int64) % self.q
+        a[a > self.q // 2] -= self.q  # Centred lift recovers p*r*g + f*m exactly
+        return (a % self.p).astype(np.uint8)
 
     def encrypt(self, plaintext):
         """
         Encrypt the plaintext using the public key.
 
-        :param plaintext: The plaintext to encrypt (binary string).
+        :param plaintext: The plaintext to encrypt (binary string of at most N bits).
         :return: The encrypted ciphertext.
         """
-        # Convert plaintext to polynomial representation
-        plaintext_poly = np.array([int(bit) for bit in plaintext], dtype=int)
-
-        # Generate a random polynomial for encryption
-        random_poly = np.random.randint(-1, 2, self.N)
+        if len(plaintext) > self.N:
+            raise ValueError(f"Plaintext of {len(plaintext)} bits exceeds the ring degree {self.N}.")
+        message = np.zeros((1, self.N), dtype=np.int64)
+        message[0, :len(plaintext)] = np.frombuffer(plaintext.encode('ascii'), dtype=np.uint8) - ord('0')
+        return self.encrypt_batch(message)[0]
 
-        # Encrypt the plaintext
-        ciphertext = (np.convolve(plaintext_poly, self.public_key) + random_poly) % self.q
-        return ciphertext
-
-    def decrypt(self, ciphertext):
+    def decrypt(self, ciphertext, length=None):
         """
         Decrypt the ciphertext using the private key.
 
         :param ciphertext: The ciphertext to decrypt.
-        :return: The decrypted plaintext.
+        :param length: Number of plaintext bits to return (defaults to N).
+        :return: The decrypted plaintext as a binary string.
+        """
+        bits = self.decrypt_batch(np.asarray(ciphertext)[None, :])[0]
+        return (bits[:length] + ord('0')).tobytes().decode('ascii')
+
+    @property
+    def block_bytes(self):
+        """Payload bytes carried by each block of the streaming API."""
+        return (self.N - LENGTH_BITS) // 8
+
+    def encrypt_stream(self, chunks, batch_size=256):
+        """
+        Encrypt a byte stream of any length, block by block.
+
+        Input chunks may have any size; they are cut into blocks of `block_bytes`, each prefixed
+        with its byte count, and encrypted `batch_size` blocks at a time.
+
+        :param chunks: Iterable of bytes-like objects.
+        :param batch_size: Blocks encrypted per NumPy call.
+        :return: Iterator of ciphertext arrays of shape (blocks, N).
+        """
+        block_bytes = self.block_bytes
+        if block_bytes < 1:
+            raise ValueError(f"N={self.N} is too small to stream: blocks need more than {LENGTH_BITS + 7} bits.")
+        pending = bytearray()
+        for chunk in chunks:
+            pending += chunk
+            while len(pending) >= block_bytes * batch_size:
+                yield self._encrypt_blocks(pending[:block_bytes * batch_size])
+                del pending[:block_bytes * batch_size]
+        if pending:
+            yield self._encrypt_blocks(pending)
+
+    def decrypt_stream(self, ciphertexts):
+        """
+        Decrypt ciphertext arrays produced by encrypt_stream.
+
+        :param ciphertexts: Iterable of arrays of shape (blocks, N).
+        :return: Iterator of plaintext bytes, one item per array.
+        """
+        block_bytes = self.block_bytes
+        for batch in ciphertexts:
+            bits = self.decrypt_batch(batch)
+            lengths = np.packbits(bits[:, :LENGTH_BITS], axis=1).view('>u2')[:, 0]
+            payload = np.packbits(bits[:, LENGTH_BITS:LENGTH_BITS + block_bytes * 8], axis=1)
+            if np.any(lengths > block_bytes):
+                raise ValueError("Corrupt block length in ciphertext stream.")
+            yield b''.join(row[:length].tobytes() for row, length in zip(payload, lengths))
+
+    def encrypt_bytes(self, payload, batch_size=256):
+        """
+        Encrypt a byte payload into one array of blocks.
+
+        :param payload: Bytes to encrypt.
+        :return: Ciphertext array of shape (blocks, N).
+        """
+        batches = list(self.encrypt_stream([payload], batch_size))
+        return np.concatenate(batches) if batches else np.zeros((0, self.N), dtype=np.uint16)
+
+    def decrypt_bytes(self, ciphertexts):
+        """
+        Decrypt an array produced by encrypt_bytes.
+
+        :param ciphertexts: Ciphertext array of shape (blocks, N).
+        :return: The original bytes.
         """
-        # Decrypt the ciphertext
-        decrypted_poly = (np.convolve(ciphertext, self.private_key) % self.q)
+        return b''.join(self.decrypt_stream([ciphertexts]))
 
-        # Convert polynomial back to binary string
-        decrypted_bits = ''.join(['1' if coeff > self.q // 2 else '0' for coeff in decrypted_poly])
-        return decrypted_bits
+    def _encrypt_blocks(self, data):
+        block_bytes = self.block_bytes
+        count = -(-len(data) // block_bytes)
+        padded = np.zeros((count, block_bytes), dtype=np.uint8)
+        padded.reshape(-1)[:len(data)] = np.frombuffer(bytes(data), dtype=np.uint8)
+        lengths = np.full(count, block_bytes, dtype='>u2')
+        lengths[-1] = len(data) - block_bytes * (count - 1)
+        messages = np.zeros((count, self.N), dtype=np.int64)
+        messages[:, :LENGTH_BITS] = np.unpackbits(lengths.view(np.uint8).reshape(count, 2), axis=1)
+        messages[:, LENGTH_BITS:LENGTH_BITS + block_bytes * 8] = np.unpackbits(padded, axis=1)
+        return self.encrypt_batch(messages)
 
 # Example usage
 if __name__ == "__main__":
@@ -83,5 +270,5 @@ if __name__ == "__main__":
     print(f"Ciphertext: {ciphertext}")
 
     # Decrypt the ciphertext
-    decrypted_plaintext = qre.decrypt(ciphertext)
+    decrypted_plaintext = qre.decrypt(ciphertext, len(plaintext))
     print(f"Decrypted Plaintext: {decrypted_plaintext}")
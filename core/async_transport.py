@@ -0,0 +1,315 @@
+# core/async_transport.py
+
+import asyncio
+import collections
+import json
+import logging
+import struct
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+# Configure logging for the node transport
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct('>IB')  # payload length, frame kind
+KIND_MESSAGE = 0  # One-way message, never answered
+KIND_REQUEST = 1  # Answered with exactly one KIND_RESPONSE frame, in order
+KIND_RESPONSE = 2
+KIND_ERROR = 3  # Answers a request whose handler failed, JSON {error}
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+class FrameError(Exception):
+    """Raised when a peer sends a malformed or oversized frame."""
+
+
+class RequestError(Exception):
+    """Raised by `FramedConnection.request` when the peer's handler failed on the request."""
+
+
+def encode_frame(message: Any, kind: int = KIND_MESSAGE) -> bytes:
+    """
+    Encode a JSON-serializable message as a length-prefixed frame.
+
+    :param message: The message to encode.
+    :param kind: One of KIND_MESSAGE, KIND_REQUEST, KIND_RESPONSE or KIND_ERROR.
+    :return: Header and payload bytes.
+    """
+    payload = json.dumps(message).encode('utf-8')
+    return FRAME_HEADER.pack(len(payload), kind) + payload
+
+
+def _decode_payload(kind: int, payload: bytes) -> Tuple[int, Any]:
+    if kind not in (KIND_MESSAGE, KIND_REQUEST, KIND_RESPONSE, KIND_ERROR):
+        raise FrameError(f"Unknown frame kind {kind}.")
+    try:
+        return kind, json.loads(payload.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise FrameError(f"Invalid frame payload: {e}") from e
+
+
+class FrameDecoder:
+    """
+    Incremental decoder for blocking sockets: feed it whatever `recv` returned and it
+    yields every complete frame, keeping partial frames buffered.
+    """
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+        self.buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Tuple[int, Any]]:
+        """
+        Add received bytes and return the complete frames now available.
+
+        :param data: Bytes read from the socket.
+        :return: List of (kind, message) tuples.
+        """
+        self.buffer += data
+        frames = []
+        offset = 0
+        while len(self.buffer) - offset >= FRAME_HEADER.size:
+            length, kind = FRAME_HEADER.unpack_from(self.buffer, offset)
+            if length > self.max_frame_size:
+                raise FrameError(f"Frame of {length} bytes exceeds limit of {self.max_frame_size}.")
+            end = offset + FRAME_HEADER.size + length
+            if end > len(self.buffer):
+                break
+            frames.append(_decode_payload(kind, bytes(self.buffer[offset + FRAME_HEADER.size:end])))
+            offset = end
+        del self.buffer[:offset]
+        return frames
+
+
+async def read_frame(reader: asyncio.StreamReader, max_frame_size: int = MAX_FRAME_SIZE) -> Tuple[int, Any]:
+    """
+    Read exactly one frame from an asyncio stream.
+
+    :raises asyncio.IncompleteReadError: If the peer closes the stream.
+    """
+    header = await reader.readexactly(FRAME_HEADER.size)
+    length, kind = FRAME_HEADER.unpack(header)
+    if length > max_frame_size:
+        raise FrameError(f"Frame of {length} bytes exceeds limit of {max_frame_size}.")
+    return _decode_payload(kind, await reader.readexactly(length))
+
+
+class FramedConnection:
+    """
+    One framed, bidirectional connection. Writes wait on `drain()` so a slow peer
+    applies backpressure to its senders instead of growing the write buffer.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 handler: Optional[Callable] = None, max_frame_size: int = MAX_FRAME_SIZE):
+        """
+        :param handler: Called as handler(message, connection) for incoming messages and
+                        requests; may be a coroutine function. Its return value answers requests.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.handler = handler
+        self.max_frame_size = max_frame_size
+        self.peer = writer.get_extra_info('peername')
+        self.pending: Deque[asyncio.Future] = collections.deque()
+        self.write_lock = asyncio.Lock()
+        self.closed = False
+
+    async def send(self, message: Any, kind: int = KIND_MESSAGE):
+        """
+        Write one frame and wait until the transport buffer drains below its high-water mark.
+
+        :param message: The message to send.
+        :param kind: Frame kind.
+        """
+        await self._write(encode_frame(message, kind))
+
+    async def request(self, message: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Send a request and wait for its response.
+
+        :param message: The request message.
+        :param timeout: Seconds to wait for the response.
+        :return: The response message.
+        :raises RequestError: If the peer's handler failed on the request.
+        """
+        frame = encode_frame(message, KIND_REQUEST)  # Fails before anything is queued
+        future = asyncio.get_running_loop().create_future()
+        # Register the future under the write lock so pending order matches the order on the wire
+        await self._write(frame, future)
+        return await asyncio.wait_for(future, timeout)
+
+    async def _write(self, frame: bytes, future: Optional[asyncio.Future] = None):
+        async with self.write_lock:
+            if future is not None:
+                self.pending.append(future)
+            self.writer.write(frame)
+            await self.writer.drain()
+
+    async def run(self):
+        """Read frames until the peer disconnects, dispatching each one."""
+        try:
+            while True:
+                kind, message = await read_frame(self.reader, self.max_frame_size)
+                if kind in (KIND_RESPONSE, KIND_ERROR):
+                    # Responses arrive in request order; a timed-out request just drops its answer
+                    if self.pending:
+                        future = self.pending.popleft()
+                        if future.done():
+                            pass
+                        elif kind == KIND_ERROR:
+                            future.set_exception(RequestError((message or {}).get('error', 'Request failed')))
+                        else:
+                            future.set_result(message)
+                    continue
+                try:
+                    response = await self._dispatch(message)
+                    frame = encode_frame(response, KIND_RESPONSE) if kind == KIND_REQUEST else None
+                except Exception as e:  # A failing handler must not take the connection down
+                    logger.error("Handler failed on a frame from %s: %s", self.peer, e)
+                    frame = encode_frame({'error': str(e)}, KIND_ERROR) if kind == KIND_REQUEST else None
+                if frame is not None:
+                    await self._write(frame)
+        except asyncio.IncompleteReadError:
+            logger.info("Peer %s disconnected.", self.peer)
+        except (FrameError, ConnectionError) as e:
+            logger.error("Closing connection to %s: %s", self.peer, e)
+        finally:
+            await self.close()
+
+    async def _dispatch(self, message: Any) -> Any:
+        if self.handler is None:
+            return None
+        result = self.handler(message, self)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    async def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for future in self.pending:
+            if not future.done():
+                future.set_exception(ConnectionError(f"Connection to {self.peer} closed."))
+        self.pending.clear()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class AsyncNodeTransport:
+    """
+    asyncio server plus a pool of persistent outbound connections, one per peer address.
+    """
+
+    def __init__(self, host: str = 'localhost', port: int = 5000, handler: Optional[Callable] = None,
+                 max_frame_size: int = MAX_FRAME_SIZE):
+        """
+        :param host: Address to listen on.
+        :param port: Port to listen on (0 picks a free port).
+        :param handler: handler(message, connection) for frames received on any connection.
+        :param max_frame_size: Largest accepted frame payload in bytes.
+        """
+        self.host = host
+        self.port = port
+        self.handler = handler
+        self.max_frame_size = max_frame_size
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.inbound: Set[FramedConnection] = set()
+        self.peers: Dict[Tuple[str, int], FramedConnection] = {}
+        self._connecting: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self):
+        """Start listening for inbound connections."""
+        self.server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logger.info("Async transport listening on %s:%d", self.host, self.port)
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = FramedConnection(reader, writer, self.handler, self.max_frame_size)
+        self.inbound.add(connection)
+        try:
+            await connection.run()
+        finally:
+            self.inbound.discard(connection)
+
+    async def connect(self, host: str, port: int) -> FramedConnection:
+        """
+        Return the open connection to a peer, dialing it only if none exists.
+
+        :param host: Peer host.
+        :param port: Peer port.
+        """
+        address = (host, port)
+        connection = self.peers.get(address)
+        if connection is not None and not connection.closed:
+            return connection
+        if address not in self._connecting:
+            self._connecting[address] = asyncio.ensure_future(self._dial(address))
+        try:
+            return await asyncio.shield(self._connecting[address])
+        finally:
+            task = self._connecting.get(address)
+            if task is not None and task.done():
+                del self._connecting[address]
+
+    async def _dial(self, address: Tuple[str, int]) -> FramedConnection:
+        reader, writer = await asyncio.open_connection(*address)
+        connection = FramedConnection(reader, writer, self.handler, self.max_frame_size)
+        self.peers[address] = connection
+        task = asyncio.ensure_future(connection.run())
+        self._tasks.add(task)
+        task.add_done_callback(lambda t: (self._tasks.discard(t), self._forget(address, connection)))
+        logger.info("Connected to node %s:%d", *address)
+        return connection
+
+    def _forget(self, address: Tuple[str, int], connection: FramedConnection):
+        if self.peers.get(address) is connection:
+            del self.peers[address]
+
+    async def send(self, host: str, port: int, message: Any):
+        """Send a one-way message over the persistent connection to a peer."""
+        connection = await self.connect(host, port)
+        await connection.send(message)
+
+    async def request(self, host: str, port: int, message: Any, timeout: Optional[float] = None) -> Any:
+        """Send a request to a peer and wait for its response."""
+        connection = await self.connect(host, port)
+        return await connection.request(message, timeout)
+
+    async def broadcast(self, message: Any) -> int:
+        """
+        Send a message to every connected peer concurrently.
+
+        :return: Number of peers the message was written to.
+        """
+        connections = [c for c in self.peers.values() if not c.closed]
+        results = await asyncio.gather(*(c.send(message) for c in connections), return_exceptions=True)
+        delivered = 0
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error("Broadcast to %s failed: %s", connection.peer, result)
+                await connection.close()
+            else:
+                delivered += 1
+        return delivered
+
+    async def close_peers(self):
+        """Close all outbound connections."""
+        await asyncio.gather(*(c.close() for c in list(self.peers.values())))
+        self.peers.clear()
+
+    async def close(self):
+        """Stop the server and close every connection."""
+        server, self.server = self.server, None
+        if server is not None:
+            server.close()
+        await self.close_peers()
+        await asyncio.gather(*(c.close() for c in list(self.inbound)))
+        self.inbound.clear()
+        if server is not None:
+            await server.wait_closed()
@@ -0,0 +1,242 @@
+import logging
+import mmap
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+from core.blockchain import Block
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+RECORD_MAGIC = b'BLK1'
+RECORD_HEADER = struct.Struct('>4sII')  # magic, payload length, crc32
+INDEX_ENTRY = struct.Struct('>IQI32s')  # segment number, record offset, payload length, block hash
+INDEX_FILE = 'index.dat'
+SEGMENT_PATTERN = 'segment_{:06d}.dat'
+
+
+class BlockStore:
+    """Append-only, segment-file block storage with height and hash indexes.
+
+    Blocks are written as CRC-checked records (`Block.to_bytes`) into fixed-size segment
+    files, and each append adds a fixed-width entry to `index.dat`. Opening a store only
+    reads the index; records written after the last index entry are re-indexed, and a torn
+    record at the tail is truncated. Segments are read through mmap and fsyncs are batched
+    every `sync_interval` appends (or on `flush`/`close`).
+
+    The store behaves like a read-only list of blocks with `append`, so it can stand in
+    for `Blockchain.chain`.
+    """
+
+    def __init__(self, path: str, segment_size: int = 64 * 1024 * 1024, sync_interval: int = 64,
+                 cache_size: int = 256):
+        self.path = path
+        self.segment_size = segment_size
+        self.sync_interval = sync_interval
+        self.cache_size = cache_size
+        os.makedirs(path, exist_ok=True)
+
+        self._locations: List[Tuple[int, int, int]] = []  # height -> (segment, offset, length)
+        self._heights: Dict[bytes, int] = {}  # block hash -> height
+        self._maps: Dict[int, Tuple[mmap.mmap, int]] = {}
+        self._cache: "OrderedDict[int, Block]" = OrderedDict()
+        self._unsynced = 0
+
+        self._load_index()
+        self._recover_tail()
+        self._open_active_segment()
+        logging.info(f"Block store opened at {path} with {len(self)} blocks.")
+
+    # Sequence interface
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._read_block(height) for height in range(*item.indices(len(self)))]
+        height = item + len(self) if item < 0 else item
+        if not 0 <= height < len(self):
+            raise IndexError("Block height out of range.")
+        return self._read_block(height)
+
+    def __iter__(self) -> Iterator[Block]:
+        for height in range(len(self)):
+            yield self._read_block(height)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    # Lookups
+
+    def height_of(self, block_hash: str) -> Optional[int]:
+        return self._heights.get(bytes.fromhex(block_hash))
+
+    def get_by_hash(self, block_hash: str) -> Optional[Block]:
+        height = self.height_of(block_hash)
+        return None if height is None else self._read_block(height)
+
+    # Writes
+
+    def append(self, block: Block):
+        payload = block.to_bytes()
+        if self._active_size > 0 and self._active_size + RECORD_HEADER.size + len(payload) > self.segment_size:
+            self._roll_segment()
+
+        offset = self._active_size
+        self._segment_file.write(RECORD_HEADER.pack(RECORD_MAGIC, len(payload), zlib.crc32(payload)))
+        self._segment_file.write(payload)
+        self._segment_file.flush()  # Visible to mmap readers; durability comes from the batched fsync
+        self._active_size += RECORD_HEADER.size + len(payload)
+
+        block_hash = bytes.fromhex(block.hash)
+        self._index_file.write(INDEX_ENTRY.pack(self._active_segment, offset, len(payload), block_hash))
+        self._index_file.flush()
+        self._heights[block_hash] = len(self._locations)
+        self._locations.append((self._active_segment, offset, len(payload)))
+        self._remember(len(self._locations) - 1, block)
+
+        self._unsynced += 1
+        if self._unsynced >= self.sync_interval:
+            self.flush()
+
+    def flush(self):
+        """fsync pending records; segments are synced before the index that points into them."""
+        if self._unsynced == 0:
+            return
+        os.fsync(self._segment_file.fileno())
+        os.fsync(self._index_file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        self.flush()
+        self._segment_file.close()
+        self._index_file.close()
+        for segment_map, _ in self._maps.values():
+            segment_map.close()
+        self._maps.clear()
+        logging.info(f"Block store at {self.path} closed.")
+
+    # Internals
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.path, SEGMENT_PATTERN.format(segment))
+
+    def _segments(self) -> List[int]:
+        prefix, suffix = SEGMENT_PATTERN.split('{')[0], '.dat'
+        return sorted(int(name[len(prefix):-len(suffix)]) for name in os.listdir(self.path)
+                      if name.startswith(prefix) and name.endswith(suffix))
+
+    def _load_index(self):
+        index_path = os.path.join(self.path, INDEX_FILE)
+        data = b''
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as file:
+                data = file.read()
+        count = len(data) // INDEX_ENTRY.size
+        segment_sizes = {segment: os.path.getsize(self._segment_path(segment)) for segment in self._segments()}
+
+        for position in range(count):
+            segment, offset, length, block_hash = INDEX_ENTRY.unpack_from(data, position * INDEX_ENTRY.size)
+            if offset + RECORD_HEADER.size + length > segment_sizes.get(segment, -1):
+                logging.warning(f"Index entry {position} points past the end of segment {segment}; truncating index.")
+                count = position
+                break
+            self._heights[block_hash] = position
+            self._locations.append((segment, offset, length))
+
+        with open(index_path, 'ab') as file:
+            file.truncate(count * INDEX_ENTRY.size)
+
+    def _recover_tail(self):
+        """Index records written after the last index entry and cut off any torn record."""
+        segments = self._segments()
+        if self._locations:
+            segment, offset, length = self._locations[-1]
+            position = offset + RECORD_HEADER.size + length
+        elif segments:
+            segment, position = segments[0], 0
+        else:
+            return
+
+        recovered = []
+        for current in [s for s in segments if s >= segment]:
+            if current != segment:
+                position = 0
+            # Read only what follows the last indexed record, not the whole segment
+            with open(self._segment_path(current), 'rb') as file:
+                size = os.fstat(file.fileno()).st_size
+                file.seek(position)
+                while position + RECORD_HEADER.size <= size:
+                    magic, length, checksum = RECORD_HEADER.unpack(file.read(RECORD_HEADER.size))
+                    if magic != RECORD_MAGIC or position + RECORD_HEADER.size + length > size:
+                        break
+                    payload = file.read(length)
+                    if zlib.crc32(payload) != checksum:
+                        break
+                    block_hash = bytes.fromhex(Block.decode_header(payload)['hash'])
+                    recovered.append((current, position, length, block_hash))
+                    position += RECORD_HEADER.size + length
+            if position < size:
+                logging.warning(f"Truncating torn tail of segment {current} at offset {position}.")
+                with open(self._segment_path(current), 'r+b') as file:
+                    file.truncate(position)
+                for later in [s for s in segments if s > current]:
+                    os.remove(self._segment_path(later))
+                break
+
+        if recovered:
+            with open(os.path.join(self.path, INDEX_FILE), 'ab') as file:
+                for current, offset, length, block_hash in recovered:
+                    file.write(INDEX_ENTRY.pack(current, offset, length, block_hash))
+                    self._heights[block_hash] = len(self._locations)
+                    self._locations.append((current, offset, length))
+                file.flush()
+                os.fsync(file.fileno())
+            logging.info(f"Recovered {len(recovered)} unindexed block(s).")
+
+    def _open_active_segment(self):
+        segments = self._segments()
+        self._active_segment = segments[-1] if segments else 0
+        self._segment_file = open(self._segment_path(self._active_segment), 'ab')
+        self._active_size = self._segment_file.tell()
+        self._index_file = open(os.path.join(self.path, INDEX_FILE), 'ab')
+
+    def _roll_segment(self):
+        self.flush()
+        self._segment_file.close()
+        self._active_segment += 1
+        self._segment_file = open(self._segment_path(self._active_segment), 'ab')
+        self._active_size = 0
+
+    def _segment_view(self, segment: int, end: int) -> mmap.mmap:
+        mapped = self._maps.get(segment)
+        if mapped is None or mapped[1] < end:
+            if mapped is not None:
+                mapped[0].close()
+            with open(self._segment_path(segment), 'rb') as file:
+                size = os.fstat(file.fileno()).st_size
+                segment_map = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+            mapped = (segment_map, size)
+            self._maps[segment] = mapped
+        return mapped[0]
+
+    def _read_block(self, height: int) -> Block:
+        block = self._cache.get(height)
+        if block is not None:
+            self._cache.move_to_end(height)
+            return block
+        segment, offset, length = self._locations[height]
+        start = offset + RECORD_HEADER.size
+        view = self._segment_view(segment, start + length)
+        block = Block.from_bytes(view[start:start + length])
+        self._remember(height, block)
+        return block
+
+    def _remember(self, height: int, block: Block):
+        self._cache[height] = block
+        self._cache.move_to_end(height)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
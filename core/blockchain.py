@@ -2,86 +2,264 @@ import hashlib
 import time
 import json
 import logging
+import struct
 from typing import List, Dict, Any
-from ecdsa import SigningKey, VerifyingKey, SECP256k1
+from ecdsa import SigningKey, SECP256k1
+from core.config import Config
+from core.encoding import encode_value, decode_value, encode_length_prefixed, decode_length_prefixed
+from core.mempool import Mempool
+from core.merkle import MerkleTree, MerkleProof
+from core.mining_engine import MiningEngine, difficulty_target, meets_target
+from core.signature_verification import get_default_verifier
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+_HEADER = struct.Struct('>QdQ')  # index, timestamp, nonce
+
+
 class Block:
-    def __init__(self, index: int, previous_hash: str, timestamp: float, transactions: List[Dict[str, Any]], nonce: int = 0):
+    """A block whose hash commits to a fixed-layout header.
+
+    The header holds the index, timestamp, nonce, previous hash and the Merkle root of
+    the transactions. The Merkle tree and the header digest are memoized and dropped when
+    the corresponding attribute is reassigned, so re-hashing a header after a nonce change
+    does not touch the transactions. Transactions are stored as a tuple; replace
+    `block.transactions` rather than mutating it in place.
+    """
+
+    __slots__ = ('index', 'previous_hash', 'timestamp', 'transactions', 'nonce', 'hash',
+                 '_merkle_tree', '_header_hash')
+
+    _HEADER_FIELDS = frozenset(('index', 'previous_hash', 'timestamp', 'nonce'))
+
+    def __init__(self, index: int, previous_hash: str, timestamp: float, transactions: List[Dict[str, Any]], nonce: int = 0,
+                 merkle_tree: MerkleTree = None):
         self.index = index
         self.previous_hash = previous_hash
         self.timestamp = timestamp
         self.transactions = transactions
         self.nonce = nonce
+        if merkle_tree is not None and len(merkle_tree) == len(self.transactions):
+            object.__setattr__(self, '_merkle_tree', merkle_tree)  # Reuse a tree built while collecting transactions
         self.hash = self.calculate_hash()
 
+    def __setattr__(self, name: str, value: Any):
+        if name == 'transactions':
+            value = tuple(value)
+            object.__setattr__(self, '_merkle_tree', None)
+            object.__setattr__(self, '_header_hash', None)
+        elif name in self._HEADER_FIELDS:
+            object.__setattr__(self, '_header_hash', None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def merkle_tree(self) -> MerkleTree:
+        if self._merkle_tree is None:
+            object.__setattr__(self, '_merkle_tree', MerkleTree(self.transactions))
+        return self._merkle_tree
+
+    def merkle_root(self) -> bytes:
+        return self.merkle_tree.root()
+
+    def merkle_proof(self, transaction_index: int) -> MerkleProof:
+        """Inclusion proof for one transaction, checkable with `core.merkle.verify_proof`."""
+        return self.merkle_tree.proof(transaction_index)
+
+    def encode_header(self) -> bytes:
+        return (_HEADER.pack(self.index, self.timestamp, self.nonce)
+                + encode_length_prefixed(self.previous_hash.encode())
+                + self.merkle_root())
+
+    @staticmethod
+    def decode_header(data: bytes) -> Dict[str, Any]:
+        """Decode the header fields a light client needs, without the transaction body."""
+        index, timestamp, nonce = _HEADER.unpack_from(data, 0)
+        raw_previous_hash, offset = decode_length_prefixed(data, _HEADER.size)
+        return {
+            'index': index,
+            'previous_hash': raw_previous_hash.decode(),
+            'timestamp': timestamp,
+            'nonce': nonce,
+            'merkle_root': bytes(data[offset:offset + 32]),
+            'hash': hashlib.sha256(bytes(data[:offset + 32])).hexdigest(),
+            'header_size': offset + 32
+        }
+
+    def encode_body(self) -> bytes:
+        return encode_value(self.transactions)
+
     def calculate_hash(self) -> str:
-        block_string = json.dumps(self.__dict__, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        if self._header_hash is None:
+            object.__setattr__(self, '_header_hash', hashlib.sha256(self.encode_header()).hexdigest())
+        return self._header_hash
+
+    def to_bytes(self) -> bytes:
+        """Encode the block as its header followed by the transaction body."""
+        return self.encode_header() + self.encode_body()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Block':
+        """Decode a block produced by `to_bytes`, checking the body against the header."""
+        header = cls.decode_header(data)
+        transactions, end = decode_value(data, header['header_size'])
+        if end != len(data):
+            raise ValueError("Trailing bytes after block body.")
+        block = cls(header['index'], header['previous_hash'], header['timestamp'], transactions, header['nonce'])
+        if block.merkle_root() != header['merkle_root']:
+            raise ValueError(f"Merkle root mismatch for block {header['index']}.")
+        return block
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'index': self.index,
+            'previous_hash': self.previous_hash,
+            'timestamp': self.timestamp,
+            'transactions': list(self.transactions),
+            'nonce': self.nonce,
+            'hash': self.hash
+        }
 
     def serialize(self) -> str:
-        return json.dumps(self.__dict__, sort_keys=True)
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    def __repr__(self) -> str:
+        return f"Block(index={self.index}, hash={self.hash})"
 
 class Blockchain:
-    def __init__(self, difficulty: int = 4, block_time: int = 10):
-        self.chain: List[Block] = []
-        self.current_transactions: List[Dict[str, Any]] = []
+    def __init__(self, difficulty: int = 4, block_time: int = 10, mining_workers: int = None,
+                 max_block_transactions: int = Config.BLOCK_MAX_TRANSACTIONS,
+                 max_block_bytes: int = Config.BLOCK_MAX_BYTES, mempool: Mempool = None, block_store=None):
+        # A core.block_store.BlockStore can back the chain; reopening it only reads its index
+        self.chain: List[Block] = block_store if block_store is not None else []
+        self._hash_index: Dict[str, int] = {}  # Hash lookups for an in-memory chain
+        self.mempool = mempool if mempool is not None else Mempool()  # Pending transactions
         self.difficulty = difficulty
         self.block_time = block_time
-        self.create_block(previous_hash='1')  # Genesis block
+        self.max_block_transactions = max_block_transactions
+        self.max_block_bytes = max_block_bytes
+        self.mining_engine = MiningEngine(workers=mining_workers)
+        self.verifier = get_default_verifier()  # Shared key cache and worker pool
+        if not self.chain:
+            self.create_block(previous_hash='1')  # Genesis block
+
+    @property
+    def current_transactions(self) -> List[Dict[str, Any]]:
+        """Pending transactions in arrival order."""
+        return list(self.mempool)
 
     def create_block(self, nonce: int = 0, previous_hash: str = None) -> Block:
+        transactions, merkle_tree = self.mempool.pop_block(self.max_block_transactions, self.max_block_bytes)
         block = Block(
             index=len(self.chain) + 1,
             previous_hash=previous_hash or self.chain[-1].hash,
             timestamp=time.time(),
-            transactions=self.current_transactions,
-            nonce=nonce
+            transactions=transactions,
+            nonce=nonce,
+            merkle_tree=merkle_tree
         )
-        self.current_transactions = []  # Reset the current transactions
         self.chain.append(block)
+        if isinstance(self.chain, list):
+            self._hash_index[block.hash] = len(self.chain) - 1
         logging.info(f"Block {block.index} created with hash: {block.hash}")
         return block
 
-    def add_transaction(self, sender: str, recipient: str, amount: float, signature: str) -> int:
-        if not self.verify_signature(sender, signature):
+    def get_block_by_hash(self, block_hash: str) -> Block:
+        """Look up a block by hash through the store's index or the in-memory one."""
+        if isinstance(self.chain, list):
+            height = self._hash_index.get(block_hash)
+            return None if height is None else self.chain[height]
+        return self.chain.get_by_hash(block_hash)
+
+    def persist(self):
+        """Flush pending block writes when the chain is backed by a block store."""
+        if hasattr(self.chain, 'flush'):
+            self.chain.flush()
+
+    def add_transaction(self, sender: str, recipient: str, amount: float, signature: str,
+                        fee: float = None, nonce: int = None) -> int:
+        transaction = self.build_transaction(sender, recipient, amount, signature, fee, nonce)
+        if not self.verify_signature(sender, signature, self.transaction_payload(**self._unsigned(transaction))):
             logging.error("Invalid transaction signature.")
             return -1  # Invalid transaction
 
+        return self._append_transaction(transaction)
+
+    def add_transactions(self, transactions: List[Dict[str, Any]]) -> List[int]:
+        """Verify a batch of transaction dicts in one call and add the valid ones.
+
+        Returns the target block index for each accepted transaction and -1 for rejected ones.
+        """
+        transactions = [
+            self.build_transaction(tx['sender'], tx['recipient'], tx['amount'], tx['signature'], tx.get('fee'), tx.get('nonce'))
+            for tx in transactions
+        ]
+        items = [
+            (self.transaction_payload(**self._unsigned(tx)), tx['signature'], tx['sender'])
+            for tx in transactions
+        ]
+        results = []
+        for tx, valid in zip(transactions, self.verifier.verify_batch(items)):
+            if valid:
+                results.append(self._append_transaction(tx))
+            else:
+                logging.error(f"Invalid transaction signature from {tx['sender']}.")
+                results.append(-1)
+        return results
+
+    def _append_transaction(self, transaction: Dict[str, Any]) -> int:
+        if not self.mempool.add(transaction):
+            return -1  # Duplicate, underpriced or evicted
+        logging.info(f"Transaction added: {transaction}")
+        return self.last_block.index + 1  # Return the index of the block that will hold this transaction
+
+    @staticmethod
+    def build_transaction(sender: str, recipient: str, amount: float, signature: str,
+                          fee: float = None, nonce: int = None) -> Dict[str, Any]:
         transaction = {
             'sender': sender,
             'recipient': recipient,
             'amount': amount,
             'signature': signature
         }
-        self.current_transactions.append(transaction)
-        logging.info(f"Transaction added: {transaction}")
-        return self.last_block.index + 1  # Return the index of the block that will hold this transaction
+        if fee is not None:
+            transaction['fee'] = fee
+        if nonce is not None:
+            transaction['nonce'] = nonce
+        return transaction
+
+    @staticmethod
+    def _unsigned(transaction: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in transaction.items() if key != 'signature'}
+
+    @staticmethod
+    def transaction_payload(sender: str, recipient: str, amount: float, fee: float = None, nonce: int = None) -> bytes:
+        """The bytes a sender signs: the unsigned transaction as sorted-key JSON.
+
+        `fee` and `nonce` are only part of the payload when the transaction carries them.
+        """
+        unsigned = {'sender': sender, 'recipient': recipient, 'amount': amount}
+        if fee is not None:
+            unsigned['fee'] = fee
+        if nonce is not None:
+            unsigned['nonce'] = nonce
+        return json.dumps(unsigned, sort_keys=True).encode()
 
     @property
     def last_block(self) -> Block:
         return self.chain[-1]
 
     def proof_of_work(self, previous_nonce: int) -> int:
-        nonce = 0
-        while not self.valid_proof(previous_nonce, nonce):
-            nonce += 1
-        return nonce
+        result = self.mining_engine.search(prefix=str(previous_nonce), difficulty=self.difficulty)
+        return result.nonce
 
     def valid_proof(self, previous_nonce: int, nonce: int) -> bool:
         guess = f"{previous_nonce}{nonce}".encode()
-        guess_hash = hashlib.sha256(guess).hexdigest()
-        return guess_hash[:self.difficulty] == "0" * self.difficulty  # Adjusted difficulty
-
-    def verify_signature(self, sender: str, signature: str) -> bool:
-        try:
-            verifying_key = VerifyingKey.from_string(bytes.fromhex(sender), curve=SECP256k1)
-            return verifying_key.verify(bytes.fromhex(signature), self.serialize())
-        except Exception as e:
-            logging.error(f"Signature verification failed: {e}")
-            return False
+        guess_hash = hashlib.sha256(guess).digest()
+        return meets_target(guess_hash, difficulty_target(self.difficulty))  # Adjusted difficulty
+
+    def verify_signature(self, sender: str, signature: str, message: bytes) -> bool:
+        return self.verifier.verify(message, signature, sender)
 
     def generate_keypair(self):
         private_key = SigningKey.generate(curve=SECP256k1)
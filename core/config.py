@@ -21,6 +21,12 @@ class Config:
     MAX_TRANSACTION_AMOUNT = float(os.getenv('MAX_TRANSACTION_AMOUNT', 1e6))  # Maximum transaction amount
     MIN_TRANSACTION_AMOUNT = float(os.getenv('MIN_TRANSACTION_AMOUNT', 0.01))  # Minimum transaction amount
 
+    # Mempool and block size settings
+    MEMPOOL_MAX_TRANSACTIONS = int(os.getenv('MEMPOOL_MAX_TRANSACTIONS', 100000))  # Pending transactions kept before eviction
+    MEMPOOL_MAX_BYTES = int(os.getenv('MEMPOOL_MAX_BYTES', 64 * 1024 * 1024))  # Encoded bytes kept before eviction
+    BLOCK_MAX_TRANSACTIONS = int(os.getenv('BLOCK_MAX_TRANSACTIONS', 5000))  # Maximum transactions per block
+    BLOCK_MAX_BYTES = int(os.getenv('BLOCK_MAX_BYTES', 1024 * 1024))  # Maximum encoded transaction bytes per block
+
     # Smart contract settings
     ENABLE_SMART_CONTRACTS = bool(int(os.getenv('ENABLE_SMART_CONTRACTS', 1)))  # Enable or disable smart contracts
 
@@ -38,6 +44,8 @@ class Config:
         print(f"Consensus Retry Limit: {cls.CONSENSUS_RETRY_LIMIT}")
         print(f"Max Transaction Amount: {cls.MAX_TRANSACTION_AMOUNT}")
         print(f"Min Transaction Amount: {cls.MIN_TRANSACTION_AMOUNT}")
+        print(f"Mempool Limits: {cls.MEMPOOL_MAX_TRANSACTIONS} transactions / {cls.MEMPOOL_MAX_BYTES} bytes")
+        print(f"Block Limits: {cls.BLOCK_MAX_TRANSACTIONS} transactions / {cls.BLOCK_MAX_BYTES} bytes")
         print(f"Smart Contracts Enabled: {cls.ENABLE_SMART_CONTRACTS}")
 
 if __name__ == "__main__":
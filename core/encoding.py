@@ -0,0 +1,129 @@
+# core/encoding.py
+
+"""
+Canonical, length-prefixed binary encoding for blocks and transactions.
+
+Every value is written as a one-byte type tag followed by its payload. Variable-size
+payloads carry a 4-byte big-endian length (or item count) prefix and dictionaries are
+written with their keys sorted, so equal values always encode to identical bytes.
+"""
+import struct
+from typing import Any, Tuple
+
+TAG_NONE = 0x00
+TAG_FALSE = 0x01
+TAG_TRUE = 0x02
+TAG_INT = 0x03
+TAG_FLOAT = 0x04
+TAG_STR = 0x05
+TAG_BYTES = 0x06
+TAG_LIST = 0x07
+TAG_DICT = 0x08
+
+_TAG_NONE, _TAG_FALSE, _TAG_TRUE, _TAG_INT, _TAG_FLOAT, _TAG_STR, _TAG_BYTES, _TAG_LIST, _TAG_DICT = (
+    bytes((tag,)) for tag in (TAG_NONE, TAG_FALSE, TAG_TRUE, TAG_INT, TAG_FLOAT, TAG_STR, TAG_BYTES, TAG_LIST, TAG_DICT)
+)
+
+_LENGTH = struct.Struct('>I')
+_FLOAT = struct.Struct('>d')
+
+
+def encode_length_prefixed(data: bytes) -> bytes:
+    """Prefix raw bytes with their 4-byte big-endian length."""
+    return _LENGTH.pack(len(data)) + data
+
+
+def decode_length_prefixed(buffer: bytes, offset: int = 0) -> Tuple[bytes, int]:
+    """Read a length-prefixed byte string, returning it and the offset after it."""
+    (length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    end = offset + length
+    if end > len(buffer):
+        raise ValueError("Truncated length-prefixed field.")
+    return bytes(buffer[offset:end]), end
+
+
+def _encode_into(value: Any, out: list):
+    if value is None:
+        out.append(_TAG_NONE)
+    elif value is True:
+        out.append(_TAG_TRUE)
+    elif value is False:
+        out.append(_TAG_FALSE)
+    elif isinstance(value, int):
+        out.append(_TAG_INT)
+        out.append(encode_length_prefixed(value.to_bytes((value.bit_length() + 8) // 8, 'big', signed=True)))
+    elif isinstance(value, float):
+        out.append(_TAG_FLOAT)
+        out.append(_FLOAT.pack(value))
+    elif isinstance(value, str):
+        out.append(_TAG_STR)
+        out.append(encode_length_prefixed(value.encode('utf-8')))
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        out.append(_TAG_BYTES)
+        out.append(encode_length_prefixed(bytes(value)))
+    elif isinstance(value, (list, tuple)):
+        out.append(_TAG_LIST)
+        out.append(_LENGTH.pack(len(value)))
+        for item in value:
+            _encode_into(item, out)
+    elif isinstance(value, dict):
+        out.append(_TAG_DICT)
+        out.append(_LENGTH.pack(len(value)))
+        for key in sorted(value):
+            if not isinstance(key, str):
+                raise TypeError(f"Dictionary keys must be strings, got {type(key).__name__}.")
+            out.append(encode_length_prefixed(key.encode('utf-8')))
+            _encode_into(value[key], out)
+    else:
+        raise TypeError(f"Cannot canonically encode value of type {type(value).__name__}.")
+
+
+def encode_value(value: Any) -> bytes:
+    """Encode a JSON-like value (None, bool, int, float, str, bytes, list, dict) canonically."""
+    out = []
+    _encode_into(value, out)
+    return b''.join(out)
+
+
+def decode_value(buffer: bytes, offset: int = 0) -> Tuple[Any, int]:
+    """Decode one value starting at `offset`, returning it and the offset after it."""
+    if offset >= len(buffer):
+        raise ValueError("Unexpected end of buffer.")
+    tag = buffer[offset]
+    offset += 1
+    if tag == TAG_NONE:
+        return None, offset
+    if tag == TAG_FALSE:
+        return False, offset
+    if tag == TAG_TRUE:
+        return True, offset
+    if tag == TAG_INT:
+        raw, offset = decode_length_prefixed(buffer, offset)
+        return int.from_bytes(raw, 'big', signed=True), offset
+    if tag == TAG_FLOAT:
+        (value,) = _FLOAT.unpack_from(buffer, offset)
+        return value, offset + _FLOAT.size
+    if tag == TAG_STR:
+        raw, offset = decode_length_prefixed(buffer, offset)
+        return raw.decode('utf-8'), offset
+    if tag == TAG_BYTES:
+        return decode_length_prefixed(buffer, offset)
+    if tag == TAG_LIST:
+        (count,) = _LENGTH.unpack_from(buffer, offset)
+        offset += _LENGTH.size
+        items = []
+        for _ in range(count):
+            item, offset = decode_value(buffer, offset)
+            items.append(item)
+        return items, offset
+    if tag == TAG_DICT:
+        (count,) = _LENGTH.unpack_from(buffer, offset)
+        offset += _LENGTH.size
+        result = {}
+        for _ in range(count):
+            raw_key, offset = decode_length_prefixed(buffer, offset)
+            value, offset = decode_value(buffer, offset)
+            result[raw_key.decode('utf-8')] = value
+        return result, offset
+    raise ValueError(f"Unknown type tag: {tag:#04x}")
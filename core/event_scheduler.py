@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+DEFAULT_TICK = 0.05  # Timer resolution in seconds
+DEFAULT_WHEEL_SLOTS = 512
+
+
+class PeriodicTimer:
+    __slots__ = ('event', 'interval', 'ticks', 'rounds', 'due', 'cancelled')
+
+    def __init__(self, event: str, interval: float, ticks: int):
+        self.event = event
+        self.interval = interval
+        self.ticks = ticks
+        self.rounds = 0
+        self.due = 0.0
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Hashed timing wheel: O(1) insertion, and each tick only touches one slot."""
+
+    def __init__(self, tick: float = DEFAULT_TICK, slots: int = DEFAULT_WHEEL_SLOTS):
+        self.tick = tick
+        self.slots: List[List[PeriodicTimer]] = [[] for _ in range(slots)]
+        self.position = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, timer: PeriodicTimer, now: float):
+        ticks = max(1, timer.ticks)
+        timer.rounds = (ticks - 1) // len(self.slots)
+        timer.due = now + ticks * self.tick
+        self.slots[(self.position + ticks) % len(self.slots)].append(timer)
+        self.count += 1
+
+    def advance(self) -> List[PeriodicTimer]:
+        """Move one tick forward and return the timers that expire on it."""
+        self.position = (self.position + 1) % len(self.slots)
+        slot = self.slots[self.position]
+        expired, waiting = [], []
+        for timer in slot:
+            if timer.cancelled:
+                self.count -= 1
+            elif timer.rounds == 0:
+                expired.append(timer)
+                self.count -= 1
+            else:
+                timer.rounds -= 1
+                waiting.append(timer)
+        self.slots[self.position] = waiting
+        return expired
+
+
+class EventScheduler:
+    """Event-driven dispatcher for zone activity.
+
+    Handlers run only when their event is signalled, either by `signal` (safe to call from
+    any thread, e.g. for arriving packets and transactions) or by a periodic timer on the
+    timer wheel. The loop sleeps while there is nothing to do. Metrics record how late
+    events are dispatched (queue wait and timer lag) and the time spent in each handler.
+    """
+
+    def __init__(self, tick: float = DEFAULT_TICK, wheel_slots: int = DEFAULT_WHEEL_SLOTS):
+        self.handlers: Dict[str, Callable] = {}
+        self.wheel = TimerWheel(tick, wheel_slots)
+        self.timers: Dict[str, PeriodicTimer] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queue: Optional[asyncio.Queue] = None
+        self._pending: List[Tuple[str, tuple, float]] = []  # Signals raised before the loop started
+        self._lock = threading.Lock()
+        self._timers_changed: Optional[asyncio.Event] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._stop_requested = False  # stop() called before the first loop started
+        self._has_run = False
+        self._reset_metrics()
+
+    def _reset_metrics(self):
+        self.dispatched = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.timer_lag_total = 0.0
+        self.timer_lag_max = 0.0
+        self.timer_fires = 0
+        self.handler_stats: Dict[str, Dict[str, float]] = defaultdict(lambda: {'calls': 0, 'total': 0.0, 'max': 0.0, 'errors': 0})
+
+    @property
+    def running(self) -> bool:
+        return self.loop is not None
+
+    def add_handler(self, event: str, handler: Callable, interval: Optional[float] = None):
+        """Register a handler, optionally firing it every `interval` seconds."""
+        self.handlers[event] = handler
+        if interval is not None:
+            self._call(self._add_timer, event, interval)
+
+    def remove_handler(self, event: str):
+        self.handlers.pop(event, None)
+        timer = self.timers.pop(event, None)
+        if timer is not None:
+            timer.cancelled = True
+
+    def signal(self, event: str, *args: Any):
+        """Request dispatch of `event`'s handler with `args`. Thread-safe."""
+        item = (event, args, time.perf_counter())
+        with self._lock:
+            if self.loop is None:
+                self._pending.append(item)
+                return
+            loop, queue = self.loop, self.queue
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    def stop(self):
+        """Ask the loop to finish. Thread-safe.
+
+        If no loop has started yet, the first `run` returns as soon as it is called. Once a
+        loop has finished, stopping the idle scheduler does nothing, so it can be run again.
+        """
+        with self._lock:
+            loop = self.loop
+            if loop is None and not self._has_run:
+                self._stop_requested = True
+        if loop is not None:
+            loop.call_soon_threadsafe(self._stopping.set)
+
+    def run(self):
+        """Run the scheduler on the current thread until `stop` is called."""
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        queue, timers_changed, stopping = asyncio.Queue(), asyncio.Event(), asyncio.Event()
+        with self._lock:
+            if self._stop_requested:  # Stopped before it started; leave pending signals for the next run
+                self._stop_requested = False
+                return
+            self.queue, self._timers_changed, self._stopping = queue, timers_changed, stopping
+            self.loop = asyncio.get_running_loop()
+            self._has_run = True
+            pending, self._pending = self._pending, []
+        for item in pending:
+            self.queue.put_nowait(item)
+        self.wheel = TimerWheel(self.wheel.tick, len(self.wheel.slots))
+        for timer in self.timers.values():
+            self.wheel.add(timer, time.perf_counter())
+        tasks = [asyncio.ensure_future(self._consume()), asyncio.ensure_future(self._tick())]
+        try:
+            await self._stopping.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            with self._lock:
+                self.loop = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return dispatch counts, queue wait, timer lag and per-handler timings (seconds)."""
+        return {
+            'dispatched': self.dispatched,
+            'queued': self.queue.qsize() if self.queue is not None else len(self._pending),
+            'queue_wait_avg': self.queue_wait_total / self.dispatched if self.dispatched else 0.0,
+            'queue_wait_max': self.queue_wait_max,
+            'timer_fires': self.timer_fires,
+            'loop_lag_avg': self.timer_lag_total / self.timer_fires if self.timer_fires else 0.0,
+            'loop_lag_max': self.timer_lag_max,
+            'handlers': {event: dict(stats, avg=stats['total'] / stats['calls'] if stats['calls'] else 0.0)
+                         for event, stats in self.handler_stats.items()},
+        }
+
+    # Internals
+
+    def _call(self, function: Callable, *args):
+        with self._lock:
+            loop = self.loop
+        if loop is None:
+            function(*args)
+        else:
+            loop.call_soon_threadsafe(function, *args)
+
+    def _add_timer(self, event: str, interval: float):
+        previous = self.timers.get(event)
+        if previous is not None:
+            previous.cancelled = True
+        timer = PeriodicTimer(event, interval, max(1, round(interval / self.wheel.tick)))
+        self.timers[event] = timer
+        if self.loop is not None:
+            self.wheel.add(timer, time.perf_counter())
+            self._timers_changed.set()
+
+    async def _consume(self):
+        while True:
+            event, args, enqueued = await self.queue.get()
+            wait = time.perf_counter() - enqueued
+            self.queue_wait_total += wait
+            self.queue_wait_max = max(self.queue_wait_max, wait)
+            self._dispatch(event, args)
+
+    def _dispatch(self, event: str, args: tuple):
+        handler = self.handlers.get(event)
+        if handler is None:
+            logging.warning(f"No handler registered for event: {event}")
+            return
+        stats = self.handler_stats[event]
+        start = time.perf_counter()
+        try:
+            handler(*args)
+        except Exception as e:
+            stats['errors'] += 1
+            logging.error(f"Handler for event {event} failed: {e}")
+        elapsed = time.perf_counter() - start
+        stats['calls'] += 1
+        stats['total'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
+        self.dispatched += 1
+
+    async def _tick(self):
+        next_tick = time.perf_counter() + self.wheel.tick
+        while True:
+            if not len(self.wheel):
+                self._timers_changed.clear()
+                await self._timers_changed.wait()  # Idle: no timers, nothing to wake up for
+                next_tick = time.perf_counter() + self.wheel.tick
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+            now = time.perf_counter()
+            while next_tick <= now:  # Catch up on ticks missed behind a slow handler
+                for timer in self.wheel.advance():
+                    lag = max(0.0, now - timer.due)
+                    self.timer_lag_total += lag
+                    self.timer_lag_max = max(self.timer_lag_max, lag)
+                    self.timer_fires += 1
+                    if self.timers.get(timer.event) is timer:
+                        self.wheel.add(timer, timer.due)
+                        self.queue.put_nowait((timer.event, (), now))
+                next_tick += self.wheel.tick
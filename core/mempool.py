@@ -0,0 +1,185 @@
+import bisect
+import hashlib
+import heapq
+import itertools
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from core.config import Config
+from core.encoding import encode_value
+from core.merkle import LEAF_PREFIX, MerkleTree
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+class MempoolEntry:
+    __slots__ = ('transaction', 'tx_hash', 'size', 'fee', 'fee_rate', 'sender', 'nonce', 'sequence', 'removed')
+
+    def __init__(self, transaction: Dict[str, Any], sequence: int, nonce: int):
+        encoded = encode_value(transaction)
+        self.transaction = transaction
+        self.tx_hash = hashlib.sha256(LEAF_PREFIX + encoded).digest()  # Doubles as the Merkle leaf
+        self.size = len(encoded)
+        self.fee = float(transaction.get('fee', 0.0))
+        self.fee_rate = self.fee / self.size
+        self.sender = transaction['sender']
+        self.nonce = nonce
+        self.sequence = sequence
+        self.removed = False
+
+
+class Mempool:
+    """Pending transactions indexed by hash and sender, prioritised by fee rate.
+
+    Transactions from one sender are released strictly in nonce order; transactions
+    without an explicit `nonce` are ordered by arrival. When the pool is over its count
+    or byte limit the lowest fee-rate transaction is evicted together with any later
+    transactions from the same sender, which could no longer be included.
+    """
+
+    def __init__(self, max_transactions: int = Config.MEMPOOL_MAX_TRANSACTIONS,
+                 max_bytes: int = Config.MEMPOOL_MAX_BYTES):
+        self.max_transactions = max_transactions
+        self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self):
+        self.total_bytes = 0
+        self.by_hash: Dict[bytes, MempoolEntry] = {}
+        self.by_sender: Dict[str, Dict[int, MempoolEntry]] = {}
+        self._sender_nonces: Dict[str, List[int]] = {}  # Sorted nonces per sender
+        self._next_implicit_nonce: Dict[str, int] = {}
+        self._eviction_heap: List[Tuple[float, int, MempoolEntry]] = []  # Min-heap on fee rate
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.by_hash)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over pending transactions in arrival order."""
+        for entry in sorted(self.by_hash.values(), key=lambda e: e.sequence):
+            yield entry.transaction
+
+    def __contains__(self, tx_hash: bytes) -> bool:
+        return tx_hash in self.by_hash
+
+    def add_transaction(self, sender: str, recipient: str, amount: float, signature: str,
+                        fee: float = None, nonce: int = None) -> bool:
+        transaction = {'sender': sender, 'recipient': recipient, 'amount': amount, 'signature': signature}
+        if fee is not None:
+            transaction['fee'] = fee
+        if nonce is not None:
+            transaction['nonce'] = nonce
+        return self.add(transaction)
+
+    def add(self, transaction: Dict[str, Any]) -> bool:
+        """Add an already verified transaction. Returns False for duplicates and rejections."""
+        sender = transaction['sender']
+        nonce = transaction.get('nonce')
+        if nonce is None:
+            nonce = self._next_implicit_nonce.get(sender, 0)
+        entry = MempoolEntry(transaction, next(self._sequence), nonce)
+
+        if entry.tx_hash in self.by_hash:
+            logging.debug(f"Duplicate transaction ignored: {entry.tx_hash.hex()}")
+            return False
+
+        existing = self.by_sender.get(sender, {}).get(nonce)
+        if existing is not None and entry.fee_rate <= existing.fee_rate:
+            logging.warning(f"Transaction from {sender} with nonce {nonce} already pending at a higher fee.")
+            return False
+
+        if self._is_full(entry.size):
+            lowest = self._lowest_entry()
+            if lowest is not None and entry.fee_rate <= lowest.fee_rate:
+                logging.warning("Mempool full; transaction fee rate too low.")
+                return False
+
+        if existing is not None:
+            self._remove_entry(existing)  # Replace by fee
+
+        self.by_hash[entry.tx_hash] = entry
+        self.by_sender.setdefault(sender, {})[nonce] = entry
+        bisect.insort(self._sender_nonces.setdefault(sender, []), nonce)
+        self._next_implicit_nonce[sender] = max(self._next_implicit_nonce.get(sender, 0), nonce + 1)
+        heapq.heappush(self._eviction_heap, (entry.fee_rate, -entry.sequence, entry))
+        self.total_bytes += entry.size
+
+        while self._is_full(0):
+            self._evict_lowest()
+        return entry.tx_hash in self.by_hash
+
+    def select(self, max_count: Optional[int] = None, max_bytes: Optional[int] = None) -> List[MempoolEntry]:
+        """Pick the highest fee-rate transactions that respect sender nonce order and the budgets."""
+        selected = []
+        used_bytes = 0
+        heap = []
+        for sender, nonces in self._sender_nonces.items():
+            head = self.by_sender[sender][nonces[0]]
+            heap.append((-head.fee_rate, head.sequence, head, 0))
+        heapq.heapify(heap)
+
+        while heap and (max_count is None or len(selected) < max_count):
+            _, _, entry, position = heapq.heappop(heap)
+            if max_bytes is not None and used_bytes + entry.size > max_bytes:
+                continue  # Later transactions from this sender are blocked behind this one
+            selected.append(entry)
+            used_bytes += entry.size
+            nonces = self._sender_nonces[entry.sender]
+            if position + 1 < len(nonces):
+                following = self.by_sender[entry.sender][nonces[position + 1]]
+                heapq.heappush(heap, (-following.fee_rate, following.sequence, following, position + 1))
+        return selected
+
+    def pop_block(self, max_count: Optional[int] = None, max_bytes: Optional[int] = None) -> Tuple[List[Dict[str, Any]], MerkleTree]:
+        """Remove the best transactions for a block and return them with their Merkle tree."""
+        entries = self.select(max_count, max_bytes)
+        tree = MerkleTree()
+        for entry in entries:
+            tree.append_leaf(entry.tx_hash)
+        self.remove([entry.tx_hash for entry in entries])
+        return [entry.transaction for entry in entries], tree
+
+    def remove(self, tx_hashes: List[bytes]):
+        """Drop transactions, e.g. once they are included in a block."""
+        for tx_hash in tx_hashes:
+            entry = self.by_hash.get(tx_hash)
+            if entry is not None:
+                self._remove_entry(entry)
+
+    def _is_full(self, incoming_bytes: int) -> bool:
+        if incoming_bytes:
+            return len(self.by_hash) + 1 > self.max_transactions or self.total_bytes + incoming_bytes > self.max_bytes
+        return len(self.by_hash) > self.max_transactions or self.total_bytes > self.max_bytes
+
+    def _lowest_entry(self) -> Optional[MempoolEntry]:
+        heap = self._eviction_heap
+        while heap and heap[0][2].removed:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def _evict_lowest(self):
+        lowest = self._lowest_entry()
+        if lowest is None:
+            return
+        nonces = self._sender_nonces[lowest.sender]
+        descendants = [self.by_sender[lowest.sender][n] for n in nonces[bisect.bisect_left(nonces, lowest.nonce):]]
+        for entry in descendants:
+            self._remove_entry(entry)
+        logging.info(f"Evicted {len(descendants)} transaction(s) from {lowest.sender} at fee rate {lowest.fee_rate:.6f}")
+
+    def _remove_entry(self, entry: MempoolEntry):
+        entry.removed = True  # Lazily dropped from the eviction heap
+        del self.by_hash[entry.tx_hash]
+        sender_entries = self.by_sender[entry.sender]
+        del sender_entries[entry.nonce]
+        nonces = self._sender_nonces[entry.sender]
+        del nonces[bisect.bisect_left(nonces, entry.nonce)]
+        if not sender_entries:
+            del self.by_sender[entry.sender]
+            del self._sender_nonces[entry.sender]
+            self._next_implicit_nonce.pop(entry.sender, None)
+        self.total_bytes -= entry.size
+        if len(self._eviction_heap) > 2 * len(self.by_hash) + 64:
+            self._eviction_heap = [item for item in self._eviction_heap if not item[2].removed]
+            heapq.heapify(self._eviction_heap)
@@ -0,0 +1,111 @@
+# core/merkle.py
+
+"""
+Incremental Merkle tree over block transactions with O(log n) inclusion proofs.
+
+The tree follows the RFC 6962 shape: leaves and interior nodes are hashed with distinct
+one-byte prefixes, and a tree whose size is not a power of two is the right-to-left fold
+of its perfect subtrees ("peaks"). Appending a leaf only touches the right edge.
+"""
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from core.encoding import encode_value
+
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+EMPTY_ROOT = hashlib.sha256(b'').digest()
+
+# A proof is a list of (sibling_hash, sibling_is_left) pairs ordered from leaf to root
+MerkleProof = List[Tuple[bytes, bool]]
+
+
+def leaf_hash(transaction: Dict[str, Any]) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + encode_value(transaction)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def verify_proof(transaction: Dict[str, Any], proof: MerkleProof, root: bytes) -> bool:
+    """Check that `transaction` is committed to by `root` using an inclusion proof."""
+    current = leaf_hash(transaction)
+    for sibling, sibling_is_left in proof:
+        current = node_hash(sibling, current) if sibling_is_left else node_hash(current, sibling)
+    return current == root
+
+
+class MerkleTree:
+    def __init__(self, transactions: Optional[Iterable[Dict[str, Any]]] = None):
+        self.levels: List[List[bytes]] = [[]]  # levels[h] holds the roots of complete subtrees of height h
+        self._root: Optional[bytes] = EMPTY_ROOT
+        for transaction in transactions or ():
+            self.append(transaction)
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def append(self, transaction: Dict[str, Any]) -> int:
+        """Add a transaction leaf and return its index."""
+        return self.append_leaf(leaf_hash(transaction))
+
+    def append_leaf(self, leaf: bytes) -> int:
+        levels = self.levels
+        levels[0].append(leaf)
+        height = 0
+        while len(levels[height]) % 2 == 0:
+            if height + 1 == len(levels):
+                levels.append([])
+            level = levels[height]
+            levels[height + 1].append(node_hash(level[-2], level[-1]))
+            height += 1
+        self._root = None
+        return len(levels[0]) - 1
+
+    def _peaks(self) -> List[Tuple[int, int]]:
+        """Return (height, first_leaf) for each perfect subtree, largest first."""
+        size = len(self)
+        peaks = []
+        offset = 0
+        for height in range(size.bit_length() - 1, -1, -1):
+            if size & (1 << height):
+                peaks.append((height, offset))
+                offset += 1 << height
+        return peaks
+
+    def _peak_hash(self, height: int, first_leaf: int) -> bytes:
+        return self.levels[height][first_leaf >> height]
+
+    def root(self) -> bytes:
+        if self._root is None:
+            peaks = [self._peak_hash(height, first) for height, first in self._peaks()]
+            current = peaks[-1]
+            for peak in reversed(peaks[:-1]):
+                current = node_hash(peak, current)
+            self._root = current
+        return self._root
+
+    def proof(self, index: int) -> MerkleProof:
+        """Build the inclusion proof for the leaf at `index`."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"Leaf index {index} out of range for tree of size {len(self)}.")
+        peaks = self._peaks()
+        position = next(i for i, (height, first) in enumerate(peaks) if index < first + (1 << height))
+        peak_height = peaks[position][0]
+
+        proof: MerkleProof = []
+        node = index
+        for height in range(peak_height):
+            sibling = node ^ 1
+            proof.append((self.levels[height][sibling], sibling < node))
+            node >>= 1
+
+        # Everything right of this peak is folded into a single right-hand sibling
+        if position + 1 < len(peaks):
+            right = self._peak_hash(*peaks[-1])
+            for height, first in reversed(peaks[position + 1:-1]):
+                right = node_hash(self._peak_hash(height, first), right)
+            proof.append((right, False))
+        for height, first in reversed(peaks[:position]):
+            proof.append((self._peak_hash(height, first), True))
+        return proof
@@ -0,0 +1,161 @@
+import hashlib
+import time
+import logging
+import multiprocessing
+import queue
+from dataclasses import dataclass
+from typing import Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+DEFAULT_BATCH_SIZE = 50_000  # Nonces scanned by a worker between cancellation checks
+
+
+def difficulty_target(difficulty: int) -> bytes:
+    """Return the 32-byte big-endian target equivalent to `difficulty` leading hex zeros."""
+    if difficulty <= 0:
+        return b'\xff' * 32 + b'\x00'  # Every digest compares below this
+    bits = 256 - 4 * difficulty
+    if bits <= 0:
+        return b'\x00' * 32
+    return (1 << bits).to_bytes(32, 'big')
+
+
+def meets_target(digest: bytes, target: bytes) -> bool:
+    """Check a raw SHA-256 digest against a target (lexicographic == big-endian compare)."""
+    return digest < target
+
+
+def _scan(midstate, suffix: bytes, target: bytes, start: int, stop: int) -> tuple:
+    """Scan nonces in [start, stop). Returns (nonce, digest) or (None, None)."""
+    copy = midstate.copy
+    for nonce in range(start, stop):
+        h = copy()
+        h.update(b'%d' % nonce)
+        if suffix:
+            h.update(suffix)
+        digest = h.digest()
+        if digest < target:
+            return nonce, digest
+    return None, None
+
+
+def _worker(worker_id: int, workers: int, prefix: bytes, suffix: bytes, target: bytes,
+            start_nonce: int, batch_size: int, stop_event, results, counters):
+    """Scan every `workers`-th batch of the nonce space until a solution is found or cancelled."""
+    midstate = hashlib.sha256(prefix)
+    batch_start = start_nonce + worker_id * batch_size
+    stride = workers * batch_size
+    scanned = 0
+    while not stop_event.is_set():
+        nonce, digest = _scan(midstate, suffix, target, batch_start, batch_start + batch_size)
+        if nonce is not None:
+            scanned += nonce - batch_start + 1
+            counters[worker_id] = scanned
+            stop_event.set()
+            results.put((nonce, digest))
+            return
+        scanned += batch_size
+        counters[worker_id] = scanned
+        batch_start += stride
+
+
+@dataclass
+class MiningResult:
+    nonce: int
+    digest: bytes
+    hashes: int
+    elapsed: float
+    workers: int
+
+    @property
+    def hash(self) -> str:
+        return self.digest.hex()
+
+    @property
+    def hash_rate(self) -> float:
+        return self.hashes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class MiningEngine:
+    """Splits the proof-of-work nonce search across a pool of worker processes.
+
+    The preimage hashed for each attempt is `prefix + str(nonce) + suffix`, which matches
+    the string layout used by `Blockchain.valid_proof` and `ProofOfWork.valid_proof`.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 inline_difficulty: int = 3):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.batch_size = batch_size
+        self.inline_difficulty = inline_difficulty  # Below this, process start-up costs more than the search
+        self._context = multiprocessing.get_context()
+
+    def search(self, prefix: str, suffix: str = "", difficulty: int = 4, start_nonce: int = 0) -> MiningResult:
+        """Find a nonce whose digest has at least `difficulty` leading hex zeros."""
+        prefix_bytes = prefix.encode()
+        suffix_bytes = suffix.encode()
+        target = difficulty_target(difficulty)
+        start_time = time.time()
+
+        if self.workers == 1 or difficulty < self.inline_difficulty:
+            nonce, digest, hashes = self._search_inline(prefix_bytes, suffix_bytes, target, start_nonce)
+            workers = 1
+        else:
+            nonce, digest, hashes = self._search_parallel(prefix_bytes, suffix_bytes, target, start_nonce)
+            workers = self.workers
+
+        result = MiningResult(nonce=nonce, digest=digest, hashes=hashes,
+                              elapsed=time.time() - start_time, workers=workers)
+        logging.info(f"Nonce {nonce} found after {hashes} hashes on {workers} worker(s) "
+                     f"({result.hash_rate:.0f} H/s)")
+        return result
+
+    def _search_inline(self, prefix: bytes, suffix: bytes, target: bytes, start_nonce: int) -> tuple:
+        midstate = hashlib.sha256(prefix)
+        batch_start = start_nonce
+        while True:
+            nonce, digest = _scan(midstate, suffix, target, batch_start, batch_start + self.batch_size)
+            if nonce is not None:
+                return nonce, digest, nonce - start_nonce + 1
+            batch_start += self.batch_size
+
+    def _search_parallel(self, prefix: bytes, suffix: bytes, target: bytes, start_nonce: int) -> tuple:
+        ctx = self._context
+        stop_event = ctx.Event()
+        results = ctx.Queue()
+        counters = ctx.Array('Q', self.workers, lock=False)
+        processes = [
+            ctx.Process(target=_worker,
+                        args=(i, self.workers, prefix, suffix, target, start_nonce,
+                              self.batch_size, stop_event, results, counters),
+                        daemon=True)
+            for i in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            while True:
+                try:
+                    nonce, digest = results.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        raise RuntimeError("All mining workers exited without a solution.")
+        finally:
+            stop_event.set()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            results.close()
+        return nonce, digest, sum(counters)
+
+
+# Example usage
+if __name__ == "__main__":
+    engine = MiningEngine()
+    result = engine.search(prefix="0", difficulty=5)
+    print(f"Nonce: {result.nonce}, Hash: {result.hash}, Rate: {result.hash_rate:.0f} H/s")
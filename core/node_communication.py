@@ -1,10 +1,12 @@
 # core/node_communication.py
 
+import asyncio
 import logging
 import socket
-import json
 import threading
 import time
+from core.async_transport import (AsyncNodeTransport, FrameDecoder, FrameError, KIND_REQUEST, KIND_RESPONSE,
+                                  encode_frame)
 
 # Configure logging for Node Communication
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -13,6 +15,11 @@ logger = logging.getLogger(__name__)
 class NodeCommunication:
     """
     Manages communication between nodes in the network.
+
+    Connections use length-prefixed JSON frames (see core.async_transport) on a single
+    asyncio event loop that runs in a background thread, so any number of peers share
+    one thread. Outbound connections are kept open and reused by `send_message` and
+    `broadcast_message`.
     """
 
     def __init__(self, host='localhost', port=5000):
@@ -24,126 +31,160 @@ class NodeCommunication:
         """
         self.host = host
         self.port = port
-        self.server_socket = None
-        self.client_sockets = []
+        self.transport = AsyncNodeTransport(host, port, handler=self.process_message)
+        self.loop = None
+        self.loop_thread = None
         self.lock = threading.Lock()
         logger.info("NodeCommunication initialized on %s:%d", self.host, self.port)
 
+    @property
+    def client_sockets(self):
+        """Addresses of the open outbound peer connections."""
+        return list(self.transport.peers)
+
+    def _ensure_loop(self):
+        with self.lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self.loop_thread = threading.Thread(target=self.loop.run_forever, name=f"node-{self.port}", daemon=True)
+                self.loop_thread.start()
+        return self.loop
+
+    def _run(self, coroutine, timeout=None):
+        """Run a coroutine on the node's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop()).result(timeout)
+
     def start_server(self):
         """
-        Start the server to listen for incoming connections.
+        Start the server to listen for incoming connections. Returns once listening.
         """
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(5)
+        self._run(self.transport.start())
+        self.port = self.transport.port
         logger.info("Server started, waiting for connections...")
 
-        while True:
-            client_socket, address = self.server_socket.accept()
-            logger.info("Connection established with %s", address)
-            self.client_sockets.append(client_socket)
-            threading.Thread(target=self.handle_client, args=(client_socket,)).start()
-
     def handle_client(self, client_socket):
         """
-        Handle communication with a connected client.
+        Handle framed communication on a blocking socket obtained outside the event loop.
 
         :param client_socket: The socket object for the connected client.
         """
+        decoder = FrameDecoder()
         with client_socket:
             while True:
                 try:
-                    data = client_socket.recv(1024)
+                    data = client_socket.recv(65536)
                     if not data:
                         logger.info("Client disconnected.")
                         break
-                    message = json.loads(data.decode('utf-8'))
-                    logger.info("Received message: %s", message)
-                    self.process_message(message, client_socket)
-                except json.JSONDecodeError:
-                    logger.error("Received invalid JSON data.")
+                    for kind, message in decoder.feed(data):
+                        logger.debug("Received message: %s", message)
+                        response = self.process_message(message, client_socket)
+                        if kind == KIND_REQUEST:
+                            client_socket.sendall(encode_frame(response, KIND_RESPONSE))
+                except FrameError as e:
+                    logger.error("Received invalid frame: %s", e)
                     break
                 except Exception as e:
                     logger.error("Error handling client: %s", e)
                     break
 
-    def process_message(self, message, client_socket):
+    def process_message(self, message, connection):
         """
-        Process the received message and respond if necessary.
+        Process the received message. The return value answers request frames.
 
         :param message: The message received from the client.
-        :param client_socket: The socket object for the client.
+        :param connection: The connection the message arrived on.
         """
         # Example processing logic
-        response = {"status": "received", "data": message}
-        self.send_message(response, client_socket)
+        return {"status": "received", "data": message}
 
-    def send_message(self, message, client_socket):
+    def send_message(self, message, peer):
         """
-        Send a message to a connected client.
+        Send a message to a connected node.
 
         :param message: The message to send (dict).
-        :param client_socket: The socket object for the client.
+        :param peer: A (host, port) address from connect_to_node, or a blocking socket.
         """
         try:
-            message_json = json.dumps(message).encode('utf-8')
-            client_socket.sendall(message_json)
-            logger.info("Sent message: %s", message)
+            if isinstance(peer, socket.socket):
+                peer.sendall(encode_frame(message))
+            else:
+                self._run(self.transport.send(peer[0], peer[1], message))
+            logger.debug("Sent message: %s", message)
         except Exception as e:
             logger.error("Error sending message: %s", e)
 
+    def request(self, message, peer, timeout=10.0):
+        """
+        Send a request to a node and wait for its response.
+
+        :param message: The request (dict).
+        :param peer: A (host, port) address.
+        :param timeout: Seconds to wait for the response.
+        :return: The response message.
+        """
+        return self._run(self.transport.request(peer[0], peer[1], message, timeout))
+
     def connect_to_node(self, host, port):
         """
-        Connect to another node in the network.
+        Connect to another node in the network, reusing an open connection if there is one.
 
         :param host: Host address of the node to connect to.
         :param port: Port number of the node to connect to.
+        :return: The (host, port) peer address, or None on failure.
         """
         try:
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.connect((host, port))
-            logger.info("Connected to node %s:%d", host, port)
-            self.client_sockets.append(client_socket)
-            return client_socket
+            self._run(self.transport.connect(host, port))
+            return (host, port)
         except Exception as e:
             logger.error("Failed to connect to node %s:%d: %s", host, port, e)
             return None
 
     def close_connections(self):
         """
-        Close all active connections.
+        Close all active outbound connections.
         """
-        with self.lock:
-            for client_socket in self.client_sockets:
-                client_socket.close()
-            self.client_sockets.clear()
-            logger.info("All connections closed.")
+        if self.loop is not None:
+            self._run(self.transport.close_peers())
+        logger.info("All connections closed.")
+
+    def stop(self):
+        """
+        Stop the server, close every connection and shut down the event loop.
+        """
+        if self.loop is None:
+            return
+        self._run(self.transport.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+        self.loop.close()
+        self.loop = None
+        logger.info("Node %s:%d stopped.", self.host, self.port)
 
     def broadcast_message(self, message):
         """
-        Broadcast a message to all connected clients.
+        Broadcast a message to all connected nodes concurrently over their open connections.
 
         :param message: The message to broadcast (dict).
+        :return: Number of nodes the message was written to.
         """
-        with self.lock:
-            for client_socket in self.client_sockets:
-                self.send_message(message, client_socket)
+        if self.loop is None:
+            return 0
+        return self._run(self.transport.broadcast(message))
 
 # Example usage
 if __name__ == "__main__":
     node_comm = NodeCommunication()
     
-    # Start the server in a separate thread
-    server_thread = threading.Thread(target=node_comm.start_server)
-    server_thread.start()
+    # Start the server on the node's background event loop
+    node_comm.start_server()
 
     # Connect to another node (example)
-    time.sleep (1)  # Wait for the server to start
-    client_socket = node_comm.connect_to_node('localhost', 5001)
+    peer = node_comm.connect_to_node('localhost', 5001)
 
     # Example of sending a message
-    if client_socket:
-        node_comm.send_message({"message": "Hello from Node 1"}, client_socket)
+    if peer:
+        node_comm.send_message({"message": "Hello from Node 1"}, peer)
 
     # Example of broadcasting a message
     time.sleep(2)  # Allow some time for connections
@@ -152,3 +193,4 @@ if __name__ == "__main__":
     # Close connections when done
     time.sleep(5)  # Keep the client alive for a while
     node_comm.close_connections()
+    node_comm.stop()
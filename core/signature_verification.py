@@ -0,0 +1,150 @@
+# core/signature_verification.py
+
+"""
+Shared signature verification service for the transaction ingest path.
+
+Public keys are parsed once and kept in an LRU cache, and large batches are spread
+over a process pool. Two key forms are understood:
+
+- hex strings: raw SECP256k1 public keys, verified with ECDSA as in `core.blockchain`;
+- `cryptography` public key objects or their DER encoding: verified with RSA-PSS/SHA-256
+  as in `wallet.transaction_signing` and `src/core/security/multi_sig`.
+"""
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import cpu_count
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+from ecdsa import VerifyingKey, SECP256k1
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+KEY_CACHE_SIZE = 4096
+MIN_POOL_BATCH = 64  # Smaller batches are cheaper to verify in-process than to ship to workers
+
+_PSS_PADDING = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH)
+
+# (payload, signature, public_key)
+VerificationItem = Tuple[bytes, Union[bytes, str], Any]
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def load_ecdsa_key(public_key_hex: str) -> VerifyingKey:
+    """Parse a hex SECP256k1 public key."""
+    return VerifyingKey.from_string(bytes.fromhex(public_key_hex), curve=SECP256k1)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def load_der_key(der: bytes):
+    """Parse a DER SubjectPublicKeyInfo public key."""
+    return serialization.load_der_public_key(der)
+
+
+def verify_one(payload: bytes, signature: Union[bytes, str], public_key: Any) -> bool:
+    """Verify a single signature; any parsing or verification error counts as invalid."""
+    try:
+        if isinstance(signature, str):
+            signature = bytes.fromhex(signature)
+        if isinstance(public_key, str):
+            return load_ecdsa_key(public_key).verify(signature, payload)
+        if isinstance(public_key, (bytes, bytearray)):
+            public_key = load_der_key(bytes(public_key))
+        public_key.verify(signature, payload, _PSS_PADDING, hashes.SHA256())
+        return True
+    except Exception as e:
+        logging.debug(f"Signature verification failed: {e}")
+        return False
+
+
+def _verify_chunk(items: Sequence[VerificationItem]) -> List[bool]:
+    return [verify_one(payload, signature, public_key) for payload, signature, public_key in items]
+
+
+def _portable_key(public_key: Any) -> Union[str, bytes]:
+    """Convert a key object into a picklable form that worker processes can cache."""
+    if isinstance(public_key, (str, bytes, bytearray)):
+        return public_key
+    return public_key.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+
+
+class SignatureVerifier:
+    def __init__(self, workers: Optional[int] = None, min_pool_batch: int = MIN_POOL_BATCH):
+        self.workers = workers or cpu_count()
+        self.min_pool_batch = min_pool_batch
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._metrics = {'verified': 0, 'valid': 0, 'invalid': 0, 'batches': 0, 'pooled_batches': 0, 'seconds': 0.0}
+
+    def verify(self, payload: bytes, signature: Union[bytes, str], public_key: Any) -> bool:
+        start = time.perf_counter()
+        result = verify_one(payload, signature, public_key)
+        self._record([result], time.perf_counter() - start)
+        return result
+
+    def verify_batch(self, items: Sequence[VerificationItem]) -> List[bool]:
+        """Verify many (payload, signature, public_key) tuples, preserving order."""
+        if not items:
+            return []
+        start = time.perf_counter()
+        pooled = self.workers > 1 and len(items) >= self.min_pool_batch
+        if pooled:
+            portable = [(payload, signature, _portable_key(public_key)) for payload, signature, public_key in items]
+            chunk_size = math.ceil(len(portable) / (self.workers * 4))
+            chunks = [portable[i:i + chunk_size] for i in range(0, len(portable), chunk_size)]
+            results = [result for chunk in self._get_executor().map(_verify_chunk, chunks) for result in chunk]
+        else:
+            results = _verify_chunk(items)
+        self._record(results, time.perf_counter() - start, batch=True, pooled=pooled)
+        return results
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _record(self, results: List[bool], elapsed: float, batch: bool = False, pooled: bool = False):
+        valid = sum(results)
+        with self._lock:
+            self._metrics['verified'] += len(results)
+            self._metrics['valid'] += valid
+            self._metrics['invalid'] += len(results) - valid
+            self._metrics['seconds'] += elapsed
+            if batch:
+                self._metrics['batches'] += 1
+            if pooled:
+                self._metrics['pooled_batches'] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return counters, throughput and key cache statistics for this process."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics['signatures_per_second'] = metrics['verified'] / metrics['seconds'] if metrics['seconds'] else 0.0
+        ecdsa_cache = load_ecdsa_key.cache_info()
+        der_cache = load_der_key.cache_info()
+        metrics['key_cache_hits'] = ecdsa_cache.hits + der_cache.hits
+        metrics['key_cache_misses'] = ecdsa_cache.misses + der_cache.misses
+        return metrics
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+_default_verifier: Optional[SignatureVerifier] = None
+
+
+def get_default_verifier() -> SignatureVerifier:
+    """Return the process-wide verifier shared by the blockchain and wallet code."""
+    global _default_verifier
+    if _default_verifier is None:
+        _default_verifier = SignatureVerifier()
+    return _default_verifier
@@ -1,5 +1,7 @@
 import logging
 from core.blockchain import Blockchain
+from core.block_store import BlockStore
+from core.event_scheduler import EventScheduler
 from modules.consensus.consensus import Consensus
 from modules.interoperability.ibc import IBC
 from modules.execution.smart_contracts import SmartContractExecution
@@ -10,13 +12,17 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 class Zone:
     def __init__(self, name, consensus_algorithm, config):
         self.name = name
-        self.blockchain = Blockchain()
+        store_path = config.get('block_store_path')  # Persist the chain when configured
+        self.blockchain = Blockchain(block_store=BlockStore(store_path) if store_path else None)
         self.consensus = Consensus(consensus_algorithm)
         self.ibc = IBC()
         self.config = config  # Dynamic configuration for the zone
         self.state = {}  # State management for the zone
         self.event_handlers = {}  # Event handlers for zone activities
         self.smart_contracts = SmartContractExecution()  # Smart contract execution manager
+        self.scheduler = EventScheduler(tick=config.get('timer_tick', 0.05))  # Dispatches signalled and timed events
+        self.scheduler.add_handler('transaction', self.handle_transaction)
+        self.scheduler.add_handler('packet', self.receive_packet)
 
     def start(self):
         """Start the zone and initialize necessary components."""
@@ -32,32 +38,56 @@ class Zone:
         logging.info(f"Zone {self.name} state initialized.")
 
     def run_event_loop(self):
-        """Run the main event loop for the zone."""
+        """Run the main event loop for the zone until `stop` is called.
+
+        The loop sleeps until an event is signalled (`signal_event`, `submit_transaction`,
+        `submit_packet`) or a periodic handler's timer expires.
+        """
         logging.info(f"Running event loop for zone: {self.name}")
-        while True:
-            self.process_events()
+        self.scheduler.run()
 
     def process_events(self):
-        """Process events for the zone."""
-        # Placeholder for event processing logic
-        for event, handler in self.event_handlers.items():
+        """Signal every event whose condition is currently met."""
+        for event in list(self.event_handlers):
             if self.check_event_condition(event):
-                handler()
+                self.signal_event(event)
+
+    def signal_event(self, event, *args):
+        """Queue an event for dispatch to its handler; safe to call from any thread."""
+        self.scheduler.signal(event, *args)
+
+    def submit_transaction(self, transaction):
+        """Queue an arriving transaction for the event loop."""
+        self.scheduler.signal('transaction', transaction)
+
+    def submit_packet(self, packet):
+        """Queue an arriving IBC packet for the event loop."""
+        self.scheduler.signal('packet', packet)
+
+    def get_event_metrics(self):
+        """Return loop lag, queue wait and per-handler timings from the scheduler."""
+        return self.scheduler.get_metrics()
 
     def check_event_condition(self, event):
         """Check if a specific event condition is met."""
         # Placeholder for event condition logic
         return False  # Replace with actual condition checking
 
-    def add_event_handler(self, event, handler):
-        """Add an event handler for a specific event."""
+    def add_event_handler(self, event, handler, interval=None):
+        """Add an event handler for a specific event, optionally run every `interval` seconds."""
         self.event_handlers[event] = handler
+        self.scheduler.add_handler(event, handler, interval)
         logging.info(f"Event handler added for event: {event}")
 
     def handle_transaction(self, transaction):
         """Handle a new transaction."""
         logging.info(f"Handling transaction: {transaction}")
-        self.blockchain.add_transaction(transaction.sender, transaction.recipient, transaction.amount)
+        accepted = self.blockchain.add_transaction(transaction.sender, transaction.recipient, transaction.amount,
+                                                   transaction.signature, getattr(transaction, 'fee', None),
+                                                   getattr(transaction, 'nonce', None))
+        if accepted == -1:
+            logging.warning(f"Transaction rejected by the mempool: {transaction}")
+            return
         self.consensus.validate_block(self.blockchain.last_block)
         self.state['transactions'].append(transaction)
 
@@ -89,12 +119,14 @@ class Zone:
     def stop(self):
         """Stop the zone and clean up resources."""
         logging.info(f"Stopping zone: {self.name}")
+        self.scheduler.stop()
         # Clean up resources and save state if necessary
         self.save_state()
 
     def save_state(self):
         """Save the current state of the zone."""
         # Implement logic to persist the state (e.g., to a database or file)
+        self.blockchain.persist()
         logging.info(f"State for zone {self.name} saved.")
 
 # Example usage
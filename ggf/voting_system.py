@@ -9,6 +9,8 @@ class VotingSystem:
         """Initialize the Voting System."""
         self.proposals = {}
         self.votes = {}
+        self.voters = {}  # proposal_id -> set of voter_ids, for O(1) duplicate checks
+        self.tallies = {}  # proposal_id -> running {"yes", "no", "total"} counts
         logging.info("Voting System initialized.")
 
     def propose(self, proposal_id, proposal_details):
@@ -27,6 +29,9 @@ class VotingSystem:
             "status": "pending",
             "created_at": time.time()
         }
+        self.votes[proposal_id] = []
+        self.voters[proposal_id] = set()
+        self.tallies[proposal_id] = {"yes": 0, "no": 0, "total": 0}
         logging.info(f"Proposal '{proposal_id}' submitted.")
 
     def vote(self, proposal_id, voter_id, vote):
@@ -35,17 +40,49 @@ class VotingSystem:
         :param proposal_id: Unique identifier for the proposal.
         :param voter_id: Identifier for the voter.
         :param vote: Vote value (e.g., True for yes, False for no).
+        :return: True if the vote was counted.
         """
         if proposal_id not in self.proposals:
             logging.error(f"Proposal '{proposal_id}' not found.")
-            return
+            return False
         
-        if voter_id in self.votes.get(proposal_id, []):
+        voters = self.voters[proposal_id]
+        if voter_id in voters:
             logging.warning(f"Voter '{voter_id}' has already voted on proposal '{proposal_id}'.")
-            return
+            return False
         
-        self.votes.setdefault(proposal_id, []).append({"voter_id": voter_id, "vote": vote})
-        logging.info(f"Voter '{voter_id}' voted on proposal '{proposal_id}'.")
+        self._record(proposal_id, voters, voter_id, vote)
+        logging.debug("Voter '%s' voted on proposal '%s'.", voter_id, proposal_id)
+        return True
+
+    def vote_many(self, ballots):
+        """
+        Cast many votes at once, e.g. when ingesting a batch during a large governance event.
+        Unknown proposals and repeat voters are skipped, as in vote().
+        :param ballots: Iterable of (proposal_id, voter_id, vote) tuples.
+        :return: The number of votes counted.
+        """
+        counted = skipped = 0
+        proposals = self.voters
+        for proposal_id, voter_id, vote in ballots:
+            voters = proposals.get(proposal_id)
+            if voters is None or voter_id in voters:
+                skipped += 1
+                continue
+            self._record(proposal_id, voters, voter_id, vote)
+            counted += 1
+        logging.info(f"Counted {counted} votes; skipped {skipped} duplicate or unknown-proposal votes.")
+        return counted
+
+    def _record(self, proposal_id, voters, voter_id, vote):
+        voters.add(voter_id)
+        self.votes[proposal_id].append({"voter_id": voter_id, "vote": vote})
+        tally = self.tallies[proposal_id]
+        tally["total"] += 1
+        if vote is True:
+            tally["yes"] += 1
+        elif vote is False:
+            tally["no"] += 1
 
     def tally_votes(self, proposal_id):
         """
@@ -57,14 +94,7 @@ class VotingSystem:
             logging.error(f"Proposal '{proposal_id}' not found.")
             return None
         
-        votes = self.votes.get(proposal_id, [])
-        yes_votes = sum(1 for v in votes if v["vote"] is True)
-        no_votes = sum(1 for v in votes if v["vote"] is False)
-        result = {
-            "yes": yes_votes,
-            "no": no_votes,
-            "total": len(votes)
-        }
+        result = dict(self.tallies[proposal_id])
         logging.info(f"Votes tallied for proposal '{proposal_id}': {result}")
         return result
 
@@ -103,10 +133,7 @@ class VotingSystem:
         :param proposal_id: Unique identifier for the proposal.
         :param num_voters: Number of voters to simulate.
         """
-        for i in range(num_voters):
-            voter_id = f"Voter-{i}"
-            vote = random.choice([True, False])
-            self.vote(proposal_id, voter_id, vote)
+        self.vote_many((proposal_id, f"Voter-{i}", random.choice([True, False])) for i in range(num_voters))
 
     def display_proposals(self):
         """
@@ -6,6 +6,7 @@ integrating edge computing, and utilizing IPFS for decentralized data distributi
 
 Modules:
 - holographic_storage: Functions for managing holographic data storage.
+- page_file_backend: Memory-mapped page files for disk-backed holographic storage.
 - edge_integration: Functions for integrating edge computing with holographic storage.
 - ipfs_integration: Functions for interacting with IPFS for data distribution.
 - data_encoding: Functions for encoding data into holographic formats.
@@ -14,6 +15,7 @@ Modules:
 """
 
 from .holographic_storage import HolographicStorage
+from .page_file_backend import PageFileBackend
 from .edge_integration import EdgeIntegration
 from .ipfs_integration import IPFSIntegration
 from .data_encoding import encode_data
@@ -22,6 +24,7 @@ from .utils import log_event, handle_error
 
 __all__ = [
     "HolographicStorage",
+    "PageFileBackend",
     "EdgeIntegration",
     "IPFSIntegration",
     "encode_data",
@@ -1,7 +1,60 @@
+import asyncio
 import socket
 import json
 import logging
-from holographic_storage import HolographicStorage
+import struct
+import time
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
+from .holographic_storage import HolographicStorage, StreamWriter
+
+# Streaming protocol: every frame is a header followed by `length` payload bytes. Requests and
+# responses carry a client-chosen stream id, so one connection can have many transfers in flight.
+STREAM_HEADER = struct.Struct('>BII')  # frame kind, stream id, payload length
+FRAME_PUT = 1  # JSON {identifier, size}; answered with FRAME_OK {offset} to send from
+FRAME_DATA = 2  # Raw bytes of an upload or download
+FRAME_END = 3  # Client: upload complete. Server: download complete, JSON {size}
+FRAME_GET = 4  # JSON {identifier, offset, chunk_size}; answered with FRAME_DATA frames then FRAME_END
+FRAME_OK = 5  # JSON result
+FRAME_ERROR = 6  # JSON {error}
+DEFAULT_CHUNK_SIZE = 256 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_UPLOAD_TIMEOUT = 300.0  # Seconds an unfinished upload may sit idle before it is discarded
+
+
+class StreamProtocolError(Exception):
+    """Raised when a peer breaks the streaming protocol or the server reports an error."""
+
+
+def encode_stream_frame(kind: int, stream_id: int, payload: bytes = b'') -> bytes:
+    """
+    Encodes one streaming protocol frame.
+
+    Args:
+        kind (int): One of the FRAME_* constants.
+        stream_id (int): The transfer the frame belongs to.
+        payload (bytes): Frame payload.
+
+    Returns:
+        bytes: Header and payload.
+    """
+    return STREAM_HEADER.pack(kind, stream_id, len(payload)) + bytes(payload)
+
+
+async def read_stream_frame(reader: asyncio.StreamReader, max_payload: int = MAX_CHUNK_SIZE) -> Tuple[int, int, bytes]:
+    """
+    Reads one streaming protocol frame.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from.
+        max_payload (int): Largest accepted payload in bytes.
+
+    Returns:
+        tuple: (kind, stream id, payload).
+    """
+    kind, stream_id, length = STREAM_HEADER.unpack(await reader.readexactly(STREAM_HEADER.size))
+    if length > max_payload:
+        raise StreamProtocolError(f"Frame of {length} bytes exceeds limit of {max_payload}.")
+    return kind, stream_id, await reader.readexactly(length)
 
 class EdgeIntegration:
     """
@@ -13,7 +66,8 @@ class EdgeIntegration:
         port (int): The port number for the edge device.
     """
 
-    def __init__(self, storage: HolographicStorage, host: str = 'localhost', port: int = 5000):
+    def __init__(self, storage: HolographicStorage, host: str = 'localhost', port: int = 5000,
+                 upload_timeout: float = DEFAULT_UPLOAD_TIMEOUT):
         """
         Initializes the EdgeIntegration instance.
 
@@ -21,11 +75,18 @@ class EdgeIntegration:
             storage (HolographicStorage): An instance of the HolographicStorage class.
             host (str): The host address for the edge device.
             port (int): The port number for the edge device.
+            upload_timeout (float): Seconds without data after which an unfinished upload is
+                discarded and its reserved capacity returned.
         """
         self.storage = storage
         self.host = host
         self.port = port
         self.server_socket = None
+        self.stream_server: Optional[asyncio.AbstractServer] = None
+        self.upload_timeout = upload_timeout
+        self.uploads: Dict[str, StreamWriter] = {}  # Unfinished uploads, kept so they can resume
+        self.upload_owners: Dict[str, Tuple[object, int]] = {}  # Identifier -> (connection, stream) writing it
+        self.upload_reaper: Optional[asyncio.Task] = None
         logging.basicConfig(level=logging.INFO)
 
     def start_server(self):
@@ -104,6 +165,227 @@ class EdgeIntegration:
             logging.warning(f"No data found for identifier '{identifier}'.")
             client_socket.send(b'{"error": "Data not found"}')
 
+    async def start_streaming_server(self) -> asyncio.AbstractServer:
+        """
+        Starts the asyncio streaming server, which serves any number of clients concurrently.
+
+        Returns:
+            asyncio.AbstractServer: The listening server. With port 0, `self.port` is updated
+                to the port actually bound.
+        """
+        self.stream_server = await asyncio.start_server(self.handle_stream, self.host, self.port)
+        self.port = self.stream_server.sockets[0].getsockname()[1]
+        self.upload_reaper = asyncio.create_task(self._reap_uploads())
+        logging.info(f"Edge streaming server started at {self.host}:{self.port}")
+        return self.stream_server
+
+    async def stop_streaming_server(self):
+        """
+        Stops the streaming server. Unfinished uploads are kept for resumption.
+        """
+        if self.upload_reaper:
+            self.upload_reaper.cancel()
+            await asyncio.gather(self.upload_reaper, return_exceptions=True)
+            self.upload_reaper = None
+        if self.stream_server:
+            self.stream_server.close()
+            await self.stream_server.wait_closed()
+            self.stream_server = None
+            logging.info("Edge streaming server stopped.")
+
+    async def handle_stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serves one streaming client until it disconnects.
+
+        Uploads are written to storage as their chunks arrive; only one stream at a time may
+        upload a given identifier. Each download runs as its own task, so requests pipelined
+        behind a large download are not held up by it.
+
+        Args:
+            reader (asyncio.StreamReader): The client's read stream.
+            writer (asyncio.StreamWriter): The client's write stream.
+        """
+        peer = writer.get_extra_info('peername')
+        connection = object()  # Identifies this client's streams in self.upload_owners
+        write_lock = asyncio.Lock()
+        uploads: Dict[int, StreamWriter] = {}
+        downloads = set()
+
+        async def send(kind: int, stream_id: int, payload: bytes = b''):
+            async with write_lock:
+                writer.write(encode_stream_frame(kind, stream_id, payload))
+                await writer.drain()
+
+        async def reply(kind: int, stream_id: int, message: dict):
+            await send(kind, stream_id, json.dumps(message).encode('utf-8'))
+
+        try:
+            while True:
+                kind, stream_id, payload = await read_stream_frame(reader)
+                if kind == FRAME_DATA:
+                    upload = uploads.get(stream_id)
+                    if upload is None:
+                        await reply(FRAME_ERROR, stream_id, {'error': 'Unknown stream'})
+                        continue
+                    try:
+                        upload.write(payload)
+                    except ValueError as e:
+                        del uploads[stream_id]
+                        self._disown_upload(upload, (connection, stream_id))
+                        await reply(FRAME_ERROR, stream_id, {'error': str(e)})
+                elif kind == FRAME_END:
+                    upload = uploads.pop(stream_id, None)
+                    if upload is not None:
+                        self._disown_upload(upload, (connection, stream_id))
+                    if upload is None:
+                        await reply(FRAME_ERROR, stream_id, {'error': 'Unknown stream'})
+                    elif upload.commit():
+                        self._forget_upload(upload)
+                        await reply(FRAME_OK, stream_id, {'identifier': upload.identifier, 'size': upload.size})
+                    else:
+                        if upload.closed:  # Aborted for lack of capacity; a retry must start afresh
+                            self._forget_upload(upload)
+                        await reply(FRAME_ERROR, stream_id, {'error': 'Incomplete data or not enough capacity'})
+                elif kind == FRAME_PUT:
+                    request = json.loads(payload.decode('utf-8'))
+                    size = int(request['size'])
+                    if size < 0:
+                        await reply(FRAME_ERROR, stream_id, {'error': 'Size must not be negative'})
+                        continue
+                    self.expire_uploads()
+                    if request['identifier'] in self.upload_owners:
+                        await reply(FRAME_ERROR, stream_id, {'error': 'Upload already in progress'})
+                        continue
+                    upload = self.open_upload(request['identifier'], size)
+                    if upload is None:
+                        await reply(FRAME_ERROR, stream_id, {'error': 'Not enough capacity'})
+                    else:
+                        uploads[stream_id] = upload
+                        self.upload_owners[upload.identifier] = (connection, stream_id)
+                        await reply(FRAME_OK, stream_id, {'offset': upload.written})
+                elif kind == FRAME_GET:
+                    request = json.loads(payload.decode('utf-8'))
+                    task = asyncio.create_task(self.send_download(stream_id, request, send, reply))
+                    downloads.add(task)
+                    task.add_done_callback(downloads.discard)
+                else:
+                    raise StreamProtocolError(f"Unknown frame kind {kind}.")
+        except asyncio.IncompleteReadError:
+            logging.info(f"Streaming client {peer} disconnected.")
+        except (StreamProtocolError, ConnectionError, ValueError, KeyError) as e:
+            logging.error(f"Closing streaming client {peer}: {e}")
+        finally:
+            for stream_id, upload in uploads.items():  # Left unfinished; another client may resume them
+                self._disown_upload(upload, (connection, stream_id))
+            for task in downloads:
+                task.cancel()
+            await asyncio.gather(*downloads, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    def open_upload(self, identifier: str, size: int) -> Optional[StreamWriter]:
+        """
+        Returns the writer for an upload, resuming an unfinished one of the same size.
+
+        Args:
+            identifier (str): A unique identifier for the data.
+            size (int): Total size of the data in bytes.
+
+        Returns:
+            StreamWriter: The writer, or None if the data would not fit.
+        """
+        upload = self.uploads.get(identifier)
+        if upload is not None and upload.closed:
+            self._forget_upload(upload)
+            upload = None
+        if upload is not None and upload.size == size:
+            logging.info(f"Resuming upload of '{identifier}' at offset {upload.written}.")
+            return upload
+        if upload is not None:
+            upload.abort()
+            self._forget_upload(upload)
+        upload = self.storage.open_writer(identifier, size)
+        if upload is not None:
+            self.uploads[identifier] = upload
+        return upload
+
+    def expire_uploads(self, now: Optional[float] = None) -> int:
+        """
+        Discards unfinished uploads that have received no data for `upload_timeout` seconds.
+
+        Args:
+            now (float, optional): time.monotonic() to compare against; defaults to the current time.
+
+        Returns:
+            int: The number of uploads discarded.
+        """
+        now = time.monotonic() if now is None else now
+        expired = [upload for upload in self.uploads.values() if now - upload.last_active >= self.upload_timeout]
+        for upload in expired:
+            logging.info(f"Discarding upload of '{upload.identifier}' after {self.upload_timeout}s idle.")
+            upload.abort()
+            self._forget_upload(upload)
+            self.upload_owners.pop(upload.identifier, None)
+        return len(expired)
+
+    async def _reap_uploads(self):
+        while True:
+            await asyncio.sleep(self.upload_timeout / 2)
+            self.expire_uploads()
+
+    def _forget_upload(self, upload: StreamWriter):
+        if self.uploads.get(upload.identifier) is upload:
+            del self.uploads[upload.identifier]
+
+    def _disown_upload(self, upload: StreamWriter, owner: Tuple[object, int]):
+        if self.upload_owners.get(upload.identifier) == owner:
+            del self.upload_owners[upload.identifier]
+
+    async def send_download(self, stream_id: int, request: dict, send, reply):
+        """
+        Streams stored data to a client chunk by chunk, starting at the requested offset.
+
+        Args:
+            stream_id (int): The client's stream id for this download.
+            request (dict): The GET request with identifier, offset and chunk_size.
+            send: Coroutine function sending a raw frame.
+            reply: Coroutine function sending a JSON frame.
+
+        Any failure is answered with FRAME_ERROR, so the client is never left waiting for FRAME_END.
+        """
+        try:
+            identifier = request.get('identifier')
+            chunk_size = min(int(request.get('chunk_size', DEFAULT_CHUNK_SIZE)), MAX_CHUNK_SIZE)
+            offset = int(request.get('offset', 0))
+            if chunk_size < 1 or offset < 0:
+                await reply(FRAME_ERROR, stream_id, {'error': 'chunk_size must be positive and offset not negative'})
+                return
+            try:
+                chunks = self.storage.stream_data(identifier, chunk_size, offset)
+            except KeyError:
+                await reply(FRAME_ERROR, stream_id, {'error': 'Data not found'})
+                return
+            sent = offset
+            try:
+                for chunk in chunks:
+                    # Copy each chunk: the transport may hold the buffer after drain() returns
+                    await send(FRAME_DATA, stream_id, bytes(chunk))
+                    sent += len(chunk)
+            finally:
+                chunks.close()  # Unpins the extent at once, even if the download was cancelled
+            await reply(FRAME_END, stream_id, {'size': sent})
+        except (ConnectionError, OSError):
+            pass  # The client is gone; handle_stream cleans up
+        except Exception as e:
+            logging.error(f"Download on stream {stream_id} failed: {e}")
+            try:
+                await reply(FRAME_ERROR, stream_id, {'error': str(e)})
+            except (ConnectionError, OSError):
+                pass
+
     def stop_server(self):
         """
         Stops the edge computing server.
@@ -111,3 +393,159 @@ class EdgeIntegration:
         if self.server_socket:
             self.server_socket.close()
             logging.info("Edge computing server stopped.")
+
+
+class EdgeStreamClient:
+    """
+    Client for the EdgeIntegration streaming protocol.
+
+    Transfers may be started concurrently on one connection; responses are matched to them
+    by stream id.
+    """
+
+    def __init__(self, host: str = 'localhost', port: int = 5000, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_pending_chunks: int = 16):
+        """
+        Initializes the EdgeStreamClient instance.
+
+        Args:
+            host (str): The edge server address.
+            port (int): The edge server streaming port.
+            chunk_size (int): Size of uploaded and requested chunks in bytes.
+            max_pending_chunks (int): Chunks buffered per download before reading from the
+                connection pauses, which bounds client memory for large downloads.
+        """
+        self.host = host
+        self.port = port
+        self.chunk_size = min(chunk_size, MAX_CHUNK_SIZE)
+        self.max_pending_chunks = max_pending_chunks
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.streams: Dict[int, asyncio.Queue] = {}
+        self.next_stream_id = 1
+        self.write_lock = asyncio.Lock()
+        self.receiver: Optional[asyncio.Task] = None
+
+    async def connect(self):
+        """
+        Opens the connection and starts dispatching responses.
+        """
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.receiver = asyncio.create_task(self._receive())
+
+    async def close(self):
+        """
+        Closes the connection.
+        """
+        if self.receiver:
+            self.receiver.cancel()
+            await asyncio.gather(self.receiver, return_exceptions=True)
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def upload(self, identifier: str, chunks: Iterable[bytes], size: int) -> dict:
+        """
+        Uploads data of known size, resuming where an interrupted upload of it stopped.
+
+        Args:
+            identifier (str): A unique identifier for the data.
+            chunks (Iterable[bytes]): The data, in order. Bytes the server already has are skipped.
+            size (int): Total size of the data in bytes.
+
+        Returns:
+            dict: The server's confirmation.
+        """
+        stream_id, queue = self._open_stream()
+        try:
+            await self._send(FRAME_PUT, stream_id, json.dumps({'identifier': identifier, 'size': size}).encode('utf-8'))
+            skip = (await self._expect(queue, FRAME_OK))['offset']
+            for chunk in chunks:
+                chunk = memoryview(chunk).cast('B')
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                chunk, skip = chunk[skip:], 0
+                for start in range(0, len(chunk), self.chunk_size):
+                    await self._send(FRAME_DATA, stream_id, chunk[start:start + self.chunk_size])
+                if not queue.empty():  # The server rejected the upload part way through
+                    break
+            await self._send(FRAME_END, stream_id)
+            return await self._expect(queue, FRAME_OK)
+        finally:
+            self.streams.pop(stream_id, None)
+
+    async def download(self, identifier: str, offset: int = 0) -> AsyncIterator[bytes]:
+        """
+        Downloads data chunk by chunk.
+
+        Args:
+            identifier (str): The unique identifier for the data.
+            offset (int): Byte position to start from, e.g. after an interrupted download.
+
+        Yields:
+            bytes: Consecutive chunks of the data.
+        """
+        stream_id, queue = self._open_stream()
+        try:
+            request = {'identifier': identifier, 'offset': offset, 'chunk_size': self.chunk_size}
+            await self._send(FRAME_GET, stream_id, json.dumps(request).encode('utf-8'))
+            while True:
+                kind, payload = await queue.get()
+                if kind == FRAME_DATA:
+                    yield payload
+                elif kind == FRAME_END:
+                    return
+                else:
+                    raise StreamProtocolError(self._error(kind, payload))
+        finally:
+            self.streams.pop(stream_id, None)
+            while not queue.empty():  # Unblock the receiver if the download was abandoned
+                queue.get_nowait()
+
+    async def download_bytes(self, identifier: str, offset: int = 0) -> bytes:
+        """
+        Downloads data into memory; convenient for small objects.
+        """
+        return b''.join([chunk async for chunk in self.download(identifier, offset)])
+
+    def _open_stream(self) -> Tuple[int, asyncio.Queue]:
+        stream_id = self.next_stream_id
+        self.next_stream_id += 1
+        queue = asyncio.Queue(self.max_pending_chunks)
+        self.streams[stream_id] = queue
+        return stream_id, queue
+
+    async def _send(self, kind: int, stream_id: int, payload: bytes = b''):
+        async with self.write_lock:
+            self.writer.write(encode_stream_frame(kind, stream_id, payload))
+            await self.writer.drain()
+
+    async def _expect(self, queue: asyncio.Queue, expected: int) -> dict:
+        kind, payload = await queue.get()
+        if kind != expected:
+            raise StreamProtocolError(self._error(kind, payload))
+        return json.loads(payload.decode('utf-8'))
+
+    @staticmethod
+    def _error(kind: int, payload: bytes) -> str:
+        if kind == FRAME_ERROR:
+            return json.loads(payload.decode('utf-8')).get('error', 'Unknown error')
+        return f"Unexpected frame kind {kind}."
+
+    async def _receive(self):
+        try:
+            while True:
+                kind, stream_id, payload = await read_stream_frame(self.reader)
+                queue = self.streams.get(stream_id)
+                if queue is not None:
+                    await queue.put((kind, payload))
+        except (asyncio.IncompleteReadError, ConnectionError, StreamProtocolError) as e:
+            error = (FRAME_ERROR, json.dumps({'error': f"Connection lost: {e!r}"}).encode('utf-8'))
+            for queue in self.streams.values():
+                while queue.full():  # The transfer has failed, so its buffered chunks are moot
+                    queue.get_nowait()
+                queue.put_nowait(error)
@@ -1,5 +1,8 @@
 import numpy as np
 import logging
+import time
+from typing import Iterator, Optional
+from .page_file_backend import PageFileBackend
 
 class HolographicStorage:
     """
@@ -7,19 +10,26 @@ class HolographicStorage:
 
     Attributes:
         storage_capacity (int): The maximum capacity of the holographic storage in bytes.
-        stored_data (dict): A dictionary to hold the stored holographic data.
+        stored_data (dict): A dictionary to hold the stored holographic data, or the page file
+            backend when the storage is disk-backed.
     """
 
-    def __init__(self, storage_capacity: int):
+    def __init__(self, storage_capacity: int, storage_path: Optional[str] = None,
+                 page_file_size: int = 256 * 1024 * 1024):
         """
         Initializes the HolographicStorage instance.
 
         Args:
             storage_capacity (int): The maximum capacity of the holographic storage in bytes.
+            storage_path (str, optional): Directory for memory-mapped page files. When given, data
+                lives on disk rather than in RAM and is reloaded on restart.
+            page_file_size (int): Size of each page file in bytes (disk-backed storage only).
         """
         self.storage_capacity = storage_capacity
-        self.stored_data = {}
-        self.current_usage = 0
+        self.backend = PageFileBackend(storage_path, page_file_size) if storage_path else None
+        self.stored_data = self.backend if self.backend is not None else {}
+        self.current_usage = self.backend.used_bytes if self.backend is not None else 0
+        self.reserved = 0  # Capacity held by open StreamWriters
         logging.basicConfig(level=logging.INFO)
 
     def encode_data(self, data: bytes) -> np.ndarray:
@@ -50,12 +60,16 @@ class HolographicStorage:
         encoded_data = self.encode_data(data)
         data_size = encoded_data.nbytes
 
-        if self.current_usage + data_size > self.storage_capacity:
+        if not self._fits(identifier, data_size):
             logging.warning("Not enough storage capacity to store the data.")
             return False
 
-        self.stored_data[identifier] = encoded_data
-        self.current_usage += data_size
+        if self.backend is not None:
+            self.backend.write(identifier, encoded_data)
+            self.current_usage = self.backend.used_bytes
+        else:
+            self.current_usage += data_size - self._stored_size(identifier)
+            self.stored_data[identifier] = encoded_data
         logging.info(f"Stored data with identifier '{identifier}'. Current usage: {self.current_usage}/{self.storage_capacity} bytes.")
         return True
 
@@ -69,14 +83,89 @@ class HolographicStorage:
         Returns:
             bytes: The retrieved data in its original format.
         """
-        if identifier not in self.stored_data:
-            logging.error(f"No data found with identifier '{identifier}'.")
+        encoded_data = self.retrieve_view(identifier)
+        if encoded_data is None:
             return None
 
-        encoded_data = self.stored_data[identifier]
         # Example decoding logic (this should be replaced with actual holographic decoding)
         return encoded_data.tobytes()
 
+    def retrieve_view(self, identifier: str) -> Optional[np.ndarray]:
+        """
+        Retrieves stored data without copying it.
+
+        For disk-backed storage the array maps the page file directly, so it must not be used
+        after the data is overwritten or removed. It stays readable after the storage is closed.
+
+        Args:
+            identifier (str): The unique identifier for the data.
+
+        Returns:
+            np.ndarray: A read-only view of the encoded data, or None if it is not stored.
+        """
+        if identifier not in self.stored_data:
+            logging.error(f"No data found with identifier '{identifier}'.")
+            return None
+        if self.backend is not None:
+            return self.backend.array(identifier).reshape(-1, 1)
+        return self.stored_data[identifier]
+
+    def stream_data(self, identifier: str, chunk_size: int = 1024 * 1024, offset: int = 0) -> Iterator[memoryview]:
+        """
+        Yields stored data in chunks, so large objects can be sent without materializing them.
+
+        Args:
+            identifier (str): The unique identifier for the data.
+            chunk_size (int): Maximum bytes per chunk.
+            offset (int): Byte position to start from, e.g. to resume an interrupted transfer.
+
+        Returns:
+            Iterator[memoryview]: Zero-copy slices of the data.
+        """
+        if identifier not in self.stored_data:
+            raise KeyError(identifier)
+        if self.backend is not None:
+            return self.backend.iter_chunks(identifier, chunk_size, offset)
+        view = memoryview(self.stored_data[identifier]).cast('B')
+        return (view[start:start + chunk_size] for start in range(offset, len(view), chunk_size))
+
+    def open_writer(self, identifier: str, size: int) -> Optional['StreamWriter']:
+        """
+        Starts storing an object of known size piece by piece, e.g. from a network upload.
+
+        Disk-backed storage writes each piece straight into the page file; in-memory storage
+        fills a preallocated array. The object is stored only when the writer is committed.
+        Its capacity is reserved until then, so concurrent writers cannot overcommit storage.
+
+        Args:
+            identifier (str): A unique identifier for the data.
+            size (int): Total size of the data in bytes.
+
+        Returns:
+            StreamWriter: The writer, or None if the data would not fit.
+
+        Raises:
+            ValueError: If size is negative.
+        """
+        if size < 0:
+            raise ValueError(f"Data size must not be negative, got {size}.")
+        if not self._fits(identifier, size):
+            logging.warning("Not enough storage capacity to store the data.")
+            return None
+        writer = StreamWriter(self, identifier, size)
+        self.reserved += size
+        return writer
+
+    def _fits(self, identifier: str, size: int) -> bool:
+        return self.current_usage + self.reserved - self._stored_size(identifier) + size <= self.storage_capacity
+
+    def _stored_size(self, identifier: str) -> int:
+        """Size of the data currently stored under `identifier`, which a replacement frees."""
+        if self.backend is not None:
+            return self.backend.size_of(identifier) or 0
+        existing = self.stored_data.get(identifier)
+        return 0 if existing is None else existing.nbytes
+
     def get_storage_usage(self) -> int:
         """
         Returns the current storage usage.
@@ -93,3 +182,112 @@ class HolographicStorage:
         self.stored_data.clear()
         self.current_usage = 0
         logging.info("Cleared all stored data from holographic storage.")
+
+    def close(self):
+        """
+        Flushes and unmaps disk-backed storage; a no-op for in-memory storage.
+
+        Arrays from `retrieve_view` and chunks from `stream_data` may still be alive: they stay
+        readable, and their page file is unmapped once the last of them is released.
+        """
+        if self.backend is not None:
+            self.backend.close()
+
+
+class StreamWriter:
+    """
+    Receives one object for HolographicStorage in pieces.
+
+    Attributes:
+        identifier (str): Identifier the data will be stored under.
+        size (int): Total size of the data in bytes.
+        written (int): Bytes received so far; an interrupted transfer resumes from here.
+        closed (bool): True once the writer has been committed or aborted; it accepts no more calls.
+        last_active (float): time.monotonic() of the last write, for expiring abandoned writers.
+    """
+
+    def __init__(self, storage: HolographicStorage, identifier: str, size: int):
+        self.storage = storage
+        self.identifier = identifier
+        self.size = size
+        self.written = 0
+        self.last_active = time.monotonic()
+        self.closed = False
+        if storage.backend is not None:
+            self.extent = storage.backend.open_writer(identifier, size)
+            self.buffer = None
+        else:
+            self.extent = None
+            self.buffer = np.empty(size, dtype=np.uint8)
+
+    def write(self, data: bytes) -> int:
+        """
+        Appends the next piece of data.
+
+        Args:
+            data (bytes): Bytes following those already written.
+
+        Returns:
+            int: The number of bytes written so far.
+        """
+        if self.closed:
+            raise ValueError(f"Writer for '{self.identifier}' is already closed.")
+        chunk = memoryview(data).cast('B')
+        if self.written + len(chunk) > self.size:
+            raise ValueError(f"Write of {len(chunk)} bytes at {self.written} exceeds data size {self.size}.")
+        if self.extent is not None:
+            self.extent.write(chunk)
+        else:
+            self.buffer[self.written:self.written + len(chunk)] = np.frombuffer(chunk, dtype=np.uint8)
+        self.written += len(chunk)
+        self.last_active = time.monotonic()
+        return self.written
+
+    def commit(self) -> bool:
+        """
+        Stores the received data under its identifier.
+
+        Returns:
+            bool: True if the data was complete and still fits, False otherwise. A writer that
+            fails the capacity check is aborted.
+        """
+        storage = self.storage
+        if self.closed:
+            logging.warning(f"Writer for '{self.identifier}' is already closed.")
+            return False
+        if self.written != self.size:
+            logging.warning(f"Incomplete data for '{self.identifier}': {self.written}/{self.size} bytes.")
+            return False
+        self._release()
+        if not storage._fits(self.identifier, self.size):
+            logging.warning("Not enough storage capacity to store the data.")
+            self._discard()
+            return False
+        if self.extent is not None:
+            self.extent.commit()
+            storage.current_usage = storage.backend.used_bytes
+        else:
+            storage.current_usage += self.size - storage._stored_size(self.identifier)
+            storage.stored_data[self.identifier] = self.buffer.reshape(-1, 1)
+        logging.info(f"Stored data with identifier '{self.identifier}'. "
+                     f"Current usage: {storage.current_usage}/{storage.storage_capacity} bytes.")
+        return True
+
+    def abort(self):
+        """
+        Discards the received data.
+        """
+        if not self.closed:
+            self._release()
+            self._discard()
+
+    def _release(self):
+        """Closes the writer and returns its reserved capacity to the storage."""
+        if not self.closed:
+            self.closed = True
+            self.storage.reserved -= self.size
+
+    def _discard(self):
+        if self.extent is not None:
+            self.extent.abort()
+        self.buffer = None
@@ -0,0 +1,324 @@
+import bisect
+import json
+import logging
+import mmap
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+INDEX_JOURNAL = 'index.log'
+PAGE_FILE_PATTERN = 'pages_{:05d}.dat'
+
+
+class FreeSpace:
+    """
+    First-fit allocator over one page file, tracking free (offset, size) runs sorted by offset
+    and coalescing neighbours when space is released.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.runs: List[List[int]] = [[0, size]] if size else []
+
+    @property
+    def free_bytes(self) -> int:
+        return sum(size for _, size in self.runs)
+
+    def allocate(self, size: int) -> Optional[int]:
+        for position, (offset, run_size) in enumerate(self.runs):
+            if run_size >= size:
+                if run_size == size:
+                    del self.runs[position]
+                else:
+                    self.runs[position] = [offset + size, run_size - size]
+                return offset
+        return None
+
+    def reserve(self, offset: int, size: int):
+        """Mark a specific range as used (when rebuilding from the index)."""
+        position = bisect.bisect_right(self.runs, [offset, float('inf')]) - 1
+        run_offset, run_size = self.runs[position]
+        if not (run_offset <= offset and offset + size <= run_offset + run_size):
+            raise ValueError(f"Extent {offset}+{size} overlaps allocated space.")
+        pieces = [[run_offset, offset - run_offset], [offset + size, run_offset + run_size - offset - size]]
+        self.runs[position:position + 1] = [piece for piece in pieces if piece[1] > 0]
+
+    def release(self, offset: int, size: int):
+        position = bisect.bisect_left(self.runs, [offset, 0])
+        self.runs.insert(position, [offset, size])
+        if position + 1 < len(self.runs) and offset + size == self.runs[position + 1][0]:
+            self.runs[position][1] += self.runs.pop(position + 1)[1]
+        if position > 0 and self.runs[position - 1][0] + self.runs[position - 1][1] == offset:
+            self.runs[position - 1][1] += self.runs.pop(position)[1]
+
+
+class PageFileBackend:
+    """
+    Stores blobs in memory-mapped page files so that holdings can exceed RAM and survive restarts.
+
+    Each blob occupies one contiguous extent (page file, offset, length), rounded up to
+    `block_size`. Page files are `page_file_size` bytes; a blob larger than that gets a page
+    file of its own. The identifier -> extent index is kept in memory and persisted as an
+    append-only journal, which is compacted when reopened. Free space is rebuilt from the
+    index on open. An extent being streamed by `iter_chunks` is pinned: if its blob is
+    deleted or overwritten meanwhile, the space is released only when the stream finishes.
+
+    Attributes:
+        path (str): Directory holding the page files and index journal.
+        index (dict): Identifier -> (page file number, offset, length).
+    """
+
+    def __init__(self, path: str, page_file_size: int = 256 * 1024 * 1024, block_size: int = 4096):
+        """
+        Opens (or creates) a page file store.
+
+        Args:
+            path (str): Directory for page files.
+            page_file_size (int): Size of each regular page file in bytes.
+            block_size (int): Allocation granularity in bytes.
+        """
+        self.path = path
+        self.block_size = block_size
+        self.page_file_size = self._round_up(page_file_size)
+        self.index: Dict[str, Tuple[int, int, int]] = {}
+        self.maps: Dict[int, mmap.mmap] = {}
+        self.free: Dict[int, FreeSpace] = {}
+        self.pins: Dict[Tuple[int, int], int] = {}  # (page file, offset) -> active streams
+        self.deferred: Dict[Tuple[int, int], int] = {}  # Pinned extents released meanwhile -> length
+        os.makedirs(path, exist_ok=True)
+        self._open()
+
+    # Lookups
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def size_of(self, identifier: str) -> Optional[int]:
+        extent = self.index.get(identifier)
+        return None if extent is None else extent[2]
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(length for _, _, length in self.index.values())
+
+    def view(self, identifier: str) -> Optional[memoryview]:
+        """
+        Returns a read-only, zero-copy view of a blob.
+
+        The view reflects the blob only until it is deleted or overwritten. Views that outlive
+        `close` stay readable; their page file is unmapped when the last one is released.
+        """
+        extent = self.index.get(identifier)
+        if extent is None:
+            return None
+        number, offset, length = extent
+        return memoryview(self.maps[number])[offset:offset + length].toreadonly()
+
+    def array(self, identifier: str) -> Optional[np.ndarray]:
+        """Returns a zero-copy uint8 array over a blob."""
+        view = self.view(identifier)
+        return None if view is None else np.frombuffer(view, dtype=np.uint8)
+
+    def iter_chunks(self, identifier: str, chunk_size: int = 1024 * 1024, offset: int = 0) -> Iterator[memoryview]:
+        """
+        Yields zero-copy slices of a blob, starting at `offset`, for streaming large objects.
+
+        The extent is pinned from the first slice until the generator finishes or is closed, so
+        the slices stay intact even if the blob is overwritten while it is being sent.
+        """
+        extent = self.index.get(identifier)
+        if extent is None:
+            raise KeyError(identifier)
+        number, start, length = extent
+        key = (number, start)
+        self.pins[key] = self.pins.get(key, 0) + 1
+        try:
+            view = memoryview(self.maps[number])[start:start + length].toreadonly()
+            for position in range(offset, length, chunk_size):
+                yield view[position:position + chunk_size]
+        finally:
+            self.pins[key] -= 1
+            if not self.pins[key]:
+                del self.pins[key]
+                if key in self.deferred:
+                    self._release(number, start, self.deferred.pop(key))
+
+    # Writes
+
+    def write(self, identifier: str, data) -> None:
+        """Stores a bytes-like object under `identifier`, replacing any existing blob."""
+        source = memoryview(data).cast('B')
+        writer = self.open_writer(identifier, len(source))
+        writer.write_at(0, source)
+        writer.commit()
+
+    def open_writer(self, identifier: str, size: int) -> 'ExtentWriter':
+        """
+        Allocates an extent for a blob of `size` bytes that can be filled piece by piece.
+
+        The blob becomes visible under `identifier` only when the writer is committed.
+        """
+        return ExtentWriter(self, identifier, *self._allocate(size), size)
+
+    def delete(self, identifier: str) -> bool:
+        extent = self.index.pop(identifier, None)
+        if extent is None:
+            return False
+        self._journal({'op': 'delete', 'id': identifier})
+        self._release(*extent)
+        return True
+
+    def clear(self):
+        for identifier in list(self.index):
+            self.delete(identifier)
+
+    def flush(self):
+        for page_map in self.maps.values():
+            page_map.flush()
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+    def close(self):
+        """Flushes and unmaps the page files; mappings still exported by live views are left to them."""
+        self.flush()
+        self._journal_file.close()
+        for number, page_map in self.maps.items():
+            try:
+                page_map.close()
+            except BufferError:
+                logging.debug(f"Page file {number} still has live views; it is unmapped when they are released.")
+        self.maps.clear()
+
+    # Internals
+
+    def _round_up(self, size: int) -> int:
+        return max(self.block_size, -(-size // self.block_size) * self.block_size)
+
+    def _page_path(self, number: int) -> str:
+        return os.path.join(self.path, PAGE_FILE_PATTERN.format(number))
+
+    def _allocate(self, size: int) -> Tuple[int, int]:
+        needed = self._round_up(size)
+        for number, space in self.free.items():
+            offset = space.allocate(needed)
+            if offset is not None:
+                return number, offset
+        number = max(self.maps, default=-1) + 1
+        self._create_page_file(number, max(self.page_file_size, needed))
+        return number, self.free[number].allocate(needed)
+
+    def _release(self, number: int, offset: int, length: int):
+        if (number, offset) in self.pins:
+            self.deferred[(number, offset)] = length
+            return
+        self.free[number].release(offset, self._round_up(length))
+
+    def _create_page_file(self, number: int, size: int):
+        with open(self._page_path(number), 'wb') as file:
+            file.truncate(size)
+        self._map_page_file(number)
+
+    def _map_page_file(self, number: int):
+        with open(self._page_path(number), 'r+b') as file:
+            size = os.fstat(file.fileno()).st_size
+            self.maps[number] = mmap.mmap(file.fileno(), size)
+        self.free[number] = FreeSpace(size)
+
+    def _commit(self, identifier: str, number: int, offset: int, length: int):
+        self.maps[number].flush()  # Data reaches the page file before the index points at it
+        previous = self.index.get(identifier)
+        self.index[identifier] = (number, offset, length)
+        self._journal({'op': 'put', 'id': identifier, 'page': number, 'offset': offset, 'length': length})
+        if previous is not None:
+            self._release(*previous)
+
+    def _journal(self, record: dict):
+        self._journal_file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+    def _open(self):
+        for name in sorted(os.listdir(self.path)):
+            if name.startswith('pages_') and name.endswith('.dat'):
+                self._map_page_file(int(name[len('pages_'):-len('.dat')]))
+
+        journal_path = os.path.join(self.path, INDEX_JOURNAL)
+        records = 0
+        if os.path.exists(journal_path):
+            with open(journal_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # Torn final record
+                    records += 1
+                    if record['op'] == 'put':
+                        self.index[record['id']] = (record['page'], record['offset'], record['length'])
+                    else:
+                        self.index.pop(record['id'], None)
+        for number, offset, length in self.index.values():
+            self.free[number].reserve(offset, self._round_up(length))
+
+        # Rewrite the journal with one record per live blob
+        temporary = journal_path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            for identifier, (number, offset, length) in self.index.items():
+                file.write(json.dumps({'op': 'put', 'id': identifier, 'page': number, 'offset': offset,
+                                       'length': length}, separators=(',', ':')) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, journal_path)
+        self._journal_file = open(journal_path, 'a', encoding='utf-8')
+        logging.info(f"Opened page file store at {self.path}: {len(self.index)} blobs, "
+                     f"{records - len(self.index)} stale journal records dropped.")
+
+
+class ExtentWriter:
+    """
+    Fills an allocated extent piece by piece (e.g. an upload that may be resumed), then publishes it.
+
+    Attributes:
+        written (int): Length of the prefix written so far; a resumed upload continues from here.
+    """
+
+    def __init__(self, backend: PageFileBackend, identifier: str, number: int, offset: int, size: int):
+        self.backend = backend
+        self.identifier = identifier
+        self.number = number
+        self.offset = offset
+        self.size = size
+        self.written = 0
+        self.done = False
+
+    def write_at(self, position: int, data) -> int:
+        """Copies `data` into the extent at `position`; returns the new contiguous end."""
+        if self.done:
+            raise ValueError(f"Writer for '{self.identifier}' is already committed or aborted.")
+        chunk = memoryview(data).cast('B')
+        if position < 0 or position + len(chunk) > self.size:
+            raise ValueError(f"Write of {len(chunk)} bytes at {position} exceeds blob size {self.size}.")
+        start = self.offset + position
+        self.backend.maps[self.number][start:start + len(chunk)] = chunk
+        if position <= self.written:
+            self.written = max(self.written, position + len(chunk))
+        return self.written
+
+    def write(self, data) -> int:
+        """Appends `data` after the contiguous end."""
+        return self.write_at(self.written, data)
+
+    def commit(self):
+        """Publishes the blob under its identifier."""
+        if self.done:
+            raise ValueError(f"Writer for '{self.identifier}' is already committed or aborted.")
+        self.backend._commit(self.identifier, self.number, self.offset, self.size)
+        self.done = True
+
+    def abort(self):
+        """Releases the extent without publishing it."""
+        if not self.done:
+            self.backend._release(self.number, self.offset, self.size)
+            self.done = True
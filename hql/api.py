@@ -47,8 +47,12 @@ def retrieve_data(key):
 
 @app.route('/export', methods=['GET'])
 def export_data():
-    """Export the entire data store to a JSON file."""
+    """Export the entire data store to a JSON file, or return the values for `keys` in one batch."""
+    keys = request.args.get('keys')
     try:
+        if keys:
+            values = ledger.retrieve_many(keys.split(','))
+            return jsonify({"entries": values}), 200
         ledger.export_data()
         return jsonify({"message": "Data exported successfully."}), 200
     except Exception as e:
@@ -57,10 +61,16 @@ def export_data():
 
 @app.route('/import', methods=['POST'])
 def import_data():
-    """Import data from a JSON file into the ledger."""
+    """Import data from a JSON file into the ledger, or store the posted `entries` in one batch."""
+    entries = request.json.get('entries')
     filename = request.json.get('filename', Config.DEFAULTS["LEDGER_FILENAME"])
     
     try:
+        if entries is not None:
+            if not isinstance(entries, dict) or not all(isinstance(value, str) for value in entries.values()):
+                return jsonify({"error": "Entries must map keys to string values."}), 400
+            count = ledger.store_many(entries)
+            return jsonify({"message": f"Imported {count} entries."}), 200
         ledger.import_data(filename)
         return jsonify({"message": "Data imported successfully."}), 200
     except Exception as e:
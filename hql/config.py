@@ -9,6 +9,8 @@ class Config:
     DEFAULTS = {
         "DATA_STORAGE_FORMAT": "json",  # Options: json, csv
         "LEDGER_FILENAME": "hql_data.json",  # Default filename for the ledger data
+        "SNAPSHOT_FILENAME": "hql_data.snapshot",  # Default filename for binary ledger snapshots
+        "SNAPSHOT_DELTA_FILENAME": "hql_data.snapshot.delta",  # Default filename for incremental snapshots
         "LOGGING_ENABLED": True,
         "LOGGING_LEVEL": "DEBUG",  # Options: DEBUG, INFO, WARNING, ERROR, CRITICAL
         "QUANTUM_ENCODING_METHOD": "basic",  # Options: basic, advanced
@@ -1,14 +1,51 @@
 # hql/holographic_ledger.py
 
+import heapq
 import json
 import logging
+import os
+import struct
 from .quantum_interference import QuantumInterference
 from .config import Config
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+# Binary snapshot: magic, format version, snapshot kind, record count, then one record per entry.
+SNAPSHOT_MAGIC = b'HQLS'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('>4sBBI')
+SNAPSHOT_FULL = 0
+SNAPSHOT_INCREMENTAL = 1
+# Record: op, timestamp kind, timestamp (microseconds since the epoch), UTC offset (seconds), key and data lengths
+RECORD_HEADER = struct.Struct('>BBqiII')
+RECORD_PUT = 0
+RECORD_DELETE = 1
+TIMESTAMP_NAIVE = 0
+TIMESTAMP_AWARE = 1
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _pack_timestamp(timestamp):
+    """Split a datetime into (kind, microseconds since the epoch, UTC offset in seconds) without loss."""
+    if timestamp.tzinfo is None:
+        return TIMESTAMP_NAIVE, (timestamp - _EPOCH) // timedelta(microseconds=1), 0
+    offset = timestamp.utcoffset()
+    local = timestamp.replace(tzinfo=None)
+    return TIMESTAMP_AWARE, (local - _EPOCH) // timedelta(microseconds=1), int(offset.total_seconds())
+
+
+def _unpack_timestamp(kind, micros, offset):
+    local = _EPOCH + timedelta(microseconds=micros)
+    if kind == TIMESTAMP_NAIVE:
+        return local
+    return local.replace(tzinfo=timezone(timedelta(seconds=offset)))
+
 
 class HolographicQuantumLedger:
     def __init__(self):
         self.data_store = {}
+        self.expiry_heap = []  # (POSIX time, sequence, key); entries whose key was re-stored or removed are stale
+        self.sequence = 0
+        self.changed_keys = set()  # Keys stored or removed since the last full snapshot
         self.quantum_interference = QuantumInterference()
         self.load_data()
         logging.info("Holographic Quantum Ledger initialized.")
@@ -23,11 +60,47 @@ class HolographicQuantumLedger:
             self.cleanup_old_entries()
         
         holographic_data = self.quantum_interference.encode(value)
+        self._put(key, holographic_data, datetime.now())
+        logging.info(f"Data stored under key '{key}'.")
+
+    def store_many(self, entries):
+        """
+        Store a batch of values, encoding them together.
+        :param entries: Mapping or iterable of (key, value) pairs.
+        :return: The number of entries stored.
+        """
+        items = list(entries.items() if isinstance(entries, dict) else entries)
+        if len(self.data_store) + len(items) > Config.DEFAULTS["MAX_DATA_ENTRIES"]:
+            self.cleanup_old_entries()
+
+        encoded = self.quantum_interference.encode_many([value for _, value in items])
+        timestamp = datetime.now()
+        for (key, _), holographic_data in zip(items, encoded):
+            self._put(key, holographic_data, timestamp)
+        logging.info(f"Stored {len(items)} entries.")
+        return len(items)
+
+    def _put(self, key, holographic_data, timestamp):
         self.data_store[key] = {
             "data": holographic_data,
-            "timestamp": datetime.now()
+            "timestamp": timestamp
         }
-        logging.info(f"Data stored under key '{key}'.")
+        self.sequence += 1
+        heapq.heappush(self.expiry_heap, (timestamp.timestamp(), self.sequence, key))
+        self.changed_keys.add(key)
+        if len(self.expiry_heap) > 2 * len(self.data_store) + 64:
+            self._rebuild_expiry_heap()
+
+    def _remove(self, key):
+        del self.data_store[key]
+        self.changed_keys.add(key)
+
+    def _rebuild_expiry_heap(self):
+        """Drop stale heap entries once they outnumber live ones."""
+        self.expiry_heap = [(entry["timestamp"].timestamp(), sequence, key)
+                            for sequence, (key, entry) in enumerate(self.data_store.items())]
+        heapq.heapify(self.expiry_heap)
+        self.sequence = len(self.expiry_heap)
 
     def retrieve_data(self, key):
         """
@@ -44,6 +117,20 @@ class HolographicQuantumLedger:
             logging.warning(f"No data found for key '{key}'.")
             return None
 
+    def retrieve_many(self, keys):
+        """
+        Retrieve a batch of values, decoding them together.
+        :param keys: Iterable of keys.
+        :return: Dict of key to value, with None for keys that are not found.
+        """
+        keys = list(keys)
+        found = [key for key in keys if key in self.data_store]
+        values = self.quantum_interference.decode_many([self.data_store[key]["data"] for key in found])
+        results = dict.fromkeys(keys)
+        results.update(zip(found, values))
+        logging.info(f"Retrieved {len(found)} of {len(keys)} requested entries.")
+        return results
+
     def export_data(self, filename=None):
         """
         Export the entire data store to a JSON file.
@@ -53,7 +140,8 @@ class HolographicQuantumLedger:
             filename = Config.DEFAULTS["LEDGER_FILENAME"]
         
         with open(filename, 'w') as f:
-            json.dump(self.data_store, f, default=str)
+            json.dump({key: {"data": entry["data"], "timestamp": entry["timestamp"].isoformat()}
+                       for key, entry in self.data_store.items()}, f)
         logging.info(f"Data exported to {filename}.")
 
     def import_data(self, filename=None):
@@ -65,29 +153,118 @@ class HolographicQuantumLedger:
             filename = Config.DEFAULTS["LEDGER_FILENAME"]
         
         with open(filename, 'r') as f:
-            self.data_store = json.load(f)
-            # Decode the holographic data
-            for key, entry in self.data_store.items():
-                entry["data"] = self.quantum_interference.decode(entry["data"])
+            entries = json.load(f)
+        self.data_store = {}
+        self.expiry_heap = []
+        # Entries stay in their holographic form; retrieve_data decodes them
+        for key, entry in entries.items():
+            self._put(key, entry["data"], datetime.fromisoformat(entry["timestamp"]))
+        self.changed_keys.clear()
         logging.info(f"Data imported from {filename}.")
 
+    def export_snapshot(self, filename=None, incremental=False):
+        """
+        Write a binary snapshot with typed timestamps.
+        Incremental snapshots are cumulative: each holds every entry stored or removed since the
+        last full snapshot, so the latest one alone brings that snapshot up to date.
+        :param filename: The file to write. Defaults to the configured snapshot filename, or for an
+                         incremental snapshot the configured delta filename, which load_data applies
+                         after the full snapshot. A full snapshot written to the default filename
+                         removes the default delta, which it supersedes.
+        :param incremental: Write only the entries stored or removed since the last full snapshot,
+                            to be applied on top of it with import_snapshot.
+        :return: The number of records written.
+        """
+        if filename is None:
+            filename = Config.DEFAULTS["SNAPSHOT_DELTA_FILENAME" if incremental else "SNAPSHOT_FILENAME"]
+        keys = sorted(self.changed_keys) if incremental else list(self.data_store)
+        temporary = filename + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                         SNAPSHOT_INCREMENTAL if incremental else SNAPSHOT_FULL, len(keys)))
+            for key in keys:
+                encoded_key = key.encode('utf-8')
+                entry = self.data_store.get(key)
+                if entry is None:
+                    f.write(RECORD_HEADER.pack(RECORD_DELETE, TIMESTAMP_NAIVE, 0, 0, len(encoded_key), 0))
+                    f.write(encoded_key)
+                    continue
+                data = entry["data"].encode('utf-8')
+                f.write(RECORD_HEADER.pack(RECORD_PUT, *_pack_timestamp(entry["timestamp"]), len(encoded_key), len(data)))
+                f.write(encoded_key)
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, filename)  # A crash mid-export leaves the previous snapshot intact
+        if not incremental:
+            self.changed_keys.clear()
+            delta_filename = Config.DEFAULTS["SNAPSHOT_DELTA_FILENAME"]
+            if filename == Config.DEFAULTS["SNAPSHOT_FILENAME"] and os.path.exists(delta_filename):
+                os.remove(delta_filename)
+        logging.info(f"Wrote {'incremental' if incremental else 'full'} snapshot of {len(keys)} records to {filename}.")
+        return len(keys)
+
+    def import_snapshot(self, filename=None):
+        """
+        Load a binary snapshot. A full snapshot replaces the data store; an incremental one is
+        applied on top of it, and its keys still count as changed since the full snapshot.
+        :param filename: The file to read. Defaults to the configured snapshot filename.
+        """
+        if filename is None:
+            filename = Config.DEFAULTS["SNAPSHOT_FILENAME"]
+        with open(filename, 'rb') as f:
+            buffer = f.read()
+        magic, version, kind, count = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{filename} is not a version {SNAPSHOT_VERSION} ledger snapshot.")
+        if kind == SNAPSHOT_FULL:
+            self.data_store = {}
+            self.expiry_heap = []
+        changed = set()
+        offset = SNAPSHOT_HEADER.size
+        for _ in range(count):
+            op, timestamp_kind, micros, utc_offset, key_length, data_length = RECORD_HEADER.unpack_from(buffer, offset)
+            offset += RECORD_HEADER.size
+            key = buffer[offset:offset + key_length].decode('utf-8')
+            offset += key_length
+            changed.add(key)
+            if op == RECORD_DELETE:
+                self.data_store.pop(key, None)
+                continue
+            data = buffer[offset:offset + data_length].decode('utf-8')
+            offset += data_length
+            self._put(key, data, _unpack_timestamp(timestamp_kind, micros, utc_offset))
+        if kind == SNAPSHOT_FULL:
+            self.changed_keys.clear()
+        else:
+            self.changed_keys |= changed  # Removals too, so the next delta still carries them
+        logging.info(f"Loaded {count} records from snapshot {filename}.")
+
     def cleanup_old_entries(self):
         """
         Remove old entries from the data store based on the retention period.
+        Only expired entries are visited, oldest first.
         """
         retention_period = timedelta(days=Config.DEFAULTS["DATA_RETENTION_PERIOD"])
-        cutoff_time = datetime.now() - retention_period
-        keys_to_delete = [key for key, entry in self.data_store.items() if entry["timestamp"] < cutoff_time]
+        cutoff_time = (datetime.now() - retention_period).timestamp()
+        heap = self.expiry_heap
 
-        for key in keys_to_delete:
-            del self.data_store[key]
-            logging.info(f"Removed old entry for key '{key}'.")
+        while heap and heap[0][0] < cutoff_time:
+            expires, _, key = heapq.heappop(heap)
+            entry = self.data_store.get(key)
+            if entry is not None and entry["timestamp"].timestamp() == expires:
+                self._remove(key)
+                logging.info(f"Removed old entry for key '{key}'.")
 
     def load_data(self):
         """
-        Load existing data from the configured ledger file.
+        Load existing data from the configured snapshot and delta, or else the configured ledger file.
         """
-        if os.path.exists(Config.DEFAULTS["LEDGER_FILENAME"]):
+        if os.path.exists(Config.DEFAULTS["SNAPSHOT_FILENAME"]):
+            self.import_snapshot(Config.DEFAULTS["SNAPSHOT_FILENAME"])
+            if os.path.exists(Config.DEFAULTS["SNAPSHOT_DELTA_FILENAME"]):
+                self.import_snapshot(Config.DEFAULTS["SNAPSHOT_DELTA_FILENAME"])
+        elif os.path.exists(Config.DEFAULTS["LEDGER_FILENAME"]):
             self.import_data(Config.DEFAULTS["LEDGER_FILENAME"])
         else:
             logging.info("No existing ledger file found. Starting with an empty ledger.")
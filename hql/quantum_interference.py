@@ -2,8 +2,22 @@
 
 import logging
 import base64
+import binascii
 import numpy as np
 
+
+def _b64encode_many(chunks):
+    """Base64-encode byte strings without the per-call overhead of encode()."""
+    b2a = binascii.b2a_base64
+    return [b2a(chunk, newline=False).decode('ascii') for chunk in chunks]
+
+
+def _b64decode_many(texts):
+    """Base64-decode strings without the per-call overhead of decode()."""
+    a2b = binascii.a2b_base64
+    return [a2b(text) for text in texts]
+
+
 class QuantumInterference:
     def __init__(self):
         logging.info("Quantum Interference module initialized.")
@@ -23,12 +37,15 @@ class QuantumInterference:
             logging.error(f"Unknown encoding method: {method}")
             raise ValueError(f"Unknown encoding method: {method}")
 
-    def decode(self, holographic_data):
+    def decode(self, holographic_data, method='basic'):
         """
         Decode holographic data back to its original form.
         :param holographic_data: The holographic representation to decode.
+        :param method: The encoding method the data was encoded with ('basic' or 'advanced').
         :return: The original data.
         """
+        if method == 'advanced':
+            return self.decode_many([holographic_data], method)[0]
         # Assuming holographic data is base64 encoded
         try:
             decoded_data = base64.b64decode(holographic_data).decode('utf-8')
@@ -38,6 +55,66 @@ class QuantumInterference:
             logging.error(f"Error decoding holographic data: {e}")
             raise
 
+    def encode_many(self, values, method='basic'):
+        """
+        Encode a batch of values; equivalent to calling encode on each.
+        Advanced encoding runs one FFT per distinct value length over all values of that length.
+        :param values: Sequence of strings to encode.
+        :param method: The encoding method to use ('basic' or 'advanced').
+        :return: List of encoded holographic representations, in input order.
+        """
+        raw = [value.encode('utf-8') for value in values]
+        if method == 'basic':
+            return _b64encode_many(raw)
+        if method != 'advanced':
+            logging.error(f"Unknown encoding method: {method}")
+            raise ValueError(f"Unknown encoding method: {method}")
+        # One FFT per distinct length: rows of equal length are transformed together
+        transformed = [None] * len(raw)
+        for length, indices in self._group_by_length(map(len, raw)).items():
+            if length == 0:
+                for i in indices:
+                    transformed[i] = b''
+                continue
+            rows = np.frombuffer(b''.join(raw[i] for i in indices), dtype=np.uint8).reshape(len(indices), length)
+            spectra = np.fft.fft(rows, axis=1)
+            for row, i in enumerate(indices):
+                transformed[i] = spectra[row].tobytes()
+        return _b64encode_many(transformed)
+
+    def decode_many(self, holographic_values, method='basic'):
+        """
+        Decode a batch of holographic representations; advanced decoding batches the inverse FFT.
+        :param holographic_values: Sequence of encoded values.
+        :param method: The encoding method the values were encoded with ('basic' or 'advanced').
+        :return: List of original strings, in input order.
+        """
+        raw = _b64decode_many(holographic_values)
+        if method == 'basic':
+            return [data.decode('utf-8') for data in raw]
+        if method != 'advanced':
+            logging.error(f"Unknown encoding method: {method}")
+            raise ValueError(f"Unknown encoding method: {method}")
+        # Invert the FFT per distinct length; values were bytes, so round back to integers
+        decoded = [None] * len(raw)
+        for length, indices in self._group_by_length(len(data) // 16 for data in raw).items():
+            if length == 0:
+                for i in indices:
+                    decoded[i] = ''
+                continue
+            spectra = np.frombuffer(b''.join(raw[i] for i in indices), dtype=np.complex128).reshape(len(indices), length)
+            rows = np.rint(np.fft.ifft(spectra, axis=1).real).astype(np.uint8)
+            for row, i in enumerate(indices):
+                decoded[i] = rows[row].tobytes().decode('utf-8')
+        return decoded
+
+    @staticmethod
+    def _group_by_length(lengths):
+        groups = {}
+        for index, length in enumerate(lengths):
+            groups.setdefault(length, []).append(index)
+        return groups
+
     def basic_encoding(self, data):
         """
         Basic encoding: Convert data to a base64 representation.
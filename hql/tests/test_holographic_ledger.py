@@ -1,6 +1,7 @@
 # hql/tests/test_holographic_ledger.py
 
 import unittest
+from datetime import datetime, timedelta, timezone
 from hql.holographic_ledger import HolographicQuantumLedger
 from hql.config import Config
 import os
@@ -12,11 +13,18 @@ class TestHolographicQuantumLedger(unittest.TestCase):
         self.test_key = "test_key"
         self.test_value = "This is a test value."
         self.test_filename = "test_hql_data.json"
+        self.snapshot_filename = "test_hql_data.snapshot"
+        self.delta_filename = "test_hql_data.delta"
+        self.retention_period = Config.DEFAULTS["DATA_RETENTION_PERIOD"]
+        self.snapshot_defaults = {name: Config.DEFAULTS[name] for name in ("SNAPSHOT_FILENAME", "SNAPSHOT_DELTA_FILENAME")}
 
     def tearDown(self):
         """Clean up test files after each test."""
-        if os.path.exists(self.test_filename):
-            os.remove(self.test_filename)
+        Config.DEFAULTS["DATA_RETENTION_PERIOD"] = self.retention_period
+        Config.DEFAULTS.update(self.snapshot_defaults)
+        for filename in (self.test_filename, self.snapshot_filename, self.delta_filename):
+            if os.path.exists(filename):
+                os.remove(filename)
 
     def test_store_and_retrieve_data(self):
         """Test storing and retrieving data."""
@@ -43,5 +51,77 @@ class TestHolographicQuantumLedger(unittest.TestCase):
         retrieved_value = self.ledger.retrieve_data(self.test_key)
         self.assertIsNone(retrieved_value)
 
+    def test_cleanup_skips_live_and_restored_entries(self):
+        """Test that expiry pops only old entries and ignores keys stored again since."""
+        Config.DEFAULTS["DATA_RETENTION_PERIOD"] = 1
+        old = datetime.now() - timedelta(days=2)
+        for i in range(5):
+            self.ledger._put(f"old{i}", self.ledger.quantum_interference.encode("old"), old)
+        self.ledger.store_data("old0", "fresh")
+        self.ledger.store_data("new", "fresh")
+        self.ledger.cleanup_old_entries()
+        self.assertEqual(sorted(self.ledger.data_store), ["new", "old0"])
+        self.assertEqual(self.ledger.retrieve_data("old0"), "fresh")
+        self.assertEqual(len(self.ledger.expiry_heap), 2)
+
+    def test_export_import_keeps_timestamps_typed(self):
+        """Test that JSON and binary round trips restore datetimes, not strings."""
+        self.ledger.store_data(self.test_key, self.test_value)
+        aware = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone(timedelta(hours=7)))
+        self.ledger._put("aware", self.ledger.quantum_interference.encode("x"), aware)
+        self.ledger.export_data(self.test_filename)
+        self.ledger.export_snapshot(self.snapshot_filename)
+        for load in ("import_data", "import_snapshot"):
+            new_ledger = HolographicQuantumLedger()
+            getattr(new_ledger, load)(self.test_filename if load == "import_data" else self.snapshot_filename)
+            self.assertEqual(new_ledger.data_store["aware"]["timestamp"], aware)
+            self.assertIsInstance(new_ledger.data_store[self.test_key]["timestamp"], datetime)
+            self.assertEqual(new_ledger.retrieve_data(self.test_key), self.test_value)
+
+    def test_incremental_snapshot(self):
+        """Test that an incremental snapshot holds only changes and applies on top of the full one."""
+        for i in range(10):
+            self.ledger.store_data(f"k{i}", f"v{i}")
+        self.ledger.export_snapshot(self.snapshot_filename)
+        self.ledger.store_data("k1", "updated")
+        self.ledger.store_data("k10", "added")
+        self.ledger._remove("k2")
+        self.assertEqual(self.ledger.export_snapshot(self.delta_filename, incremental=True), 3)
+
+        restored = HolographicQuantumLedger()
+        restored.import_snapshot(self.snapshot_filename)
+        restored.import_snapshot(self.delta_filename)
+        self.assertEqual(sorted(restored.data_store), sorted(self.ledger.data_store))
+        self.assertEqual(restored.retrieve_data("k1"), "updated")
+        self.assertIsNone(restored.retrieve_data("k2"))
+
+    def test_default_snapshot_files(self):
+        """Test that deltas do not overwrite the full snapshot and that load_data applies both."""
+        Config.DEFAULTS["SNAPSHOT_FILENAME"] = self.snapshot_filename
+        Config.DEFAULTS["SNAPSHOT_DELTA_FILENAME"] = self.delta_filename
+        for i in range(10):
+            self.ledger.store_data(f"k{i}", f"v{i}")
+        self.ledger.export_snapshot()
+        self.ledger.store_data("k1", "updated")
+        self.ledger.export_snapshot(incremental=True)
+        self.ledger._remove("k2")
+        self.assertEqual(self.ledger.export_snapshot(incremental=True), 2)  # Cumulative since the full one
+
+        restored = HolographicQuantumLedger()
+        self.assertEqual(sorted(restored.data_store), sorted(self.ledger.data_store))
+        self.assertEqual(restored.retrieve_data("k1"), "updated")
+        restored.store_data("k3", "again")
+        self.assertEqual(restored.export_snapshot(incremental=True), 3)  # Loaded delta keys carry over
+        restored.export_snapshot()
+        self.assertFalse(os.path.exists(self.delta_filename))
+
+    def test_store_and_retrieve_many(self):
+        """Test batched storage and retrieval, including missing keys."""
+        entries = {f"k{i}": f"value {i}" for i in range(100)}
+        self.assertEqual(self.ledger.store_many(entries), 100)
+        self.assertEqual(self.ledger.retrieve_data("k42"), "value 42")
+        results = self.ledger.retrieve_many(["k1", "missing", "k99"])
+        self.assertEqual(results, {"k1": "value 1", "missing": None, "k99": "value 99"})
+
 if __name__ == '__main__':
     unittest.main()
@@ -26,5 +26,16 @@ class TestQuantumInterference(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.qi.encode(self.test_data, method='invalid')
 
+    def test_batch_matches_per_item(self):
+        """Test that batch encoding equals per-item encoding and round-trips both methods."""
+        values = ["", "a", "ab", "abc", "héllo wörld", "x" * 1000, self.test_data, self.test_data[::-1]]
+        encoded = self.qi.encode_many(values)
+        self.assertEqual(encoded, [self.qi.encode(value) for value in values])
+        self.assertEqual(self.qi.decode_many(encoded), values)
+        advanced = self.qi.encode_many(values[1:], method='advanced')
+        self.assertEqual(advanced, [self.qi.encode(value, method='advanced') for value in values[1:]])
+        self.assertEqual(self.qi.decode_many(advanced, method='advanced'), values[1:])
+        self.assertEqual(self.qi.decode(advanced[3], method='advanced'), "héllo wörld")
+
 if __name__ == '__main__':
     unittest.main()
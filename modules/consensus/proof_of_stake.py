@@ -1,14 +1,18 @@
 import random
 import logging
 from collections import defaultdict
+from typing import List, Optional, Union
+from modules.consensus.stake_index import StakeIndex
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class ProofOfStake:
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.stakes = defaultdict(float)  # Dictionary to hold stakes of each validator
         self.total_stake = 0.0  # Total stake in the network
+        self.index = StakeIndex()  # Cumulative stakes for O(log n) weighted selection
+        self.rng = rng or random.Random()
 
     def register_stake(self, validator: str, amount: float):
         """Register or update a stake for a validator."""
@@ -18,26 +22,39 @@ class ProofOfStake:
 
         self.stakes[validator] += amount
         self.total_stake += amount
+        self.index.set(validator, self.stakes[validator])
         logging.info(f"Stake registered: {validator} -> {self.stakes[validator]}")
 
-    def select_validator(self) -> str:
-        """Select a validator based on their stake using weighted random selection."""
+    def select_validator(self, seed: Optional[Union[bytes, str]] = None) -> str:
+        """Select a validator based on their stake using weighted random selection.
+
+        :param seed: Optional seed such as the previous block hash; every node that uses
+                     the same seed and stakes selects the same validator.
+        """
         if self.total_stake == 0:
             logging.warning("No stakes registered.")
             return None
 
-        selection = random.uniform(0, self.total_stake)
-        current = 0
-        for validator, stake in self.stakes.items():
-            current += stake
-            if current >= selection:
-                logging.info(f"Validator selected: {validator} with stake: {stake}")
-                return validator
+        validator = self.index.sample(seed, rng=self.rng)
+        logging.info(f"Validator selected: {validator} with stake: {self.stakes[validator]}")
+        return validator
+
+    def select_committee(self, size: int, seed: Optional[Union[bytes, str]] = None) -> List[str]:
+        """Select `size` distinct validators, each draw weighted by stake."""
+        if self.total_stake == 0:
+            logging.warning("No stakes registered.")
+            return []
+
+        committee = self.index.sample_distinct(size, seed, rng=self.rng)
+        logging.info(f"Committee of {len(committee)} validators selected.")
+        return committee
 
     def distribute_rewards(self, validator: str, reward: float):
         """Distribute rewards to the selected validator."""
         if validator in self.stakes:
             self.stakes[validator] += reward
+            self.total_stake += reward
+            self.index.set(validator, self.stakes[validator])
             logging.info(f"Reward of {reward} distributed to {validator}. New stake: {self.stakes[validator]}")
         else:
             logging.error(f"Validator {validator} not found for reward distribution.")
@@ -2,24 +2,25 @@ import hashlib
 import time
 import logging
 from typing import List
+from core.mining_engine import MiningEngine, difficulty_target, meets_target
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class ProofOfWork:
-    def __init__(self, initial_difficulty: int = 4, adjustment_interval: int = 10):
+    def __init__(self, initial_difficulty: int = 4, adjustment_interval: int = 10, workers: int = None):
         self.difficulty = initial_difficulty
         self.adjustment_interval = adjustment_interval
         self.block_times = []  # To track the time taken to mine blocks
+        self.engine = MiningEngine(workers=workers)  # Parallel nonce search
 
     def mine(self, previous_nonce: int, block_data: str, miner_address: str, reward: float) -> int:
         """Perform the mining process to find a valid nonce and create a new block."""
-        nonce = 0
         logging.info("Mining in progress...")
         start_time = time.time()
 
-        while not self.valid_proof(previous_nonce, nonce, block_data):
-            nonce += 1
+        result = self.engine.search(prefix=str(previous_nonce), suffix=block_data, difficulty=self.difficulty)
+        nonce = result.nonce
 
         elapsed_time = time.time() - start_time
         self.block_times.append(elapsed_time)
@@ -32,8 +33,8 @@ class ProofOfWork:
     def valid_proof(self, previous_nonce: int, nonce: int, block_data: str) -> bool:
         """Check if the proof of work is valid."""
         guess = f"{previous_nonce}{nonce}{block_data}".encode()
-        guess_hash = hashlib.sha256(guess).hexdigest()
-        return guess_hash[:self.difficulty] == "0" * self.difficulty  # Adjusted difficulty
+        guess_hash = hashlib.sha256(guess).digest()
+        return meets_target(guess_hash, difficulty_target(self.difficulty))  # Adjusted difficulty
 
     def adjust_difficulty(self):
         """Adjust the mining difficulty based on the average time taken to mine recent blocks."""
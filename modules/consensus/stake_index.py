@@ -0,0 +1,141 @@
+import hashlib
+from typing import Dict, Hashable, List, Optional, Union
+
+UNITS_PER_STAKE = 10 ** 8  # Stakes are kept as exact integers of this many units per stake
+
+
+class StakeIndex:
+    """Fenwick tree over validator stakes for O(log n) updates and weighted draws.
+
+    The index depends only on the current stakes, never on how they were reached: slots are
+    ordered by validator id and weights are held as integer units, so prefix sums are exact.
+    Two nodes with the same stakes make the same seeded picks, whatever order they registered
+    validators in. `find(point)` returns the validator whose cumulative stake interval
+    contains `point`, i.e. the one a linear walk over the stakes in id order would pick.
+
+    Validators registered since the last draw are merged into their sorted slots in one
+    O(n) rebuild at the next draw; weight changes of known validators take O(log n).
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._capacity = 1
+        while self._capacity < capacity:
+            self._capacity *= 2
+        self._tree = [0] * (self._capacity + 1)
+        self._weights: List[int] = []
+        self._validators: List[Hashable] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._pending: Dict[Hashable, int] = {}  # Registered but not yet merged into the tree
+        self._total = 0
+        self.active = 0  # Validators with positive weight
+
+    def __len__(self) -> int:
+        return len(self._validators) + len(self._pending)
+
+    def __contains__(self, validator: Hashable) -> bool:
+        return validator in self._slots or validator in self._pending
+
+    @property
+    def total(self) -> float:
+        return self._total / UNITS_PER_STAKE
+
+    def weight(self, validator: Hashable) -> float:
+        slot = self._slots.get(validator)
+        units = self._pending.get(validator, 0) if slot is None else self._weights[slot]
+        return units / UNITS_PER_STAKE
+
+    def set(self, validator: Hashable, weight: float):
+        """Set a validator's weight, registering it if needed."""
+        units = round(weight * UNITS_PER_STAKE)
+        slot = self._slots.get(validator)
+        if slot is not None:
+            self._add(slot, units - self._weights[slot])
+            return
+        previous = self._pending.get(validator, 0)
+        self._pending[validator] = units
+        self._total += units - previous
+        self.active += (units > 0) - (previous > 0)
+
+    def find(self, point: float) -> Hashable:
+        """Return the validator whose cumulative interval contains `point` (0 <= point < total)."""
+        return self._find(int(point * UNITS_PER_STAKE))
+
+    def sample(self, seed: Optional[Union[bytes, str]] = None, counter: int = 0, rng=None) -> Hashable:
+        """Draw one validator proportionally to weight, from a seed or a random generator."""
+        if seed is not None:
+            return self._find(seeded_point(seed, counter, self._total))
+        return self._find(rng.randrange(self._total))
+
+    def sample_distinct(self, k: int, seed: Optional[Union[bytes, str]] = None, rng=None) -> List[Hashable]:
+        """Draw up to `k` distinct validators without replacement in O(k log n).
+
+        Drawn validators are zeroed while sampling and added back afterwards; integer weights
+        make this exact, so the index is left as it was.
+        """
+        chosen = []
+        try:
+            while len(chosen) < k and self.active > 0:
+                validator = self.sample(seed, len(chosen), rng)
+                slot = self._slots[validator]
+                chosen.append((validator, self._weights[slot]))
+                self._add(slot, -self._weights[slot])
+        finally:
+            for validator, units in chosen:
+                self._add(self._slots[validator], units)
+        return [validator for validator, _ in chosen]
+
+    def _find(self, units: int) -> Hashable:
+        """Return the validator at cumulative offset `units` (0 <= units < total units)."""
+        self._merge_pending()
+        position = 0
+        remaining = units
+        step = self._capacity
+        while step:
+            following = position + step
+            if following <= self._capacity and self._tree[following] <= remaining:
+                position = following
+                remaining -= self._tree[following]
+            step //= 2
+        return self._validators[position]
+
+    def _merge_pending(self):
+        """Insert newly registered validators into their sorted slots and rebuild the tree."""
+        if not self._pending:
+            return
+        weights = dict(zip(self._validators, self._weights))
+        weights.update(self._pending)
+        self._pending.clear()
+        self._validators = sorted(weights)
+        self._weights = [weights[validator] for validator in self._validators]
+        self._slots = {validator: slot for slot, validator in enumerate(self._validators)}
+        capacity = self._capacity
+        while capacity < len(self._validators):
+            capacity *= 2
+        self._rebuild(capacity)
+
+    def _add(self, slot: int, delta: int):
+        was_active = self._weights[slot] > 0
+        self._weights[slot] += delta
+        self.active += (self._weights[slot] > 0) - was_active
+        self._total += delta
+        i = slot + 1
+        while i <= self._capacity:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _rebuild(self, capacity: int):
+        self._capacity = capacity
+        self._tree = [0] * (capacity + 1)
+        self._tree[1:len(self._weights) + 1] = self._weights
+        for i in range(1, capacity + 1):  # O(n): each node is complete before it feeds its parent
+            parent = i + (i & -i)
+            if parent <= capacity:
+                self._tree[parent] += self._tree[i]
+
+
+def seeded_point(seed: Union[bytes, str], counter: int, total: int) -> int:
+    """Map (seed, counter) to a uniform integer in [0, total) with SHA-256, without rounding."""
+    if isinstance(seed, str):
+        seed = seed.encode()
+    digest = hashlib.sha256(seed + counter.to_bytes(8, 'big')).digest()
+    return int.from_bytes(digest[:8], 'big') * total >> 64
@@ -1,35 +1,50 @@
 import logging
 import json
 import os
+from typing import Dict, Iterable, List
 from cryptography.fernet import Fernet
+from modules.data_availability.encrypted_log import EncryptedLog
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class DataAvailability:
-    def __init__(self, storage_path='data_storage.json', encryption_key=None):
+    def __init__(self, storage_path='data_storage.json', encryption_key=None, sync=True):
+        """
+        :param storage_path: Legacy JSON store; the append-only log lives next to it with a `.log` suffix.
+            Once migrated, the JSON file is renamed with a `.migrated` suffix.
+        :param encryption_key: Fernet key for values at rest.
+        :param sync: fsync after every group commit.
+        """
         self.storage_path = storage_path
+        self.log_path = os.path.splitext(storage_path)[0] + '.log'
         self.encryption_key = encryption_key or Fernet.generate_key()
         self.cipher = Fernet(self.encryption_key)
+        self.sync = sync
         self.load_data()
 
     def load_data(self):
-        """Load data from the storage file."""
+        """Open the storage log; values are decrypted only when they are read."""
+        self.log = EncryptedLog(self.log_path, sync=self.sync)
         if os.path.exists(self.storage_path):
-            with open(self.storage_path, 'r') as file:
-                encrypted_data = json.load(file)
-                self.storage = {key: self.decrypt_value(value) for key, value in encrypted_data.items()}
-                logging.info("Data loaded successfully.")
+            # Migrate the old whole-file JSON store (its values are already encrypted) only into a log
+            # that has never been written; a non-empty log already holds it, perhaps with later deletes
+            if not os.path.getsize(self.log_path):
+                with open(self.storage_path, 'r') as file:
+                    encrypted_data = json.load(file)
+                self.log.put_many((key, value.encode()) for key, value in encrypted_data.items())
+                self.log.flush()
+                logging.info(f"Migrated {len(encrypted_data)} keys from {self.storage_path}.")
+            os.replace(self.storage_path, self.storage_path + '.migrated')
+        if len(self.log):
+            logging.info("Data loaded successfully.")
         else:
-            self.storage = {}
             logging.info("No existing data found. Starting with an empty storage.")
 
     def save_data(self):
-        """Save data to the storage file."""
-        with open(self.storage_path, 'w') as file:
-            encrypted_data = {key: self.encrypt_value(value) for key, value in self.storage.items()}
-            json.dump(encrypted_data, file)
-            logging.info("Data saved successfully.")
+        """Make every logged write durable."""
+        self.log.flush()
+        logging.info("Data saved successfully.")
 
     def encrypt_value(self, value):
         """Encrypt a value for storage."""
@@ -41,15 +56,19 @@ class DataAvailability:
 
     def store_data(self, key, value):
         """Store data with a specified key."""
-        self.storage[key] = value
-        self.save_data()
-        logging.info(f"Data stored: {key} -> {value}")
+        self.store_many({key: value})
+        logging.info(f"Data stored: {key}")
+
+    def store_many(self, items: Dict[str, str]):
+        """Store many key/value pairs with a single log append and fsync."""
+        self.log.put_many((key, self.cipher.encrypt(value.encode())) for key, value in items.items())
 
     def retrieve_data(self, key):
         """Retrieve data by key."""
-        value = self.storage.get(key)
-        if value is not None:
-            logging.info(f"Data retrieved: {key} -> {value}")
+        token = self.log.get(key)
+        if token is not None:
+            value = self.cipher.decrypt(token).decode()
+            logging.info(f"Data retrieved: {key}")
             return value
         else:
             logging.warning(f"Data not found for key: {key}")
@@ -57,19 +76,28 @@ class DataAvailability:
 
     def check_data_availability(self, key):
         """Check if data is available for a specified key."""
-        available = key in self.storage
+        available = key in self.log
         logging.info(f"Data availability for key '{key}': {available}")
         return available
 
     def delete_data(self, key):
         """Delete data associated with a specified key."""
-        if key in self.storage:
-            del self.storage[key]
-            self.save_data()
+        if self.delete_many([key]):
             logging.info(f"Data deleted for key: {key}")
         else:
             logging.warning(f"Attempted to delete non-existent key: {key}")
 
+    def delete_many(self, keys: Iterable[str]) -> List[str]:
+        """Delete many keys with a single log append; returns the keys that existed."""
+        return self.log.delete_many(keys)
+
+    def compact(self):
+        """Rewrite the storage log without overwritten or deleted values."""
+        self.log.compact()
+
+    def close(self):
+        self.log.close()
+
 # Example usage
 if __name__ == "__main__":
     data_availability = DataAvailability()
@@ -0,0 +1,209 @@
+import logging
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+RECORD_HEADER = struct.Struct('>IBII')  # crc32 of the body, operation, key length, value length
+OP_PUT = 1
+OP_DELETE = 2
+
+
+class EncryptedLog:
+    """Append-only key/value log holding already-encrypted values.
+
+    Each record is a CRC-checked (operation, key, ciphertext) entry. Opening the log streams
+    through it once to build an in-memory index of key -> (value offset, length); values stay
+    encrypted on disk and are only read when asked for. Writes are grouped: `put_many`/
+    `delete_many` append all their records with a single write and fsync. Once dead records
+    (overwritten or deleted) outweigh live ones a background thread compacts the log by
+    copying live ciphertexts into a new file, without decrypting them; writes continue
+    meanwhile and are carried over before the new file replaces the old one.
+    """
+
+    def __init__(self, path: str, sync: bool = True, compaction_ratio: float = 1.0,
+                 min_compaction_bytes: int = 1024 * 1024):
+        self.path = path
+        self.sync = sync
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_bytes = min_compaction_bytes
+        self.index: Dict[str, Tuple[int, int]] = {}
+        self.live_bytes = 0
+        self.dead_bytes = 0
+        self._file = None
+        self._lock = threading.Lock()  # Guards the file, index and byte counts
+        self._compaction_lock = threading.Lock()  # One compaction at a time
+        self._compactor: Optional[threading.Thread] = None
+        self._open()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.index))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored ciphertext for a key, or None."""
+        location = self.index.get(key)
+        if location is None:
+            return None
+        offset, length = location
+        with self._lock:  # A compaction may be swapping the file
+            return os.pread(self._file.fileno(), length, offset)
+
+    def put_many(self, items: Iterable[Tuple[str, bytes]]):
+        """Append (key, ciphertext) records as one group commit."""
+        self._append([(OP_PUT, key, value) for key, value in items])
+
+    def delete_many(self, keys: Iterable[str]) -> List[str]:
+        """Append delete records for the keys that exist; returns the deleted keys."""
+        deleted = [key for key in dict.fromkeys(keys) if key in self.index]
+        self._append([(OP_DELETE, key, b'') for key in deleted])
+        return deleted
+
+    def compact(self):
+        """Rewrite the log with only the live records.
+
+        Live values are copied without holding the write lock; records appended meanwhile are
+        copied over under the lock just before the new file replaces the old one.
+        """
+        with self._compaction_lock:
+            with self._lock:
+                if self._file is None:
+                    return
+                live = list(self.index.items())
+                end = self._file.seek(0, os.SEEK_END)
+                source = self._file.fileno()  # Stays open: only compact and close replace the file
+            temporary = self.path + '.compact'
+            index = {}
+            with open(temporary, 'wb') as output:
+                position = 0
+                for key, (offset, length) in live:
+                    record = self._encode(OP_PUT, key, os.pread(source, length, offset))
+                    output.write(record)
+                    index[key] = (position + len(record) - length, length)
+                    position += len(record)
+            with self._lock:
+                with open(self.path, 'rb') as file:
+                    file.seek(end)
+                    tail = [(operation, key, value) for operation, key, value, _ in self._records(file, end)]
+                with open(temporary, 'ab') as output:
+                    output.write(b''.join(self._encode(*record) for record in tail))
+                    output.flush()
+                    os.fsync(output.fileno())
+                self._file.close()
+                os.replace(temporary, self.path)
+                self._file = open(self.path, 'a+b')
+                self.index = index
+                self.live_bytes = position
+                self.dead_bytes = 0
+                for operation, key, value in tail:
+                    position = self._apply(operation, key, value, position)
+            logging.info(f"Compacted {self.path} to {len(self.index)} records ({position} bytes).")
+
+    def wait_for_compaction(self):
+        """Block until a running background compaction has finished."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self.wait_for_compaction()
+        with self._compaction_lock, self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # Internals
+
+    @staticmethod
+    def _encode(operation: int, key: str, value: bytes) -> bytes:
+        key_bytes = key.encode('utf-8')
+        body = key_bytes + value
+        header = RECORD_HEADER.pack(zlib.crc32(bytes([operation]) + body), operation, len(key_bytes), len(value))
+        return header + body
+
+    def _append(self, records: List[Tuple[int, str, bytes]]):
+        if not records:
+            return
+        with self._lock:
+            position = self._file.seek(0, os.SEEK_END)
+            for operation, key, value in records:
+                position = self._apply(operation, key, value, position)
+            self._file.write(b''.join(self._encode(*record) for record in records))
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+            self._maybe_compact()
+
+    def _apply(self, operation: int, key: str, value: bytes, position: int) -> int:
+        """Index a record written at `position`; returns the offset just past it."""
+        self._retire(key)
+        record_size = RECORD_HEADER.size + len(key.encode('utf-8')) + len(value)
+        if operation == OP_PUT:
+            self.index[key] = (position + record_size - len(value), len(value))
+            self.live_bytes += record_size
+        else:
+            self.dead_bytes += record_size
+        return position + record_size
+
+    def _retire(self, key: str):
+        """Account the current record for a key as dead space."""
+        location = self.index.pop(key, None)
+        if location is not None:
+            record_size = RECORD_HEADER.size + len(key.encode('utf-8')) + location[1]
+            self.live_bytes -= record_size
+            self.dead_bytes += record_size
+
+    def _maybe_compact(self):
+        """Start a background compaction once dead space crosses the threshold."""
+        if self.dead_bytes < self.min_compaction_bytes or self.dead_bytes <= self.live_bytes * self.compaction_ratio:
+            return
+        if self._compactor is None or not self._compactor.is_alive():
+            self._compactor = threading.Thread(target=self._compact_in_background, daemon=True)
+            self._compactor.start()
+
+    def _compact_in_background(self):
+        try:
+            self.compact()
+        except Exception as e:
+            logging.error(f"Background compaction of {self.path} failed: {e}")
+
+    @staticmethod
+    def _records(file, position: int) -> Iterator[Tuple[int, str, bytes, int]]:
+        """Stream (operation, key, value, record end) for each intact record from `position`."""
+        while True:
+            header = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            checksum, operation, key_length, value_length = RECORD_HEADER.unpack(header)
+            body = file.read(key_length + value_length)
+            if len(body) < key_length + value_length or zlib.crc32(bytes([operation]) + body) != checksum:
+                return
+            position += RECORD_HEADER.size + len(body)
+            yield operation, body[:key_length].decode('utf-8'), body[key_length:], position
+
+    def _open(self):
+        valid = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'rb', buffering=1024 * 1024) as file:
+                for operation, key, value, _ in self._records(file, 0):
+                    valid = self._apply(operation, key, value, valid)
+            if valid < os.path.getsize(self.path):
+                logging.warning(f"Truncating torn tail of {self.path} at offset {valid}.")
+                with open(self.path, 'r+b') as file:
+                    file.truncate(valid)
+        self._file = open(self.path, 'a+b')
+        logging.info(f"Opened {self.path} with {len(self.index)} keys.")
@@ -0,0 +1,202 @@
+import base64
+import hashlib
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# GF(2^8) arithmetic with the primitive polynomial x^8 + x^4 + x^3 + x^2 + 1
+_PRIMITIVE = 0x11d
+GF_EXP = np.zeros(512, dtype=np.uint8)
+GF_LOG = np.zeros(256, dtype=np.int32)
+_value = 1
+for _power in range(255):
+    GF_EXP[_power] = _value
+    GF_LOG[_value] = _power
+    _value <<= 1
+    if _value & 0x100:
+        _value ^= _PRIMITIVE
+GF_EXP[255:510] = GF_EXP[:255]
+# MUL_TABLE[a] maps every byte b to a*b, so multiplying a chunk by a constant is one gather
+_logs = GF_LOG[:, None] + GF_LOG[None, :]
+MUL_TABLE = GF_EXP[_logs].astype(np.uint8)
+MUL_TABLE[0, :] = 0
+MUL_TABLE[:, 0] = 0
+del _value, _power, _logs
+
+
+def gf_mul(a: int, b: int) -> int:
+    return int(MUL_TABLE[a, b])
+
+
+def gf_inverse(a: int) -> int:
+    if a == 0:
+        raise ZeroDivisionError("0 has no inverse in GF(256).")
+    return int(GF_EXP[255 - GF_LOG[a]])
+
+
+def gf_matrix_inverse(matrix: np.ndarray) -> np.ndarray:
+    """Invert a square matrix over GF(256) with Gauss-Jordan elimination."""
+    size = len(matrix)
+    work = np.concatenate([matrix.astype(np.uint8), np.eye(size, dtype=np.uint8)], axis=1)
+    for column in range(size):
+        pivot = next((row for row in range(column, size) if work[row, column]), None)
+        if pivot is None:
+            raise ValueError("Matrix is singular.")
+        work[[column, pivot]] = work[[pivot, column]]
+        work[column] = MUL_TABLE[gf_inverse(int(work[column, column]))][work[column]]
+        for row in range(size):
+            if row != column and work[row, column]:
+                work[row] ^= MUL_TABLE[int(work[row, column])][work[column]]
+    return work[:, size:]
+
+
+def gf_matrix_apply(matrix: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Multiply an (m x k) coefficient matrix by a (k x length) byte matrix over GF(256)."""
+    result = np.zeros((matrix.shape[0], rows.shape[1]), dtype=np.uint8)
+    indices = rows.astype(np.intp)  # Gathering with native-width indices avoids a cast per lookup
+    product = np.empty(rows.shape[1], dtype=np.uint8)
+    for i in range(matrix.shape[0]):
+        accumulator = result[i]
+        for j in range(matrix.shape[1]):
+            coefficient = int(matrix[i, j])
+            if coefficient == 1:
+                accumulator ^= rows[j]
+            elif coefficient:
+                np.take(MUL_TABLE[coefficient], indices[j], out=product)
+                accumulator ^= product
+    return result
+
+
+class ErasureCoder:
+    """Systematic Reed-Solomon code over GF(256): k data chunks plus n-k parity chunks.
+
+    The generator is the identity stacked on a Cauchy matrix, so any k of the n chunks
+    are enough to rebuild the blob, and when the k data chunks are present decoding is
+    just concatenation.
+    """
+
+    def __init__(self, k: int, n: int):
+        if not 0 < k <= n <= 256:
+            raise ValueError("Require 0 < k <= n <= 256.")
+        self.k = k
+        self.n = n
+        cauchy = np.zeros((n - k, k), dtype=np.uint8)
+        for i in range(n - k):
+            for j in range(k):
+                cauchy[i, j] = gf_inverse((k + i) ^ j)  # x_i = k + i and y_j = j never coincide
+        self.generator = np.concatenate([np.eye(k, dtype=np.uint8), cauchy])
+        self._inverse_cache: Dict[Tuple[int, ...], np.ndarray] = {}
+
+    def chunk_size(self, length: int) -> int:
+        return max(1, -(-length // self.k))
+
+    def encode(self, blob: bytes) -> List[bytes]:
+        """Split a blob into n chunks of equal size (the last data chunk is zero padded)."""
+        size = self.chunk_size(len(blob))
+        data = np.zeros(self.k * size, dtype=np.uint8)
+        data[:len(blob)] = np.frombuffer(blob, dtype=np.uint8)
+        data = data.reshape(self.k, size)
+        parity = gf_matrix_apply(self.generator[self.k:], data)
+        return [row.tobytes() for row in data] + [row.tobytes() for row in parity]
+
+    def decode(self, chunks: Dict[int, bytes], length: int) -> bytes:
+        """Rebuild a blob of `length` bytes from any k chunks, keyed by chunk index."""
+        if len(chunks) < self.k:
+            raise ValueError(f"Need {self.k} chunks to decode, got {len(chunks)}.")
+        indices = tuple(sorted(chunks)[:self.k])
+        rows = np.stack([np.frombuffer(chunks[index], dtype=np.uint8) for index in indices])
+        if indices == tuple(range(self.k)):
+            data = rows
+        else:
+            inverse = self._inverse_cache.get(indices)
+            if inverse is None:
+                inverse = gf_matrix_inverse(self.generator[list(indices)])
+                self._inverse_cache[indices] = inverse
+            data = gf_matrix_apply(inverse, rows)
+        return data.tobytes()[:length]
+
+
+@dataclass
+class EncodedBlob:
+    """Commitment to an erasure-coded blob: parameters plus the hash of every chunk."""
+    blob_id: str
+    length: int
+    k: int
+    n: int
+    chunk_hashes: List[str] = field(default_factory=list)
+
+    def chunk_key(self, index: int) -> str:
+        return f"{self.blob_id}:{index}"
+
+
+class ErasureCodedStore:
+    """Spreads k-of-n chunks of each blob across storage backends.
+
+    A backend is anything with `put(key, value: dict)` and `get(key) -> dict or None`, as
+    `LevelDBStorage` provides. Chunk i goes to backend i % len(backends).
+    """
+
+    def __init__(self, backends: Sequence, k: int = 16, n: int = 32):
+        if not backends:
+            raise ValueError("At least one backend is required.")
+        self.backends = list(backends)
+        self.coder = ErasureCoder(k, n)
+
+    def backend_for(self, index: int):
+        return self.backends[index % len(self.backends)]
+
+    def store_blob(self, blob: bytes) -> EncodedBlob:
+        """Encode and distribute a blob, returning its commitment."""
+        chunks = self.coder.encode(blob)
+        encoded = EncodedBlob(hashlib.sha256(blob).hexdigest(), len(blob), self.coder.k, self.coder.n,
+                              [hashlib.sha256(chunk).hexdigest() for chunk in chunks])
+        for index, chunk in enumerate(chunks):
+            self.backend_for(index).put(encoded.chunk_key(index), {'chunk': base64.b64encode(chunk).decode()})
+        logging.info(f"Stored blob {encoded.blob_id} as {encoded.n} chunks ({encoded.k} needed).")
+        return encoded
+
+    def fetch_chunk(self, encoded: EncodedBlob, index: int) -> Optional[bytes]:
+        """Fetch one chunk and check it against the commitment; None if missing or corrupt."""
+        try:
+            record = self.backend_for(index).get(encoded.chunk_key(index))
+        except Exception as e:
+            logging.warning(f"Backend failed for chunk {index} of {encoded.blob_id}: {e}")
+            return None
+        if not record:
+            return None
+        chunk = base64.b64decode(record['chunk'])
+        if hashlib.sha256(chunk).hexdigest() != encoded.chunk_hashes[index]:
+            logging.warning(f"Chunk {index} of {encoded.blob_id} failed its hash check.")
+            return None
+        return chunk
+
+    def sample_availability(self, encoded: EncodedBlob, samples: int = 8, rng: Optional[random.Random] = None) -> bool:
+        """
+        Check availability by fetching a few random chunks instead of the whole blob.
+
+        If fewer than k chunks survive, more than (n-k)/n of them are missing, so each sample
+        fails with at least that probability and `samples` draws all succeed with probability
+        below (k/n) ** samples.
+        """
+        rng = rng or random.Random()
+        indices = rng.sample(range(encoded.n), min(samples, encoded.n))
+        return all(self.fetch_chunk(encoded, index) is not None for index in indices)
+
+    def reconstruct(self, encoded: EncodedBlob) -> bytes:
+        """Rebuild a blob from the first k valid chunks, preferring data chunks."""
+        chunks = {}
+        for index in range(encoded.n):
+            chunk = self.fetch_chunk(encoded, index)
+            if chunk is not None:
+                chunks[index] = chunk
+                if len(chunks) == encoded.k:
+                    break
+        blob = self.coder.decode(chunks, encoded.length)
+        if hashlib.sha256(blob).hexdigest() != encoded.blob_id:
+            raise ValueError(f"Reconstructed blob does not match {encoded.blob_id}.")
+        return blob
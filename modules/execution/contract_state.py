@@ -0,0 +1,202 @@
+import json
+import logging
+import os
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+SNAPSHOT_FILE = 'snapshot.json'
+WAL_FILE = 'wal.log'
+_DELETED = object()  # Tombstone for keys deleted in an overlay
+
+
+class VersionedState(MutableMapping):
+    """Contract state with copy-on-write overlays and an optional delta log.
+
+    `begin()` pushes an overlay that records only the keys written or deleted; reads fall
+    through the overlays to the committed base. `commit()` folds the top overlay into the
+    one below in O(changes), and `rollback()` just drops it. When the outermost overlay
+    commits, the state's version advances and, if a `path` is given, its delta is appended
+    to a write-ahead log. Every `snapshot_interval` versions the full state is written to
+    a compact snapshot and the log is truncated, so reopening replays only the log tail.
+    """
+
+    def __init__(self, path: Optional[str] = None, snapshot_interval: int = 1000, fsync: bool = True):
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.fsync = fsync
+        self.base: Dict[str, Any] = {}
+        self.overlays: List[Dict[str, Any]] = []
+        self.version = 0
+        self.snapshot_version = 0
+        self._wal = None
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            self._load()
+            self._wal = open(os.path.join(path, WAL_FILE), 'a', encoding='utf-8')
+
+    # Mapping interface
+
+    def __getitem__(self, key: str) -> Any:
+        for overlay in reversed(self.overlays):
+            if key in overlay:
+                value = overlay[key]
+                if value is _DELETED:
+                    raise KeyError(key)
+                return value
+        return self.base[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if self.overlays:
+            self.overlays[-1][key] = value
+        else:
+            self._log({key: value}, [])
+            self.base[key] = value
+            self._maybe_snapshot()
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        if self.overlays:
+            self.overlays[-1][key] = _DELETED
+        else:
+            self._log({}, [key])
+            del self.base[key]
+            self._maybe_snapshot()
+
+    def __iter__(self) -> Iterator[str]:
+        if not self.overlays:
+            return iter(list(self.base))
+        merged = dict.fromkeys(self.base, True)
+        for overlay in self.overlays:
+            for key, value in overlay.items():
+                merged[key] = value is not _DELETED
+        return iter([key for key, present in merged.items() if present])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self) if self.overlays else len(self.base)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VersionedState':
+        """Build an in-memory state holding `data` as its committed base."""
+        state = cls()
+        state.base = dict(data)
+        return state
+
+    def reset(self, data: Dict[str, Any]):
+        """Replace the whole state with `data` as a single write (one delta when persistent)."""
+        self.begin()
+        for key in list(self):
+            if key not in data:
+                del self[key]
+        self.update(data)
+        self.commit()
+
+    # Overlays
+
+    @property
+    def depth(self) -> int:
+        return len(self.overlays)
+
+    def begin(self):
+        """Start a new overlay (e.g. for a block or a batch of calls)."""
+        self.overlays.append({})
+
+    def commit(self):
+        """Fold the top overlay into the layer below."""
+        overlay = self.overlays.pop()
+        if self.overlays:
+            self.overlays[-1].update(overlay)
+            return
+        updates = {key: value for key, value in overlay.items() if value is not _DELETED}
+        deletes = [key for key, value in overlay.items() if value is _DELETED]
+        try:
+            self._log(updates, deletes)  # Logged before applying, so a failed write leaves the base intact
+        except Exception:
+            self.overlays.append(overlay)
+            raise
+        self.base.update(updates)
+        for key in deletes:
+            self.base.pop(key, None)
+        self._maybe_snapshot()
+
+    def rollback(self):
+        """Discard the top overlay."""
+        self.overlays.pop()
+
+    # Persistence
+
+    def snapshot(self):
+        """Write the committed state to a snapshot and truncate the log."""
+        if self.path is None:
+            return
+        snapshot_path = os.path.join(self.path, SNAPSHOT_FILE)
+        temporary = snapshot_path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump({'version': self.version, 'state': self.base}, file, separators=(',', ':'))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, snapshot_path)  # The old snapshot stays valid until this point
+        self._wal.truncate(0)
+        self._wal.seek(0)
+        self.snapshot_version = self.version
+        logging.info(f"State snapshot written at version {self.version}.")
+
+    def close(self):
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+
+    def _log(self, updates: Dict[str, Any], deletes: List[str]):
+        if self._wal is not None:
+            record = json.dumps({'version': self.version + 1, 'set': updates, 'delete': deletes},
+                                separators=(',', ':'))
+            self._wal.write(record + '\n')
+            self._wal.flush()
+            if self.fsync:
+                os.fsync(self._wal.fileno())
+        self.version += 1
+
+    def _maybe_snapshot(self):
+        if self._wal is not None and self.version - self.snapshot_version >= self.snapshot_interval:
+            self.snapshot()
+
+    def _load(self):
+        snapshot_path = os.path.join(self.path, SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, 'r', encoding='utf-8') as file:
+                snapshot = json.load(file)
+            self.base = snapshot['state']
+            self.version = self.snapshot_version = snapshot['version']
+
+        wal_path = os.path.join(self.path, WAL_FILE)
+        if not os.path.exists(wal_path):
+            return
+        replayed = 0
+        valid_bytes = 0
+        with open(wal_path, 'rb') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # Torn write at the tail
+                if not line.endswith(b'\n'):
+                    break
+                valid_bytes += len(line)
+                if record['version'] <= self.version:
+                    continue  # Already in the snapshot
+                self.base.update(record['set'])
+                for key in record['delete']:
+                    self.base.pop(key, None)
+                self.version = record['version']
+                replayed += 1
+        if valid_bytes < os.path.getsize(wal_path):
+            logging.warning(f"Truncating torn tail of {wal_path} at offset {valid_bytes}.")
+            with open(wal_path, 'r+b') as file:
+                file.truncate(valid_bytes)
+        logging.info(f"Contract state loaded at version {self.version} ({replayed} log records replayed).")
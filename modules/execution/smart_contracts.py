@@ -1,32 +1,115 @@
 import json
 import logging
-from typing import Any, Dict, Callable, List
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Callable, Iterable, List, Optional, Tuple
+from modules.execution.contract_state import VersionedState
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Gas charged per operation; used for profiling and batch limits
+GAS_COSTS = {
+    'call': 1,
+    'read': 1,
+    'write': 5,
+    'event': 1,
+}
+
+
+class OutOfGas(Exception):
+    """Raised when a batch exceeds its gas limit."""
+
+
 class SmartContract:
-    def __init__(self, contract_code: str):
-        """Initialize the smart contract with its code."""
+    def __init__(self, contract_code: str, state_path: Optional[str] = None, snapshot_interval: int = 1000):
+        """Initialize the smart contract with its code.
+
+        :param state_path: Directory for the state's delta log and snapshots; in memory if None.
+        :param snapshot_interval: Committed versions between full state snapshots.
+        """
         self.contract_code = contract_code
-        self.state = {}  # Store the state of the contract
+        self.state = VersionedState(state_path, snapshot_interval)  # Store the state of the contract
         self.event_listeners = []  # List of event listeners
+        self.dispatch_table = self.contract_functions()  # Resolved once, not per call
+        self.gas_used = 0
+        self.gas_limit: Optional[int] = None  # Set while a batch with a limit runs
+        self.profile = defaultdict(lambda: {'calls': 0, 'gas': 0, 'seconds': 0.0})
+        self.events = queue.Queue()  # (event_name, args) awaiting delivery to listeners
+        self._event_buffer: Optional[List[Tuple[str, Tuple[Any, ...]]]] = None  # Events held until a batch commits
+        self._event_worker: Optional[threading.Thread] = None
 
     def execute(self, function_name: str, *args: Any) -> Any:
         """Execute a function in the smart contract."""
-        logging.info(f"Executing {function_name} with arguments: {args}")
-        if function_name not in self.contract_functions():
+        function = self.dispatch_table.get(function_name)
+        if function is None:
             logging.error(f"Function {function_name} not found in contract.")
             return None
 
-        # Call the function dynamically
-        function = self.contract_functions()[function_name]
+        gas_before = self.gas_used
+        start = time.perf_counter()
+        self.charge('call')
         result = function(*args)
 
         # Emit an event after execution
         self.emit_event(function_name, args)
+        stats = self.profile[function_name]
+        stats['calls'] += 1
+        stats['gas'] += self.gas_used - gas_before
+        stats['seconds'] += time.perf_counter() - start
         return result
 
+    def execute_batch(self, calls: Iterable[Tuple[str, Tuple[Any, ...]]], gas_limit: Optional[int] = None) -> List[Any]:
+        """
+        Execute many calls atomically in a single copy-on-write state overlay.
+
+        Events are delivered only once the whole batch has committed. If any call raises
+        (including OutOfGas once `gas_limit` is exceeded) the state is rolled back and the
+        batch's events are discarded.
+
+        :param calls: (function_name, args) pairs.
+        :param gas_limit: Maximum gas the batch may use.
+        :return: The result of each call.
+        """
+        self.state.begin()
+        gas_before = self.gas_used
+        self.gas_limit = None if gas_limit is None else gas_before + gas_limit
+        self._event_buffer = []
+        try:
+            results = [self.execute(function_name, *args) for function_name, args in calls]
+        except Exception:
+            self.state.rollback()
+            self._event_buffer = None
+            raise
+        finally:
+            self.gas_limit = None
+        self.state.commit()
+        events, self._event_buffer = self._event_buffer, None
+        for event in events:
+            self._queue_event(*event)
+        logging.info(f"Committed batch of {len(results)} calls using {self.gas_used - gas_before} gas.")
+        return results
+
+    def begin_block(self):
+        """Start a block; its writes stay in an overlay until commit_block or rollback_block."""
+        self.state.begin()
+
+    def commit_block(self):
+        """Commit the current block's writes (logged as one delta when state is persistent)."""
+        self.state.commit()
+
+    def rollback_block(self):
+        """Discard every write made since begin_block."""
+        self.state.rollback()
+
+    def charge(self, operation: str, units: int = 1):
+        """Account gas for an operation."""
+        self.gas_used += GAS_COSTS[operation] * units
+        if self.gas_limit is not None and self.gas_used > self.gas_limit:
+            raise OutOfGas(f"Gas limit exceeded during {operation}.")
+
     def contract_functions(self) -> Dict[str, Callable]:
         """Define the functions available in the smart contract."""
         return {
@@ -36,20 +119,44 @@ class SmartContract:
 
     def set_value(self, key: str, value: Any):
         """Set a value in the contract state."""
+        self.charge('write')
         self.state[key] = value
-        logging.info(f"Set value: {key} = {value}")
 
     def get_value(self, key: str) -> Any:
         """Get a value from the contract state."""
+        self.charge('read')
         value = self.state.get(key, None)
-        logging.info(f"Get value: {key} = {value}")
         return value
 
     def emit_event(self, event_name: str, args: List[Any]):
-        """Emit an event to all registered listeners."""
-        logging.info(f"Emitting event: {event_name} with arguments: {args}")
-        for listener in self.event_listeners:
-            listener(event_name, args)
+        """Queue an event for asynchronous delivery to all registered listeners."""
+        self.charge('event')
+        if self._event_buffer is not None:
+            self._event_buffer.append((event_name, args))
+        else:
+            self._queue_event(event_name, args)
+
+    def flush_events(self):
+        """Block until every queued event has been delivered."""
+        self.events.join()
+
+    def _queue_event(self, event_name: str, args: List[Any]):
+        if not self.event_listeners:
+            return
+        if self._event_worker is None:
+            self._event_worker = threading.Thread(target=self._deliver_events, daemon=True)
+            self._event_worker.start()
+        self.events.put((event_name, args))
+
+    def _deliver_events(self):
+        while True:
+            event_name, args = self.events.get()
+            for listener in list(self.event_listeners):
+                try:
+                    listener(event_name, args)
+                except Exception as e:
+                    logging.error(f"Event listener {listener} failed on {event_name}: {e}")
+            self.events.task_done()
 
     def add_event_listener(self, listener: Callable[[str, List[Any]], None]):
         """Add an event listener."""
@@ -59,14 +166,14 @@ class SmartContract:
     def save_state(self, filename: str):
         """Save the contract state to a file."""
         with open(filename, 'w') as file:
-            json.dump(self.state, file)
+            json.dump(self.state.to_dict(), file)
             logging.info(f"Contract state saved to {filename}")
 
     def load_state(self, filename: str):
-        """Load the contract state from a file."""
+        """Load the contract state from a file, as one write to the existing (possibly persistent) state."""
         try:
             with open(filename, 'r') as file:
-                self.state = json.load(file)
+                self.state.reset(json.load(file))
                 logging.info(f"Contract state loaded from {filename}")
         except FileNotFoundError:
             logging.warning(f"State file {filename} not found. Starting with an empty state.")
@@ -88,6 +195,8 @@ if __name__ == "__main__":
     contract.execute("set_value", "name", "Alice")
     name = contract.execute("get_value", "name")
     print(f"Retrieved Name: {name}")
+    contract.execute_batch([("set_value", ("age", 30)), ("get_value", ("age",))])
+    contract.flush_events()
 
     # Save and load state
     contract.save_state("contract_state.json")
@@ -1,23 +1,31 @@
+import asyncio
+import itertools
 import logging
-import json
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+DEFAULT_CHANNEL_CAPACITY = 10_000  # Unacknowledged packets per channel before senders are pushed back
+DEFAULT_BATCH_SIZE = 256
+_packet_counter = itertools.count()
+
 class Packet:
     """Represents a packet for inter-blockchain communication."""
-    def __init__(self, source_zone, destination_zone, data, packet_id=None):
+    def __init__(self, source_zone, destination_zone, data, packet_id=None, sequence=None):
         self.source_zone = source_zone
         self.destination_zone = destination_zone
         self.data = data  # Data can be a transaction, event, etc.
-        self.packet_id = packet_id or self.generate_packet_id()  # Unique identifier for the packet
         self.timestamp = time.time()  # Timestamp for the packet
+        self.packet_id = packet_id or self.generate_packet_id()  # Unique identifier for the packet
+        self.sequence = sequence  # Assigned by the channel when the packet is sent
 
     def generate_packet_id(self):
         """Generate a unique packet ID."""
-        return f"{self.source_zone}-{int(self.timestamp)}"
+        return f"{self.source_zone}-{time.time_ns()}-{next(_packet_counter)}"
 
     def to_dict(self):
         """Convert the packet to a dictionary for serialization."""
@@ -26,6 +34,7 @@ class Packet:
             'destination_zone': self.destination_zone,
             'data': self.data,
             'packet_id': self.packet_id,
+            'sequence': self.sequence,
             'timestamp': self.timestamp,
         }
 
@@ -37,41 +46,147 @@ class Packet:
             destination_zone=packet_dict['destination_zone'],
             data=packet_dict['data'],
             packet_id=packet_dict['packet_id'],
+            sequence=packet_dict.get('sequence'),
         )
 
+class Channel:
+    """Ordered, bounded queue of packets to one zone.
+
+    Every packet gets the next sequence number (starting at 1) and stays queued until the
+    destination acknowledges it, so a full channel pushes back on senders.
+    """
+    def __init__(self, zone_name, capacity=DEFAULT_CHANNEL_CAPACITY):
+        self.zone_name = zone_name
+        self.capacity = capacity
+        self.next_sequence = 1
+        self.acknowledged = 0  # Highest sequence acknowledged by the destination
+        self.packets: "OrderedDict[int, Packet]" = OrderedDict()  # Unacknowledged, by sequence
+        self.space = threading.Condition()
+
+    def __len__(self):
+        return len(self.packets)
+
+    def __iter__(self):
+        return iter(list(self.packets.values()))
+
+    def put(self, packet, timeout=0.0):
+        """Queue a packet, waiting up to `timeout` seconds for space. Returns False if full."""
+        with self.space:
+            if not self.space.wait_for(lambda: len(self.packets) < self.capacity, timeout):
+                return False
+            packet.sequence = self.next_sequence
+            self.next_sequence += 1
+            self.packets[packet.sequence] = packet
+            return True
+
+    def since(self, after_sequence=0, limit=None):
+        """Unacknowledged packets with a sequence above `after_sequence`, oldest first."""
+        with self.space:
+            start = max(after_sequence, self.acknowledged) + 1
+            end = self.next_sequence if limit is None else min(self.next_sequence, start + limit)
+            return [self.packets[sequence] for sequence in range(start, end)]
+
+    def acknowledge(self, sequence):
+        """Cumulatively acknowledge every packet up to `sequence` and free its space."""
+        with self.space:
+            while self.packets and next(iter(self.packets)) <= sequence:
+                self.packets.popitem(last=False)
+            self.acknowledged = max(self.acknowledged, sequence)
+            self.space.notify_all()
+
 class IBC:
     """Handles inter-blockchain communication."""
-    def __init__(self):
-        self.channels = defaultdict(list)  # Dictionary to manage channels between zones
-        self.retry_limit = 3  # Number of retries for sending packets
-
-    def create_channel(self, zone_name):
+    def __init__(self, channel_capacity=DEFAULT_CHANNEL_CAPACITY, retry_limit=3, retry_backoff=0.1):
+        self.channels: Dict[str, Channel] = {}  # Dictionary to manage channels between zones
+        self.channel_capacity = channel_capacity
+        self.retry_limit = retry_limit  # Number of retries for relaying a batch
+        self.retry_backoff = retry_backoff  # First retry delay in seconds, doubled on each retry
+        self.received_sequences = defaultdict(int)  # Highest sequence processed per source zone
+
+    def create_channel(self, zone_name, capacity=None):
         """Create a communication channel for a zone."""
         if zone_name not in self.channels:
-            self.channels[zone_name] = []
+            self.channels[zone_name] = Channel(zone_name, capacity or self.channel_capacity)
             logging.info(f"Channel created for zone: {zone_name}")
         else:
             logging.warning(f"Channel already exists for zone: {zone_name}")
 
-    def send_packet(self, packet):
-        """Send a packet to the destination zone with retries."""
-        logging.info(f"Sending packet from {packet.source_zone} to {packet.destination_zone}: {packet.packet_id}")
-        attempts = 0
-        while attempts < self.retry_limit:
-            if packet.destination_zone in self.channels:
-                self.channels[packet.destination_zone].append(packet)
-                logging.info(f"Packet sent: {json.dumps(packet.to_dict())}")
-                return True
-            else:
-                attempts += 1
-                logging.error(f"Destination zone {packet.destination_zone} does not have an active channel. Retrying...")
-                time.sleep(1)  # Wait before retrying
-        logging.error(f"Failed to send packet {packet.packet_id} after {self.retry_limit} attempts.")
-        return False
+    def send_packet(self, packet, timeout=0.0):
+        """Queue a packet on the destination zone's channel.
+
+        :param timeout: Seconds to wait for space if the channel is full.
+        :return: True if queued, False if there is no channel or it stayed full.
+        """
+        channel = self.channels.get(packet.destination_zone)
+        if channel is None:
+            logging.error(f"Destination zone {packet.destination_zone} does not have an active channel.")
+            return False
+        if not channel.put(packet, timeout):
+            logging.error(f"Channel to {packet.destination_zone} is full; packet {packet.packet_id} not sent.")
+            return False
+        logging.debug(f"Packet {packet.packet_id} queued to {packet.destination_zone} with sequence {packet.sequence}")
+        return True
+
+    async def relay(self, zone_name, transport: Callable[[List[Packet]], Awaitable[int]], batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Relay every queued packet on a channel in batches of `batch_size`.
+
+        :param transport: Coroutine function that delivers a batch to the destination (e.g. the
+                          destination's `receive_packets`) and returns the highest sequence it
+                          acknowledges. Failed batches are retried with exponential backoff.
+                          Relaying stops if an acknowledgement frees no packets, since
+                          resending the same batch would not make progress.
+        :return: Number of packets acknowledged.
+        """
+        channel = self.channels[zone_name]
+        acknowledged = 0
+        while True:
+            batch = channel.since(limit=batch_size)
+            if not batch:
+                return acknowledged
+            sequence = await self._relay_batch(channel, transport, batch)
+            if sequence is None:
+                return acknowledged
+            before = len(channel)
+            channel.acknowledge(sequence)
+            if len(channel) == before:
+                logging.warning(f"Acknowledgement {sequence} from {zone_name} is below batch head "
+                                f"{batch[0].sequence}; stopping relay.")
+                return acknowledged
+            acknowledged += before - len(channel)
+
+    async def _relay_batch(self, channel, transport, batch) -> Optional[int]:
+        for attempt in range(self.retry_limit + 1):
+            try:
+                return await transport(batch)
+            except Exception as e:
+                if attempt == self.retry_limit:
+                    logging.error(f"Failed to relay {len(batch)} packets to {channel.zone_name} after {attempt + 1} attempts: {e}")
+                    return None
+                delay = self.retry_backoff * 2 ** attempt
+                logging.warning(f"Relay to {channel.zone_name} failed ({e}); retrying in {delay:.2f}s.")
+                await asyncio.sleep(delay)
+
+    async def receive_packets(self, packets: List[Packet]) -> int:
+        """Receive a relayed batch in sequence order and return the highest sequence now processed.
+
+        Packets already processed (e.g. redelivered by a retry) are skipped.
+        """
+        acknowledged = 0
+        for packet in packets:
+            last = self.received_sequences[packet.source_zone]
+            if packet.sequence is not None and packet.sequence <= last:
+                acknowledged = max(acknowledged, packet.sequence)
+                continue
+            self.receive_packet(packet)
+            if packet.sequence is not None:
+                self.received_sequences[packet.source_zone] = packet.sequence
+                acknowledged = packet.sequence
+        return acknowledged
 
     def receive_packet(self, packet):
         """Receive a packet and process it."""
-        logging.info(f"Receiving packet in {packet.destination_zone}: {json.dumps(packet.to_dict())}")
+        logging.info(f"Receiving packet in {packet.destination_zone}: {packet.packet_id}")
         if self.validate_packet(packet):
             self.process_packet(packet)
         else:
@@ -92,18 +207,32 @@ class IBC:
         # Example: if packet.data.get('type') == 'smart_contract':
         #     self.smart_contracts.execute(packet.data['contract_id'], packet.data['context'])
 
-    def get_channel_packets(self, zone_name):
-        """Retrieve all packets for a specific zone."""
-        if zone_name in self.channels:
-            return self.channels[zone_name]
-        else:
+    def get_channel_packets(self, zone_name, after_sequence=0, limit=None):
+        """Retrieve unacknowledged packets for a specific zone.
+
+        :param after_sequence: Only return packets with a higher sequence, so a consumer can
+                               drain the channel incrementally.
+        :param limit: Maximum number of packets to return.
+        """
+        channel = self.channels.get(zone_name)
+        if channel is None:
             logging.warning(f"No channel found for zone: {zone_name}")
             return []
+        return channel.since(after_sequence, limit)
+
+    def acknowledge_packets(self, zone_name, sequence):
+        """Acknowledge every packet on a channel up to and including `sequence`."""
+        channel = self.channels.get(zone_name)
+        if channel is None:
+            logging.warning(f"No channel found for zone: {zone_name}")
+            return
+        channel.acknowledge(sequence)
 
     def clear_channel_packets(self, zone_name):
         """Clear all packets for a specific zone."""
         if zone_name in self.channels:
-            self.channels[zone_name] = []
+            channel = self.channels[zone_name]
+            channel.acknowledge(channel.next_sequence - 1)
             logging.info(f"Cleared packets for zone: {zone_name}")
         else:
             logging.warning(f"No channel found for zone: {zone_name}")
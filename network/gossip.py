@@ -0,0 +1,88 @@
+import logging
+import random
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+GOSSIP_TYPE = 'gossip'
+DEFAULT_FANOUT = 6
+DEFAULT_TTL = 12
+DEFAULT_SEEN_CACHE_SIZE = 100_000
+
+
+class SeenCache:
+    """Bounded LRU set of message IDs.
+
+    An exact LRU is used instead of a Bloom filter: it never drops a new message as a false
+    positive, and at the default size it costs a few MB.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SEEN_CACHE_SIZE):
+        self.capacity = capacity
+        self._ids: "OrderedDict[str, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self._ids
+
+    def add(self, message_id: str) -> bool:
+        """Record an ID; returns True if it had not been seen before."""
+        if message_id in self._ids:
+            self._ids.move_to_end(message_id)
+            return False
+        self._ids[message_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+
+
+class GossipProtocol:
+    """Epidemic dissemination: every new message is forwarded once to `fanout` random peers.
+
+    Messages travel in envelopes `{"type": "gossip", "id", "ttl", "sender", "payload"}`.
+    A node delivers and forwards each ID only the first time it sees it, and stops
+    forwarding once the hop budget (`ttl`) is used up. The protocol holds no sockets;
+    `P2PNetwork` and the simulator feed it envelopes and send whatever it returns.
+    """
+
+    def __init__(self, node_id: Hashable, fanout: int = DEFAULT_FANOUT, ttl: int = DEFAULT_TTL,
+                 seen_cache_size: int = DEFAULT_SEEN_CACHE_SIZE, rng: Optional[random.Random] = None):
+        self.node_id = node_id
+        self.fanout = fanout
+        self.ttl = ttl
+        self.seen = SeenCache(seen_cache_size)
+        self.rng = rng or random.Random()
+        self.duplicates = 0
+
+    def originate(self, payload: Any, peers: Sequence[Hashable], message_id: Optional[str] = None,
+                  ttl: Optional[int] = None) -> Tuple[Dict[str, Any], List[Hashable]]:
+        """Wrap a new payload in an envelope and pick the peers to send it to."""
+        envelope = {'type': GOSSIP_TYPE, 'id': message_id or uuid.uuid4().hex,
+                    'ttl': self.ttl if ttl is None else ttl, 'sender': self.node_id, 'payload': payload}
+        self.seen.add(envelope['id'])
+        return envelope, self.choose_targets(peers, exclude=None)
+
+    def receive(self, envelope: Dict[str, Any], peers: Sequence[Hashable]) -> Tuple[bool, Optional[Dict[str, Any]], List[Hashable]]:
+        """
+        Handle an incoming envelope.
+
+        :return: (deliver, forwarded envelope or None, peers to forward it to).
+        """
+        if not self.seen.add(envelope['id']):
+            self.duplicates += 1
+            return False, None, []
+        if envelope['ttl'] <= 0:
+            return True, None, []
+        forwarded = dict(envelope, ttl=envelope['ttl'] - 1, sender=self.node_id)
+        return True, forwarded, self.choose_targets(peers, exclude=envelope.get('sender'))
+
+    def choose_targets(self, peers: Sequence[Hashable], exclude: Optional[Hashable]) -> List[Hashable]:
+        candidates = [peer for peer in peers if peer != exclude and peer != self.node_id]
+        if len(candidates) <= self.fanout:
+            return candidates
+        return self.rng.sample(candidates, self.fanout)
@@ -0,0 +1,112 @@
+import argparse
+import heapq
+import json
+import logging
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from network.gossip import DEFAULT_FANOUT, DEFAULT_TTL, GossipProtocol
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+@dataclass
+class SimulationResult:
+    peers: int
+    mode: str
+    coverage: float  # Fraction of peers that delivered the message
+    latency_p50: float  # Seconds until half the peers had it
+    latency_max: float  # Seconds until the last reached peer had it
+    messages_sent: int
+    bytes_sent: int
+    duplicates: int
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self.__dict__)
+
+
+def build_overlay(peers: int, degree: int, rng: random.Random) -> List[List[int]]:
+    """Random undirected overlay in which every peer has at least `degree` neighbours."""
+    neighbours = [set() for _ in range(peers)]
+    for node in range(peers):
+        while len(neighbours[node]) < min(degree, peers - 1):
+            other = rng.randrange(peers)
+            if other != node:
+                neighbours[node].add(other)
+                neighbours[other].add(node)
+    return [sorted(n) for n in neighbours]
+
+
+def simulate(peers: int, fanout: Optional[int] = DEFAULT_FANOUT, ttl: int = DEFAULT_TTL, degree: int = 16,
+             payload_size: int = 256, min_latency: float = 0.01, max_latency: float = 0.1,
+             seed: int = 0) -> SimulationResult:
+    """
+    Disseminate one message from peer 0 through an in-process network of `peers` nodes.
+
+    Each node runs its own `GossipProtocol`; sends are delivered after a random per-hop
+    latency by a discrete-event loop. `fanout=None` simulates flooding (every node relays
+    to all of its neighbours), which is what `P2PNetwork.broadcast` does without gossip.
+    """
+    rng = random.Random(seed)
+    overlay = build_overlay(peers, degree, rng)
+    protocols = [GossipProtocol(node, fanout=fanout or peers, ttl=ttl, rng=random.Random(seed * 7919 + node))
+                 for node in range(peers)]
+    delivered_at: Dict[int, float] = {0: 0.0}
+    messages_sent = 0
+    bytes_sent = 0
+    events = []
+    sequence = 0
+
+    def send(now: float, envelope: dict, targets: List[int]):
+        nonlocal messages_sent, bytes_sent, sequence
+        size = len(json.dumps(envelope))
+        for target in targets:
+            messages_sent += 1
+            bytes_sent += size
+            sequence += 1
+            heapq.heappush(events, (now + rng.uniform(min_latency, max_latency), sequence, target, envelope))
+
+    envelope, targets = protocols[0].originate('x' * payload_size, overlay[0], message_id='sim')
+    send(0.0, envelope, targets)
+    while events:
+        now, _, node, envelope = heapq.heappop(events)
+        deliver, forwarded, targets = protocols[node].receive(envelope, overlay[node])
+        if deliver:
+            delivered_at[node] = now
+            if forwarded is not None:
+                send(now, forwarded, targets)
+
+    times = sorted(delivered_at.values())
+    return SimulationResult(
+        peers=peers,
+        mode='flood' if fanout is None else f'gossip(fanout={fanout})',
+        coverage=len(delivered_at) / peers,
+        latency_p50=times[min(len(times) - 1, peers // 2)] if len(times) > peers // 2 else math.inf,
+        latency_max=times[-1],
+        messages_sent=messages_sent,
+        bytes_sent=bytes_sent,
+        duplicates=sum(p.duplicates for p in protocols),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare gossip and flooding on a simulated overlay.")
+    parser.add_argument('--peers', type=int, nargs='+', default=[100, 500, 1000, 5000])
+    parser.add_argument('--fanout', type=int, default=DEFAULT_FANOUT)
+    parser.add_argument('--ttl', type=int, default=DEFAULT_TTL)
+    parser.add_argument('--degree', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'peers':>6} {'mode':>18} {'coverage':>9} {'p50 s':>7} {'max s':>7} {'messages':>9} {'MB':>8}")
+    for peers in args.peers:
+        for fanout in (None, args.fanout):
+            result = simulate(peers, fanout=fanout, ttl=args.ttl, degree=args.degree, seed=args.seed)
+            print(f"{result.peers:>6} {result.mode:>18} {result.coverage:>9.4f} {result.latency_p50:>7.3f} "
+                  f"{result.latency_max:>7.3f} {result.messages_sent:>9} {result.bytes_sent / 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
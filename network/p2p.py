@@ -3,20 +3,43 @@ import threading
 import json
 import logging
 import ssl
+import time
 from cryptography.fernet import Fernet
+from core.async_transport import FrameDecoder
+from network.gossip import DEFAULT_TTL, GOSSIP_TYPE, GossipProtocol
+from network.peer_session import SessionPool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+PROBE_TIMEOUT = 5.0  # Seconds to wait when probing a peer that has no session
+
 class P2PNetwork:
-    def __init__(self, host: str, port: int):
-        """Initialize the P2P network."""
+    def __init__(self, host: str, port: int, key: bytes = None, batch_window: float = 0.005,
+                 heartbeat_interval: float = 10.0, max_failures: int = 3, gossip_fanout: int = None,
+                 gossip_ttl: int = DEFAULT_TTL):
+        """Initialize the P2P network.
+
+        :param key: Shared Fernet key; peers can only talk if they use the same key.
+        :param batch_window: Seconds a session waits to coalesce queued messages into one frame.
+        :param heartbeat_interval: Seconds of silence after which a peer is sent a heartbeat.
+        :param max_failures: Consecutive failed writes after which a peer is dropped.
+        :param gossip_fanout: If set, `broadcast` gossips to this many random peers per hop
+                              instead of sending to every peer.
+        :param gossip_ttl: Hop limit for gossiped messages.
+        """
         self.host = host
         self.port = port
         self.peers = set()  # Set of connected peers
         self.server = self.create_server_socket()
-        self.key = Fernet.generate_key()  # Generate a key for encryption
+        self.port = self.server.getsockname()[1]  # Resolves port 0
+        self.key = key or Fernet.generate_key()  # Generate a key for encryption
         self.cipher = Fernet(self.key)
+        self.heartbeat_interval = heartbeat_interval
+        self.sessions = SessionPool(self.cipher, batch_window=batch_window, max_failures=max_failures)
+        self.probe_failures = {}  # Consecutive failed probes of peers without a session
+        self.gossip_fanout = gossip_fanout
+        self.gossip = GossipProtocol((self.host, self.port), fanout=gossip_fanout or 1, ttl=gossip_ttl)
         logging.info(f"P2P network initialized on {self.host}:{self.port}")
 
     def create_server_socket(self):
@@ -34,24 +57,33 @@ class P2PNetwork:
     def accept_connections(self):
         """Accept incoming connections from peers."""
         while True:
-            client_socket, address = self.server.accept()
+            try:
+                client_socket, address = self.server.accept()
+            except OSError:
+                break  # Server socket closed by stop()
             logging.info(f"Connection established with {address}")
             self.peers.add(address)
             threading.Thread(target=self.handle_peer, args=(client_socket,), daemon=True).start()
 
     def handle_peer(self, client_socket):
-        """Handle communication with a connected peer."""
+        """Handle communication with a connected peer.
+
+        Each frame carries one encrypted batch (a JSON list) of messages.
+        """
+        decoder = FrameDecoder()
         while True:
             try:
-                message = client_socket.recv(1024).decode()
-                if message:
-                    decrypted_message = self.decrypt_message(message)
-                    if self.validate_message(decrypted_message):
-                        self.process_message(json.loads(decrypted_message))
-                    else:
-                        logging.warning("Received invalid message.")
-                else:
+                data = client_socket.recv(65536)
+                if not data:
                     break
+                for _, encrypted_batch in decoder.feed(data):
+                    for message in json.loads(self.decrypt_message(encrypted_batch)):
+                        if not self.validate_message(message):
+                            logging.warning("Received invalid message.")
+                        elif message['type'] == GOSSIP_TYPE:
+                            self.handle_gossip(message)
+                        else:
+                            self.process_message(message)
             except Exception as e:
                 logging.error(f"Error handling peer: {e}")
                 break
@@ -62,15 +94,9 @@ class P2PNetwork:
         logging.info(f"Received message: {message}")
 
     def send_message(self, peer_address, message):
-        """Send a message to a specific peer."""
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.connect(peer_address)
-                encrypted_message = self.encrypt_message(json.dumps(message))
-                sock.sendall(encrypted_message.encode())
-                logging.info(f"Sent message to {peer_address}: {message}")
-        except Exception as e:
-            logging.error(f"Failed to send message to {peer_address}: {e}")
+        """Queue a message on the persistent session to a specific peer."""
+        self.sessions.get(tuple(peer_address)).send(message)
+        logging.debug(f"Queued message for {peer_address}: {message}")
 
     def encrypt_message(self, message: str) -> str:
         """Encrypt a message using Fernet symmetric encryption."""
@@ -86,20 +112,89 @@ class P2PNetwork:
         return isinstance(message, dict) and 'type' in message
 
     def broadcast(self, message):
-        """Broadcast a message to all peers in the network."""
-        for peer in self.peers:
+        """Broadcast a message to all peers in the network.
+
+        Every peer has its own session writer, so the sends proceed concurrently. With
+        `gossip_fanout` set the message is gossiped instead.
+        """
+        if self.gossip_fanout:
+            self.gossip_message(message)
+            return
+        for peer in list(self.peers):
             self.send_message(peer, message)
 
+    def gossip_message(self, message, ttl: int = None) -> str:
+        """Start gossiping a message to a random subset of peers; returns its gossip ID."""
+        envelope, targets = self.gossip.originate(message, list(self.peers), ttl=ttl)
+        for peer in targets:
+            self.send_message(peer, envelope)
+        return envelope['id']
+
+    def handle_gossip(self, envelope):
+        """Deliver a gossiped message the first time it is seen and pass it on while hops remain."""
+        envelope['sender'] = tuple(envelope.get('sender') or ())
+        deliver, forwarded, targets = self.gossip.receive(envelope, list(self.peers))
+        if not deliver:
+            return
+        for peer in targets:
+            self.send_message(peer, forwarded)
+        if self.validate_message(envelope['payload']):
+            self.process_message(envelope['payload'])
+
+    def flush(self):
+        """Block until every queued message has been written to its peer."""
+        self.sessions.flush()
+
+    def peer_health(self):
+        """Return per-peer session statistics."""
+        return {address: {'healthy': session.healthy, 'idle_for': session.idle_for,
+                          'consecutive_failures': session.consecutive_failures,
+                          'messages_sent': session.messages_sent, 'frames_sent': session.frames_sent}
+                for address, session in self.sessions.sessions.items()}
+
+    def check_peers(self):
+        """Drop peers whose sessions keep failing and ping the ones that have gone quiet.
+
+        Peers without a session are probed with a bare connection rather than given a session
+        and writer thread, and dropped once `max_failures` probes in a row have failed.
+        """
+        max_failures = self.sessions.session_options['max_failures']
+        for peer in list(self.peers):
+            session = self.sessions.find(peer)
+            if session is None:
+                if self.probe_peer(peer):
+                    self.probe_failures.pop(peer, None)
+                    continue
+                self.probe_failures[peer] = self.probe_failures.get(peer, 0) + 1
+                if self.probe_failures[peer] >= max_failures:
+                    logging.warning(f"Peer {peer} is unreachable. Removing from peers.")
+                    self.peers.discard(peer)
+                    del self.probe_failures[peer]
+            elif not session.healthy:
+                logging.warning(f"Peer {peer} is unresponsive. Removing from peers.")
+                self.peers.discard(peer)
+                self.sessions.remove(peer)
+            elif session.idle_for >= self.heartbeat_interval:
+                session.send({"type": "heartbeat"})
+
+    def probe_peer(self, peer) -> bool:
+        """Return whether a TCP connection to the peer can be opened."""
+        try:
+            with socket.create_connection(tuple(peer), timeout=PROBE_TIMEOUT):
+                return True
+        except OSError:
+            return False
+
     def heartbeat(self):
-        """Send heartbeat messages to connected peers to check their status."""
+        """Track the status of connected peers over their existing sessions."""
         while True:
-            for peer in list(self.peers):
-                try:
-                    self.send_message(peer, {"type": "heartbeat"})
-                except Exception as e:
-                    logging.warning(f"Peer {peer} is unresponsive. Removing from peers.")
-                    self.peers.remove(peer)
-            time.sleep(10)  # Send heartbeat every 10 seconds
+            self.check_peers()
+            time.sleep(self.heartbeat_interval)
+
+    def stop(self):
+        """Close all peer sessions and the server socket."""
+        self.sessions.close()
+        self.server.close()
 
 # Example usage
 if __name__ == "__main__":
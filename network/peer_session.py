@@ -0,0 +1,164 @@
+import json
+import logging
+import queue
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from core.async_transport import encode_frame
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+class PeerSession:
+    """A long-lived, encrypted connection to one peer.
+
+    Messages are queued and a writer thread coalesces everything that arrives within
+    `batch_window` seconds (up to `max_batch` messages) into a single frame, so a burst
+    of gossip costs one Fernet encryption and one write instead of one connection each.
+    The session reconnects on demand and tracks the peer's health.
+    """
+
+    def __init__(self, address: Tuple[str, int], cipher, batch_window: float = 0.005, max_batch: int = 256,
+                 connect_timeout: float = 5.0, max_failures: int = 3):
+        self.address = address
+        self.cipher = cipher
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.connect_timeout = connect_timeout
+        self.max_failures = max_failures
+        self.queue: "queue.Queue[Optional[str]]" = queue.Queue()  # Messages, already JSON encoded
+        self.sock: Optional[socket.socket] = None
+        self.consecutive_failures = 0
+        self.last_success = 0.0
+        self.messages_sent = 0
+        self.frames_sent = 0
+        self.closed = False
+        self.writer = threading.Thread(target=self._write_loop, name=f"peer-{address[0]}:{address[1]}", daemon=True)
+        self.writer.start()
+
+    @property
+    def healthy(self) -> bool:
+        return self.consecutive_failures < self.max_failures
+
+    @property
+    def idle_for(self) -> float:
+        return time.time() - self.last_success if self.last_success else float('inf')
+
+    def send(self, message: Dict[str, Any]):
+        """Queue a message for the next batch; never blocks on the network.
+
+        The message is JSON encoded here, so one that cannot be serialized raises to the caller
+        instead of reaching the writer thread.
+        """
+        if not self.closed:
+            self.queue.put(json.dumps(message))
+
+    def flush(self):
+        """Block until every queued message has been written or dropped."""
+        self.queue.join()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.writer.join(timeout=self.connect_timeout)
+        self._disconnect()
+
+    def _write_loop(self):
+        while True:
+            message = self.queue.get()
+            if message is None:
+                self.queue.task_done()
+                return
+            batch = [message]
+            deadline = time.monotonic() + self.batch_window
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    following = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if following is None:
+                    stop = True
+                    break
+                batch.append(following)
+            try:
+                self._send_batch(batch)
+            except Exception as e:  # Keep the writer alive so later messages and flush() still complete
+                logging.error(f"Dropped {len(batch)} message(s) to {self.address}: {e}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    self.queue.task_done()
+            if stop:
+                return
+
+    def _send_batch(self, batch: List[str]):
+        payload = '[' + ','.join(batch) + ']'
+        frame = encode_frame(self.cipher.encrypt(payload.encode()).decode())
+        for attempt in range(2):  # Retry once on a fresh connection if the old one went stale
+            try:
+                if self.sock is None:
+                    self.sock = socket.create_connection(self.address, timeout=self.connect_timeout)
+                self.sock.sendall(frame)
+                self.consecutive_failures = 0
+                self.last_success = time.time()
+                self.messages_sent += len(batch)
+                self.frames_sent += 1
+                return
+            except OSError as e:
+                self._disconnect()
+                if attempt == 1:
+                    self.consecutive_failures += 1
+                    logging.error(f"Failed to send {len(batch)} message(s) to {self.address}: {e}")
+
+    def _disconnect(self):
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+
+class SessionPool:
+    """One PeerSession per peer address, created on first use."""
+
+    def __init__(self, cipher, **session_options):
+        self.cipher = cipher
+        self.session_options = session_options
+        self.sessions: Dict[Tuple[str, int], PeerSession] = {}
+        self.lock = threading.Lock()
+
+    def get(self, address: Tuple[str, int]) -> PeerSession:
+        with self.lock:
+            session = self.sessions.get(address)
+            if session is None or session.closed:
+                session = PeerSession(address, self.cipher, **self.session_options)
+                self.sessions[address] = session
+            return session
+
+    def find(self, address: Tuple[str, int]) -> Optional[PeerSession]:
+        """Return the open session to a peer, if there is one, without creating it."""
+        with self.lock:
+            session = self.sessions.get(address)
+        return None if session is None or session.closed else session
+
+    def remove(self, address: Tuple[str, int]):
+        with self.lock:
+            session = self.sessions.pop(address, None)
+        if session is not None:
+            session.close()
+
+    def flush(self):
+        for session in list(self.sessions.values()):
+            session.flush()
+
+    def close(self):
+        with self.lock:
+            sessions, self.sessions = list(self.sessions.values()), {}
+        for session in sessions:
+            session.close()
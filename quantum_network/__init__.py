@@ -9,7 +9,7 @@ including quantum nodes, communication protocols, and integration with blockchai
 from .node import QuantumNode
 from .communication import quantum_communication
 from .oracle import QuantumOracle
-from .qkd import QuantumKeyDistribution
+from .qkd import BB84Engine, QuantumKeyDistribution
 from .utils import generate_random_key, validate_message
 
 __all__ = [
@@ -17,6 +17,7 @@ __all__ = [
     "quantum_communication",
     "QuantumOracle",
     "QuantumKeyDistribution",
+    "BB84Engine",
     "generate_random_key",
     "validate_message"
 ]
@@ -2,32 +2,237 @@
 
 import numpy as np
 import random
+from dataclasses import dataclass
+from typing import Optional, Union
+
+RECTILINEAR = 0  # '+' basis
+DIAGONAL = 1  # 'x' basis
+
+
+def binary_entropy(p: float) -> float:
+    """Shannon entropy of a biased coin, in bits."""
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return float(-p * np.log2(p) - (1 - p) * np.log2(1 - p))
+
+
+def toeplitz_hash(bits: np.ndarray, seed: np.ndarray, output_length: int) -> np.ndarray:
+    """
+    Compress `bits` to `output_length` bits with a random binary Toeplitz matrix (a 2-universal hash).
+
+    The matrix is defined by `seed`, of length len(bits) + output_length - 1, and the product is
+    computed as a convolution via FFT, so it costs O(n log n) rather than O(n * output_length).
+
+    Args:
+        bits (np.ndarray): Input bits (0/1).
+        seed (np.ndarray): Bits defining the Toeplitz matrix.
+        output_length (int): Number of output bits.
+
+    Returns:
+        np.ndarray: The hashed bits as uint8.
+    """
+    n = len(bits)
+    if output_length <= 0 or n == 0:
+        return np.zeros(0, dtype=np.uint8)
+    size = 1 << (len(seed) + n - 1).bit_length()
+    product = np.fft.irfft(np.fft.rfft(seed.astype(np.float64), size) * np.fft.rfft(bits.astype(np.float64), size), size)
+    # Row i of the matrix is seed[i + n - 1 - j] for column j, i.e. convolution index i + n - 1
+    counts = np.rint(product[n - 1:n - 1 + output_length]).astype(np.int64)
+    return (counts & 1).astype(np.uint8)
+
+
+@dataclass
+class BB84Result:
+    """
+    Outcome of one BB84 run.
+
+    Attributes:
+        key (np.ndarray): Final key bits after error correction and privacy amplification.
+        qubits (int): Qubits sent.
+        sifted_length (int): Bits where sender and receiver bases matched.
+        sample_size (int): Sifted bits disclosed to estimate the error rate.
+        qber (float): Estimated quantum bit error rate.
+        aborted (bool): True when the error rate exceeded the threshold and no key was produced.
+    """
+    key: np.ndarray
+    qubits: int
+    sifted_length: int
+    sample_size: int
+    qber: float
+    aborted: bool = False
+
+    def key_bytes(self) -> bytes:
+        """Returns the key packed into bytes (most significant bit first)."""
+        return np.packbits(self.key).tobytes()
+
+
+class BB84Engine:
+    """
+    Vectorized BB84 simulation: every step runs over whole NumPy arrays of qubits.
+
+    Error correction is modelled as ideal: the receiver ends with the sender's sifted bits, and
+    the information it would leak, about h(QBER) per bit, is charged in privacy amplification.
+    """
+
+    def __init__(self, rng: Union[np.random.Generator, int, None] = None, channel_error: float = 0.0,
+                 eavesdropper: bool = False):
+        """
+        Args:
+            rng (np.random.Generator | int, optional): Generator or seed, for reproducible runs.
+            channel_error (float): Probability that the channel flips a measured bit.
+            eavesdropper (bool): Simulate an intercept-resend attack on every qubit.
+        """
+        self.rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+        self.channel_error = channel_error
+        self.eavesdropper = eavesdropper
+
+    def _measure(self, bits: np.ndarray, send_bases: np.ndarray, measure_bases: np.ndarray) -> np.ndarray:
+        """Measuring in the sending basis returns the bit; the other basis gives a fair coin."""
+        random_bits = self.rng.integers(0, 2, len(bits), dtype=np.uint8)
+        return np.where(send_bases == measure_bases, bits, random_bits)
+
+    def exchange(self, num_qubits: int):
+        """
+        Generates, sends and measures qubits, then sifts on matching bases.
+
+        Args:
+            num_qubits (int): Number of qubits to send.
+
+        Returns:
+            tuple: (sender's sifted bits, receiver's sifted bits) as uint8 arrays.
+        """
+        rng = self.rng
+        sender_bits = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+        sender_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+        receiver_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+
+        bits, bases = sender_bits, sender_bases
+        if self.eavesdropper:
+            eve_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+            bits, bases = self._measure(bits, bases, eve_bases), eve_bases  # Resent in Eve's basis
+        received = self._measure(bits, bases, receiver_bases)
+        if self.channel_error:
+            received ^= (rng.random(num_qubits) < self.channel_error).astype(np.uint8)
+
+        matched = sender_bases == receiver_bases
+        return sender_bits[matched], received[matched]
+
+    def run(self, num_qubits: int, sample_fraction: float = 0.1, max_qber: float = 0.11,
+            privacy_amplification: bool = True, security_margin: int = 64) -> BB84Result:
+        """
+        Runs BB84 end to end.
+
+        Args:
+            num_qubits (int): Number of qubits to send.
+            sample_fraction (float): Share of sifted bits disclosed to estimate the error rate;
+                0 skips error estimation.
+            max_qber (float): Abort above this error rate (11% is the BB84 one-way limit).
+            privacy_amplification (bool): Compress the key to remove leaked information.
+            security_margin (int): Extra bits removed during privacy amplification.
+
+        Returns:
+            BB84Result: The key and run statistics.
+        """
+        sender, receiver = self.exchange(num_qubits)
+        sifted_length = len(sender)
+
+        qber = 0.0
+        sample_size = 0
+        if sample_fraction > 0 and sifted_length:
+            disclosed = self.rng.random(sifted_length) < sample_fraction
+            sample_size = int(disclosed.sum())
+            if sample_size:
+                qber = float(np.count_nonzero(sender[disclosed] != receiver[disclosed])) / sample_size
+            sender = sender[~disclosed]
+        if qber > max_qber:
+            return BB84Result(np.zeros(0, dtype=np.uint8), num_qubits, sifted_length, sample_size, qber, aborted=True)
+
+        key = sender  # Ideal error correction: the receiver's bits now equal the sender's
+        if privacy_amplification:
+            # Shor-Preskill rate: error correction and eavesdropping each cost h(QBER) per bit
+            output_length = int(len(key) * (1 - 2 * binary_entropy(qber))) - security_margin
+            seed = self.rng.integers(0, 2, len(key) + max(output_length, 1) - 1, dtype=np.uint8)
+            key = toeplitz_hash(key, seed, output_length)
+        return BB84Result(key, num_qubits, sifted_length, sample_size, qber)
+
+    def generate_key(self, key_bits: int = 256, sample_fraction: float = 0.1, max_qber: float = 0.11,
+                     security_margin: int = 64, max_attempts: int = 8) -> Optional[BB84Result]:
+        """
+        Runs BB84 with enough qubits to yield at least `key_bits` final bits, truncating to that length.
+
+        Args:
+            key_bits (int): Required key length in bits.
+            sample_fraction (float): Share of sifted bits disclosed to estimate the error rate.
+            max_qber (float): Abort above this error rate.
+            security_margin (int): Extra bits removed during privacy amplification.
+            max_attempts (int): Runs to try, doubling the qubit count each time, before giving up.
+
+        Returns:
+            BB84Result: A result whose key has exactly `key_bits` bits, or None if every run fell short
+                or aborted.
+        """
+        # Half the qubits survive sifting; allow for the disclosed sample and the margin
+        num_qubits = int(2 * (key_bits + security_margin) / (1 - sample_fraction) * 1.25) + 64
+        for _ in range(max_attempts):
+            result = self.run(num_qubits, sample_fraction, max_qber, True, security_margin)
+            if result.aborted:
+                return None
+            if len(result.key) >= key_bits:
+                result.key = result.key[:key_bits]
+                return result
+            num_qubits *= 2
+        return None
+
 
 class QuantumKeyDistribution:
-    def __init__(self, sender_id: str, receiver_id: str):
+    def __init__(self, sender_id: str, receiver_id: str, key_length: int = 8, verbose: bool = True,
+                 rng: Union[np.random.Generator, int, None] = None):
         """
         Initialize the Quantum Key Distribution (QKD) system.
 
         Args:
             sender_id (str): Unique identifier for the sender.
             receiver_id (str): Unique identifier for the receiver.
+            key_length (int): Number of qubits exchanged by the step-by-step methods.
+            verbose (bool): Print each intermediate list in the step-by-step methods.
+            rng (np.random.Generator | int, optional): Generator or seed for generate_session_key.
         """
         self.sender_id = sender_id
         self.receiver_id = receiver_id
-        self.key_length = 8  # Length of the key to be generated
+        self.key_length = key_length  # Length of the key to be generated
+        self.verbose = verbose
+        self.engine = BB84Engine(rng)
         self.sender_bits = []  # Bits generated by the sender
         self.sender_bases = []  # Bases used by the sender
         self.receiver_bits = []  # Bits received by the receiver
         self.receiver_bases = []  # Bases used by the receiver
         self.shared_key = []  # Final shared key
 
+    def generate_session_key(self, key_bits: int = 256, **options) -> Optional[bytes]:
+        """
+        Generate a session key with the vectorized BB84 engine.
+
+        Args:
+            key_bits (int): Key length in bits.
+            **options: Passed to BB84Engine.generate_key (sample_fraction, max_qber, security_margin).
+
+        Returns:
+            bytes: The key, or None if the error rate was too high.
+        """
+        result = self.engine.generate_key(key_bits, **options)
+        if result is None:
+            return None
+        self.shared_key = result.key.tolist()
+        return result.key_bytes()
+
     def generate_bits(self):
         """
         Generate random bits and bases for the sender.
         """
         self.sender_bits = [random.randint(0, 1) for _ in range(self.key_length)]
         self.sender_bases = [random.choice(['+','x']) for _ in range(self.key_length)]
-        print(f"{self.sender_id}: Generated bits {self.sender_bits} with bases {self.sender_bases}.")
+        if self.verbose:
+            print(f"{self.sender_id}: Generated bits {self.sender_bits} with bases {self.sender_bases}.")
 
     def encode_bits(self):
         """
@@ -42,14 +247,16 @@ class QuantumKeyDistribution:
                 # Encode in the diagonal basis
                 encoded_states.append(2 if bit == 0 else 3)  # 0 -> |+>, 1 -> |->
 
-        print(f"{self.sender_id}: Encoded states {encoded_states}.")
+        if self.verbose:
+            print(f"{self.sender_id}: Encoded states {encoded_states}.")
         return encoded_states
 
     def transmit(self, encoded_states):
         """
         Simulate the transmission of encoded states to the receiver.
         """
-        print(f"{self.sender_id}: Transmitting encoded states to {self.receiver_id}.")
+        if self.verbose:
+            print(f"{self.sender_id}: Transmitting encoded states to {self.receiver_id}.")
         self.receiver_receive(encoded_states)
 
     def receiver_receive(self, encoded_states):
@@ -57,7 +264,8 @@ class QuantumKeyDistribution:
         Simulate the receiver's measurement of the transmitted states.
         """
         self.receiver_bases = [random.choice(['+','x']) for _ in range(self.key_length)]
-        print(f"{self.receiver_id}: Chose bases {self.receiver_bases} for measurement.")
+        if self.verbose:
+            print(f"{self.receiver_id}: Chose bases {self.receiver_bases} for measurement.")
 
         for state, base in zip(encoded_states, self.receiver_bases):
             if base == '+':
@@ -70,7 +278,8 @@ class QuantumKeyDistribution:
                 else:
                     self.receiver_bits.append(state)  # |0> or |1> states remain unchanged
 
-        print(f"{self.receiver_id}: Received bits {self.receiver_bits}.")
+        if self.verbose:
+            print(f"{self.receiver_id}: Received bits {self.receiver_bits}.")
 
     def sift_key(self):
         """
@@ -80,7 +289,8 @@ class QuantumKeyDistribution:
             if sender_base == receiver_base:
                 self.shared_key.append(receiver_bit)
 
-        print(f"Shared key after sifting: {self.shared_key}")
+        if self.verbose:
+            print(f"Shared key after sifting: {self.shared_key}")
 
 # Example usage
 if __name__ == "__main__":
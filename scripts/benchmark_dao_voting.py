@@ -0,0 +1,49 @@
+import argparse
+import random
+import threading
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from src.generative_ai.dao_voting import DAOVoting
+
+
+def run_benchmark(history, active, threads, votes_per_thread):
+    """Concurrent votes on the newest proposals, behind `history` older ones."""
+    voting = DAOVoting('benchmark')
+    for i in range(history + active):
+        voting.propose_feature(f"Feature {i}")
+    targets = list(range(history + 1, history + active + 1))
+
+    def cast(seed):
+        rng = random.Random(seed)
+        for _ in range(votes_per_thread):
+            voting.vote(rng.choice(targets), 'yes' if rng.random() < 0.5 else 'no')
+
+    workers = [threading.Thread(target=cast, args=(seed,)) for seed in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    counted = sum(sum(voting.get_results(target).values()) for target in targets)
+    assert counted == threads * votes_per_thread, "Lost votes under concurrency"
+    print(f"{history:>10,} {threads:>8} {counted:>10,} {counted / elapsed:>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent DAO voting against proposal history size.")
+    parser.add_argument('--history', type=int, nargs='+', default=[0, 10_000, 100_000])
+    parser.add_argument('--active', type=int, default=100)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--votes-per-thread', type=int, default=25_000)
+    args = parser.parse_args()
+
+    print(f"{'history':>10} {'threads':>8} {'votes':>10} {'votes/s':>12}")
+    for history in args.history:
+        run_benchmark(history, args.active, args.threads, args.votes_per_thread)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import os
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from modules.data_availability.erasure_coding import ErasureCoder
+
+
+def measure(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def run_benchmark(size, k, n, repeat):
+    """Encode throughput, plus decode from data chunks only and from parity-heavy subsets."""
+    coder = ErasureCoder(k, n)
+    blob = os.urandom(size)
+    encode_time, chunks = measure(lambda: coder.encode(blob), repeat)
+    systematic = {i: chunks[i] for i in range(k)}
+    worst_case = {i: chunks[i] for i in range(n - k, n)}  # As many parity chunks as possible
+    fast_time, _ = measure(lambda: coder.decode(systematic, size), repeat)
+    slow_time, decoded = measure(lambda: coder.decode(worst_case, size), repeat)
+    assert decoded == blob
+    mb = size / 1e6
+    print(f"{size:>11,} {k:>4}/{n:<4} {mb / encode_time:>10.1f} {mb / fast_time:>14.1f} {mb / slow_time:>14.1f} "
+          f"{n / k:>9.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Reed-Solomon encode/decode throughput.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[64 * 1024, 1024 * 1024, 16 * 1024 * 1024])
+    parser.add_argument('--k', type=int, default=16)
+    parser.add_argument('--n', type=int, default=32)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'blob bytes':>11} {'k/n':>9} {'encode MB/s':>10} {'decode data MB/s':>14} {'decode parity MB/s':>14} "
+          f"{'overhead':>9}")
+    for size in args.sizes:
+        run_benchmark(size, args.k, args.n, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
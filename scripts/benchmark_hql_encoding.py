@@ -0,0 +1,50 @@
+import argparse
+import random
+import string
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from hql.quantum_interference import QuantumInterference
+
+
+def measure(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def run_benchmark(interference, values, method):
+    """Per-item and batched throughput for one encoding method, checking both agree."""
+    encode_loop, encoded = measure(lambda: [interference.encode(value, method) for value in values])
+    encode_batch, batched = measure(lambda: interference.encode_many(values, method))
+    assert batched == encoded
+    decode_loop, _ = measure(lambda: [interference.decode(data, method) for data in encoded])
+    decode_batch, decoded = measure(lambda: interference.decode_many(encoded, method))
+    assert decoded == values
+    count = len(values)
+    print(f"{method:>9} {count:>9,} {count / encode_loop:>13,.0f} {count / encode_batch:>13,.0f} "
+          f"{count / decode_loop:>13,.0f} {count / decode_batch:>13,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-item vs batched QuantumInterference encoding.")
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--min-length', type=int, default=16)
+    parser.add_argument('--max-length', type=int, default=64)
+    parser.add_argument('--methods', nargs='+', default=['basic', 'advanced'])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    alphabet = string.ascii_letters + string.digits + ' '
+    values = [''.join(rng.choices(alphabet, k=rng.randint(args.min_length, args.max_length)))
+              for _ in range(args.count)]
+    interference = QuantumInterference()
+
+    print(f"{'method':>9} {'values':>9} {'enc/s loop':>13} {'enc/s batch':>13} {'dec/s loop':>13} {'dec/s batch':>13}")
+    for method in args.methods:
+        run_benchmark(interference, values, method)
+
+
+if __name__ == "__main__":
+    main()
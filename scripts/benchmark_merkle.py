@@ -0,0 +1,57 @@
+import argparse
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from core.blockchain import Block
+from core.merkle import MerkleTree, verify_proof
+
+
+def make_transactions(count):
+    return [{'sender': f'{i:064x}', 'recipient': f'{i * 7:064x}', 'amount': float(i), 'signature': f'{i:0128x}'}
+            for i in range(count)]
+
+
+def run_benchmark(count, samples):
+    """Compare building, proving and verifying against shipping and re-hashing the full block."""
+    transactions = make_transactions(count)
+
+    start = time.perf_counter()
+    tree = MerkleTree()
+    for transaction in transactions:
+        tree.append(transaction)
+    root = tree.root()
+    build_time = time.perf_counter() - start
+
+    step = max(1, count // samples)
+    indices = range(0, count, step)
+    start = time.perf_counter()
+    proofs = [tree.proof(index) for index in indices]
+    proof_time = (time.perf_counter() - start) / len(proofs)
+
+    start = time.perf_counter()
+    for index, proof in zip(indices, proofs):
+        assert verify_proof(transactions[index], proof, root)
+    verify_time = (time.perf_counter() - start) / len(proofs)
+
+    block = Block(index=1, previous_hash='0' * 64, timestamp=time.time(), transactions=transactions)
+    start = time.perf_counter()
+    full_bytes = block.to_bytes()
+    Block.from_bytes(full_bytes)
+    full_time = time.perf_counter() - start
+
+    proof_bytes = len(proofs[0]) * 33
+    print(f"transactions:          {count}")
+    print(f"incremental build:     {build_time * 1000:.1f} ms")
+    print(f"proof generation:      {proof_time * 1e6:.1f} us/proof")
+    print(f"proof verification:    {verify_time * 1e6:.1f} us/proof")
+    print(f"proof size:            {len(proofs[0])} hashes (~{proof_bytes} bytes)")
+    print(f"full block decode:     {full_time * 1000:.1f} ms ({len(full_bytes)} bytes)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Merkle commitments over large blocks.")
+    parser.add_argument('--transactions', type=int, default=10_000)
+    parser.add_argument('--samples', type=int, default=1000)
+    args = parser.parse_args()
+    run_benchmark(args.transactions, args.samples)
@@ -0,0 +1,30 @@
+import argparse
+import multiprocessing
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from core.mining_engine import MiningEngine
+
+
+def run_benchmark(difficulties, workers, rounds):
+    """Mine `rounds` proofs per difficulty and report aggregate and per-core hash rates."""
+    engine = MiningEngine(workers=workers, inline_difficulty=0)
+    print(f"{'difficulty':>10} {'workers':>8} {'hashes':>12} {'seconds':>9} {'H/s':>12} {'H/s/core':>12}")
+    for difficulty in difficulties:
+        hashes = 0
+        elapsed = 0.0
+        for previous_nonce in range(rounds):
+            result = engine.search(prefix=str(previous_nonce), difficulty=difficulty)
+            hashes += result.hashes
+            elapsed += result.elapsed
+        rate = hashes / elapsed if elapsed else 0.0
+        print(f"{difficulty:>10} {result.workers:>8} {hashes:>12} {elapsed:>9.2f} {rate:>12.0f} {rate / result.workers:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the parallel proof-of-work engine.")
+    parser.add_argument('--difficulties', type=int, nargs='+', default=[3, 4, 5])
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    run_benchmark(args.difficulties, args.workers, args.rounds)
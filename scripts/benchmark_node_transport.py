@@ -0,0 +1,58 @@
+import argparse
+import asyncio
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from core.async_transport import AsyncNodeTransport, FramedConnection
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run_benchmark(peers, requests_per_peer, payload_size):
+    """Open `peers` loopback connections and have each issue sequential round-trip requests."""
+    server = AsyncNodeTransport('127.0.0.1', 0, handler=lambda message, connection: message)
+    await server.start()
+
+    connections = []
+    for _ in range(peers):
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        connection = FramedConnection(reader, writer)
+        asyncio.ensure_future(connection.run())
+        connections.append(connection)
+
+    payload = {"data": "x" * payload_size}
+    latencies = []
+
+    async def client(connection):
+        for _ in range(requests_per_peer):
+            start = time.perf_counter()
+            await connection.request(payload)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(connection) for connection in connections))
+    elapsed = time.perf_counter() - start
+
+    await asyncio.gather(*(connection.close() for connection in connections))
+    await server.close()
+
+    total = peers * requests_per_peer
+    print(f"peers:            {peers}")
+    print(f"payload bytes:    {payload_size}")
+    print(f"round trips:      {total}")
+    print(f"messages/sec:     {2 * total / elapsed:.0f} (requests + responses)")
+    print(f"p50 latency:      {percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"p99 latency:      {percentile(latencies, 0.99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the framed asyncio node transport on loopback.")
+    parser.add_argument('--peers', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=20, help="Round trips per peer")
+    parser.add_argument('--payload', type=int, default=256, help="Payload size in bytes")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.peers, args.requests, args.payload))
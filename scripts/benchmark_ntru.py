@@ -0,0 +1,53 @@
+import argparse
+import time
+import numpy as np
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from bqpl.quantum_resistant_encryption import QuantumResistantEncryption
+
+
+def best_time(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark(N, q, messages, repeat, seed):
+    """Encrypt and decrypt operations per second for single calls and for one batch."""
+    start = time.perf_counter()
+    qre = QuantumResistantEncryption(q=q, N=N, seed=seed)
+    keygen = time.perf_counter() - start
+    batch = np.random.default_rng(seed).integers(0, 2, (messages, N))
+    strings = [''.join(map(str, row)) for row in batch[:min(messages, 200)]]
+    ciphertexts = qre.encrypt_batch(batch)
+    assert np.array_equal(qre.decrypt_batch(ciphertexts), batch)
+
+    single_encrypt = len(strings) / best_time(lambda: [qre.encrypt(s) for s in strings], repeat)
+    single_decrypt = len(strings) / best_time(lambda: [qre.decrypt(c) for c in ciphertexts[:len(strings)]], repeat)
+    batch_encrypt = messages / best_time(lambda: qre.encrypt_batch(batch), repeat)
+    batch_decrypt = messages / best_time(lambda: qre.decrypt_batch(ciphertexts), repeat)
+    print(f"{N:>6} {q:>6} {qre.weight:>7} {keygen * 1000:>10.1f} {single_encrypt:>12,.0f} {single_decrypt:>12,.0f} "
+          f"{batch_encrypt:>12,.0f} {batch_decrypt:>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NTRU encryption throughput versus ring degree.")
+    parser.add_argument('--degrees', type=int, nargs='+', default=[251, 509, 677, 821, 1087])
+    parser.add_argument('--q', type=int, default=2048)
+    parser.add_argument('--messages', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'N':>6} {'q':>6} {'weight':>7} {'keygen ms':>10} {'enc/s':>12} {'dec/s':>12} "
+          f"{'batch enc/s':>12} {'batch dec/s':>12}")
+    for N in args.degrees:
+        run_benchmark(N, args.q, args.messages, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
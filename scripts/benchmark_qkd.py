@@ -0,0 +1,35 @@
+import argparse
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from quantum_network.qkd import BB84Engine
+
+
+def run_benchmark(qubits, channel_error, amplify, repeat, seed):
+    """Qubits processed per second and final key bits per second for one configuration."""
+    engine = BB84Engine(rng=seed, channel_error=channel_error)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = engine.run(qubits, privacy_amplification=amplify)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{qubits:>11,} {channel_error:>7.3f} {'yes' if amplify else 'no':>9} {result.qber:>7.4f} "
+          f"{len(result.key):>11,} {qubits / elapsed / 1e6:>10.2f} {len(result.key) / elapsed / 1e6:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized BB84 engine.")
+    parser.add_argument('--qubits', type=int, nargs='+', default=[100_000, 1_000_000, 4_000_000])
+    parser.add_argument('--channel-error', type=float, default=0.02)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'qubits':>11} {'noise':>7} {'amplify':>9} {'qber':>7} {'key bits':>11} {'Mqubit/s':>10} {'Mkeybit/s':>10}")
+    for qubits in args.qubits:
+        for amplify in (False, True):
+            run_benchmark(qubits, args.channel_error, amplify, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""Shared setup for the benchmark scripts; import it before any repository module.
+
+Puts the repository root on sys.path so the scripts run as `python scripts/benchmark_<name>.py`,
+and configures logging at WARNING first, so the `logging.basicConfig(level=INFO)` calls in the
+imported modules do nothing and per-item log lines stay out of the benchmark tables.
+"""
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -0,0 +1,58 @@
+import argparse
+import random
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from modules.consensus.proof_of_stake import ProofOfStake
+
+
+def linear_select(stakes, total, rng):
+    """The previous selection: one pass over every validator per draw."""
+    selection = rng.uniform(0, total)
+    current = 0
+    for validator, stake in stakes.items():
+        current += stake
+        if current >= selection:
+            return validator
+
+
+def run_benchmark(validators, committee_size, slots):
+    rng = random.Random(42)
+    pos = ProofOfStake()
+    start = time.perf_counter()
+    for i in range(validators):
+        pos.register_stake(f"validator-{i}", rng.uniform(1, 1000))
+    register_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for slot in range(slots):
+        pos.select_committee(committee_size, seed=f"{slot:064x}")
+    indexed = (time.perf_counter() - start) / slots
+
+    start = time.perf_counter()
+    linear_slots = max(1, slots // 20)
+    for _ in range(linear_slots):
+        committee = set()
+        while len(committee) < committee_size:
+            committee.add(linear_select(pos.stakes, pos.total_stake, rng))
+    linear = (time.perf_counter() - start) / linear_slots
+
+    print(f"{validators:>9} {committee_size:>6} {register_time:>10.3f} {indexed * 1000:>12.3f} "
+          f"{linear * 1000:>12.1f} {linear / indexed:>8.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stake-weighted committee selection.")
+    parser.add_argument('--validators', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--committee', type=int, default=128)
+    parser.add_argument('--slots', type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'validators':>9} {'k':>6} {'register s':>10} {'indexed ms':>12} {'linear ms':>12} {'speedup':>9}")
+    for validators in args.validators:
+        run_benchmark(validators, args.committee, args.slots)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import random
+import time
+
+import benchmark_setup  # noqa: F401  Repository root on sys.path, logging quieted
+
+from ggf.voting_system import VotingSystem
+
+
+def make_ballots(votes, proposals, seed):
+    """Random ballots, with roughly 1% repeat voters to exercise duplicate rejection."""
+    rng = random.Random(seed)
+    voters_per_proposal = max(1, votes // proposals)
+    ballots = []
+    for _ in range(votes):
+        proposal = rng.randrange(proposals)
+        voter = rng.randrange(voters_per_proposal * 100)
+        ballots.append((f"proposal-{proposal}", f"voter-{voter}", rng.random() < 0.5))
+    return ballots
+
+
+def run_benchmark(ballots, proposals, bulk):
+    voting = VotingSystem()
+    for i in range(proposals):
+        voting.propose(f"proposal-{i}", f"Proposal {i}")
+    start = time.perf_counter()
+    if bulk:
+        counted = voting.vote_many(ballots)
+    else:
+        counted = sum(voting.vote(*ballot) for ballot in ballots)
+    cast = time.perf_counter() - start
+    start = time.perf_counter()
+    results = [voting.tally_votes(f"proposal-{i}") for i in range(proposals)]
+    tally = time.perf_counter() - start
+    assert sum(result["total"] for result in results) == counted
+    label = "vote_many" if bulk else "vote"
+    print(f"{label:>10} {len(ballots):>10,} {counted:>10,} {len(ballots) / cast:>14,.0f} {tally * 1e3:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vote ingestion and tallying.")
+    parser.add_argument('--votes', type=int, default=1_000_000)
+    parser.add_argument('--proposals', type=int, default=1_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    ballots = make_ballots(args.votes, args.proposals, args.seed)
+    print(f"{'path':>10} {'ballots':>10} {'counted':>10} {'votes/s':>14} {'tally all ms':>12}")
+    for bulk in (False, True):
+        run_benchmark(ballots, args.proposals, bulk)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import hashlib
 import json
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import hashes
+from core.signature_verification import get_default_verifier
 
 class MultiSigWallet:
     def __init__(self, required_signatures, public_keys):
@@ -36,22 +37,8 @@ class MultiSigWallet:
 
     def verify_signatures(self, transaction, signatures):
         transaction_hash = self.hash_transaction(transaction)
-        valid_signatures = 0
-
-        for public_key, signature in signatures.items():
-            try:
-                public_key.verify(
-                    signature,
-                    transaction_hash,
-                    padding.PSS(
-                        mgf=padding.MGF1(hashes.SHA256()),
-                        salt_length=padding.PSS.MAX_LENGTH
-                    ),
-                    hashes.SHA256()
-                )
-                valid_signatures += 1
-            except Exception:
-                continue
+        items = [(transaction_hash, signature, public_key) for public_key, signature in signatures.items()]
+        valid_signatures = sum(get_default_verifier().verify_batch(items))
 
         return valid_signatures >= self.required_signatures
 
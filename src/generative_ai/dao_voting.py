@@ -1,22 +1,39 @@
 # src/generative_ai/dao_voting.py
 
+import json
 import logging
+import os
+import threading
 
 # Set up logging for the DAO voting module
 logger = logging.getLogger(__name__)
 
+LOCK_STRIPES = 64  # Votes on proposals in different stripes never contend
+
 class DAOVoting:
-    def __init__(self, voting_system):
+    def __init__(self, voting_system, snapshot_path=None):
         """
         Initialize the DAO Voting system.
 
         Parameters:
         - voting_system (str): The name of the voting system to be used (e.g., a smart contract address).
+        - snapshot_path (str, optional): File to load proposals from and to save snapshots to.
         """
         self.voting_system = voting_system
-        self.proposals = []  # List to hold feature proposals
+        self.snapshot_path = snapshot_path
+        self.proposals_by_id = {}  # Proposal ID -> proposal, in ID order
+        self.next_id = 1  # IDs are never reused, so removing a proposal cannot collide with a later one
+        self._table_lock = threading.Lock()
+        self._vote_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        if snapshot_path and os.path.exists(snapshot_path):
+            self.load_snapshot(snapshot_path)
         logger.info(f"DAO Voting initialized with voting system: {self.voting_system}")
 
+    @property
+    def proposals(self):
+        """List of all proposals in ID order."""
+        return list(self.proposals_by_id.values())
+
     def propose_feature(self, feature):
         """
         Propose a new feature for community voting.
@@ -29,12 +46,14 @@ class DAOVoting:
         """
         try:
             logger.info(f"Proposing feature for voting: {feature}")
-            proposal_id = len(self.proposals) + 1  # Simple ID generation
-            self.proposals.append({
-                'id': proposal_id,
-                'feature': feature,
-                'votes': {'yes': 0, 'no': 0}
-            })
+            with self._table_lock:
+                proposal_id = self.next_id
+                self.next_id += 1
+                self.proposals_by_id[proposal_id] = {
+                    'id': proposal_id,
+                    'feature': feature,
+                    'votes': {'yes': 0, 'no': 0}
+                }
             logger.info(f"Feature proposed successfully with ID: {proposal_id}")
             return proposal_id
         except Exception as e:
@@ -53,8 +72,7 @@ class DAOVoting:
         - Exception: If the voting process fails.
         """
         try:
-            logger.info(f"Casting vote for proposal ID {proposal_id}: {user_vote}")
-            proposal = next((p for p in self.proposals if p['id'] == proposal_id), None)
+            proposal = self.proposals_by_id.get(proposal_id)
             if proposal is None:
                 logger.warning(f"Proposal ID {proposal_id} not found.")
                 raise ValueError("Proposal not found.")
@@ -63,8 +81,10 @@ class DAOVoting:
                 logger.warning("Invalid vote. Must be 'yes' or 'no'.")
                 raise ValueError("Vote must be 'yes' or 'no'.")
 
-            proposal['votes'][user_vote] += 1
-            logger.info(f"Vote cast successfully for proposal ID {proposal_id}. Current votes: {proposal['votes']}")
+            # `+=` on a dict entry is a read-modify-write, so concurrent votes need the lock
+            with self._vote_lock(proposal_id):
+                proposal['votes'][user_vote] += 1
+            logger.debug("Vote cast successfully for proposal ID %s: %s", proposal_id, user_vote)
         except Exception as e:
             logger.error(f"Error during voting process: {e}")
             raise
@@ -83,14 +103,79 @@ class DAOVoting:
         - Exception: If retrieving results fails.
         """
         try:
-            logger.info(f"Retrieving results for proposal ID {proposal_id}")
-            proposal = next((p for p in self.proposals if p['id'] == proposal_id), None)
+            proposal = self.proposals_by_id.get(proposal_id)
             if proposal is None:
                 logger.warning(f"Proposal ID {proposal_id} not found.")
                 raise ValueError("Proposal not found.")
 
-            logger.info(f"Results for proposal ID {proposal_id}: {proposal['votes']}")
-            return proposal['votes']
+            with self._vote_lock(proposal_id):
+                results = dict(proposal['votes'])
+            logger.debug("Results for proposal ID %s: %s", proposal_id, results)
+            return results
         except Exception as e:
             logger.error(f"Error retrieving results: {e}")
             raise
+
+    def remove_proposal(self, proposal_id):
+        """
+        Remove a proposal. Its ID is not reused.
+
+        Parameters:
+        - proposal_id (int): The ID of the proposal to remove.
+
+        Returns:
+        - bool: True if the proposal existed.
+        """
+        with self._table_lock:
+            removed = self.proposals_by_id.pop(proposal_id, None) is not None
+        if removed:
+            logger.info(f"Removed proposal ID {proposal_id}")
+        return removed
+
+    def save_snapshot(self, path=None):
+        """
+        Write all proposals and the next ID to a JSON file, replacing it atomically.
+
+        Parameters:
+        - path (str, optional): Destination file; defaults to the snapshot path given at construction.
+
+        Returns:
+        - str: The path written.
+        """
+        path = path or self.snapshot_path
+        if not path:
+            raise ValueError("No snapshot path configured.")
+        with self._table_lock:
+            next_id = self.next_id
+            proposals = list(self.proposals_by_id.values())
+        records = []
+        for proposal in proposals:
+            with self._vote_lock(proposal['id']):
+                records.append({'id': proposal['id'], 'feature': proposal['feature'], 'votes': dict(proposal['votes'])})
+        temporary = path + '.tmp'
+        with open(temporary, 'w') as file:
+            json.dump({'next_id': next_id, 'proposals': records}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+        logger.info(f"Saved snapshot of {len(records)} proposals to {path}")
+        return path
+
+    def load_snapshot(self, path=None):
+        """
+        Replace the proposal table with the contents of a snapshot file.
+
+        Parameters:
+        - path (str, optional): Snapshot file; defaults to the snapshot path given at construction.
+        """
+        path = path or self.snapshot_path
+        with open(path, 'r') as file:
+            snapshot = json.load(file)
+        proposals = {record['id']: record for record in snapshot['proposals']}
+        with self._table_lock:
+            self.proposals_by_id = proposals
+            self.next_id = max(snapshot['next_id'], max(proposals, default=0) + 1)
+        logger.info(f"Loaded {len(proposals)} proposals from {path}")
+
+    def _vote_lock(self, proposal_id):
+        return self._vote_locks[hash(proposal_id) % LOCK_STRIPES]
@@ -1,23 +1,43 @@
+import heapq
 import logging
+import math
+import threading
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
 from cryptography.fernet import Fernet
 import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+MIN_POOL_BATCH = 2000  # Fewer encrypted votes than this are cheaper to decrypt in-process
+
+
+def _decrypt_chunk(key, tokens):
+    """Decrypt a list of Fernet tokens; runs in worker processes, so it takes the key, not a cipher."""
+    cipher = Fernet(key)
+    return [cipher.decrypt(token).decode('utf-8') for token in tokens]
+
 class GalacticGovernanceFramework:
-    def __init__(self, quorum_percentage=0.6):
+    def __init__(self, quorum_percentage=0.6, workers=None, min_pool_batch=MIN_POOL_BATCH):
         """
         Initialize the Galactic Governance Framework.
 
         :param quorum_percentage: Minimum percentage of votes required for a proposal to be valid.
+        :param workers: Processes used to decrypt votes in batch finalization (defaults to the CPU count).
+        :param min_pool_batch: Smallest number of votes worth decrypting in the process pool.
         """
         self.proposals = {}
         self.votes = defaultdict(list)
         self.key = Fernet.generate_key()  # Generate a key for encryption
         self.cipher = Fernet(self.key)
         self.quorum_percentage = quorum_percentage
+        self.expiry_heap = []  # (expiration_time, proposal_id) for proposals not yet swept
+        self.workers = workers or cpu_count()
+        self.min_pool_batch = min_pool_batch
+        self._executor = None
+        self._lock = threading.Lock()
         logging.info("Galactic Governance Framework initialized.")
 
     def create_proposal(self, proposal_id, description, proposer, expiration_time=3600):
@@ -41,6 +61,7 @@ class GalacticGovernanceFramework:
             'status': 'pending',
             'expiration_time': time.time() + expiration_time
         }
+        heapq.heappush(self.expiry_heap, (self.proposals[proposal_id]['expiration_time'], proposal_id))
         logging.info(f"Proposal created: {proposal_id} - {description} by {proposer}")
         return True
 
@@ -88,7 +109,10 @@ class GalacticGovernanceFramework:
             return None
 
         proposal = self.proposals[proposal_id]
-        total_votes = proposal['votes_for'] + proposal['votes_against']
+        return self._decide(proposal_id, proposal, proposal['votes_for'], proposal['votes_against'])
+
+    def _decide(self, proposal_id, proposal, votes_for, votes_against):
+        total_votes = votes_for + votes_against
         if total_votes == 0:
             logging.error("No votes have been cast.")
             return None
@@ -98,7 +122,7 @@ class GalacticGovernanceFramework:
             logging.info(f"Proposal {proposal_id} did not reach quorum.")
             return 'quorum not reached'
 
-        if proposal['votes_for'] > proposal['votes_against']:
+        if votes_for > votes_against:
             proposal['status'] = 'approved'
             logging.info(f"Proposal {proposal_id} approved.")
             return 'approved'
@@ -137,6 +161,77 @@ class GalacticGovernanceFramework:
             decrypted_votes.append((voter, decrypted_vote))
         return decrypted_votes
 
+    def decrypt_votes_many(self, proposal_ids):
+        """
+        Decrypt the votes for many proposals at once, spreading large batches over a process pool.
+
+        :param proposal_ids: IDs of the proposals whose votes to decrypt.
+        :return: Dict of proposal ID to its list of (voter, vote) tuples.
+        """
+        proposal_ids = [proposal_id for proposal_id in proposal_ids if proposal_id in self.votes]
+        tokens = [token for proposal_id in proposal_ids for _, token in self.votes[proposal_id]]
+        if self.workers > 1 and len(tokens) >= self.min_pool_batch:
+            chunk_size = math.ceil(len(tokens) / (self.workers * 4))
+            chunks = [tokens[i:i + chunk_size] for i in range(0, len(tokens), chunk_size)]
+            executor = self._get_executor()
+            futures = [executor.submit(_decrypt_chunk, self.key, chunk) for chunk in chunks]
+            decrypted = [vote for future in futures for vote in future.result()]
+        else:
+            decrypted = _decrypt_chunk(self.key, tokens)
+
+        results = {}
+        offset = 0
+        for proposal_id in proposal_ids:
+            voters = [voter for voter, _ in self.votes[proposal_id]]
+            results[proposal_id] = list(zip(voters, decrypted[offset:offset + len(voters)]))
+            offset += len(voters)
+        return results
+
+    def finalize_expired(self, now=None):
+        """
+        Finalize every pending proposal whose voting period has ended, in one sweep.
+
+        Expired proposals are popped from the expiry heap rather than found by scanning, and
+        their votes are decrypted together and recounted, so the outcome is decided from the
+        ballots themselves.
+
+        :param now: Time to compare expirations against (defaults to the current time).
+        :return: Dict of proposal ID to its result, as finalize_proposal would return it.
+        """
+        now = time.time() if now is None else now
+        expired = []
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            _, proposal_id = heapq.heappop(self.expiry_heap)
+            proposal = self.proposals.get(proposal_id)
+            if proposal is not None and proposal['status'] == 'pending':
+                expired.append(proposal_id)
+
+        ballots = self.decrypt_votes_many(expired)
+        results = {}
+        for proposal_id in expired:
+            proposal = self.proposals[proposal_id]
+            votes = [vote for _, vote in ballots.get(proposal_id, [])]
+            votes_for = votes.count('for')
+            votes_against = votes.count('against')
+            if (votes_for, votes_against) != (proposal['votes_for'], proposal['votes_against']):
+                logging.warning(f"Proposal {proposal_id} counters disagree with its decrypted votes; using the votes.")
+            results[proposal_id] = self._decide(proposal_id, proposal, votes_for, votes_against)
+        logging.info(f"Finalized {len(results)} expired proposals.")
+        return results
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def close(self):
+        """Shut down the decryption process pool, if one was started."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
 # Example usage
 if __name__ == "__main__":
     governance = GalacticGovernanceFramework()
@@ -0,0 +1,89 @@
+import asyncio
+import socket
+import unittest
+from core.async_transport import (AsyncNodeTransport, FrameDecoder, FrameError, KIND_MESSAGE, KIND_REQUEST,
+                                  RequestError, encode_frame)
+from core.node_communication import NodeCommunication
+
+class TestFrameDecoder(unittest.TestCase):
+    def test_coalesced_and_split_frames(self):
+        """Test decoding frames that arrive coalesced and split across reads."""
+        large = {"data": "x" * 5000}
+        stream = encode_frame({"a": 1}) + encode_frame(large, KIND_REQUEST)
+        decoder = FrameDecoder()
+        frames = decoder.feed(stream[:7]) + decoder.feed(stream[7:3000]) + decoder.feed(stream[3000:])
+        self.assertEqual(frames, [(KIND_MESSAGE, {"a": 1}), (KIND_REQUEST, large)])
+        self.assertEqual(len(decoder.buffer), 0)
+
+    def test_oversized_frame_rejected(self):
+        """Test that a frame above the limit is rejected."""
+        decoder = FrameDecoder(max_frame_size=10)
+        with self.assertRaises(FrameError):
+            decoder.feed(encode_frame({"data": "x" * 100}))
+
+class TestAsyncNodeTransport(unittest.TestCase):
+    def test_request_broadcast_and_reuse(self):
+        """Test requests, one-way broadcasts and outbound connection reuse."""
+        async def scenario():
+            received = []
+            server = AsyncNodeTransport('127.0.0.1', 0, handler=lambda message, conn: received.append(message) or {"echo": message})
+            await server.start()
+            client = AsyncNodeTransport('127.0.0.1', 0)
+            responses = await asyncio.gather(*(client.request('127.0.0.1', server.port, {"n": i}) for i in range(20)))
+            self.assertEqual(responses, [{"echo": {"n": i}} for i in range(20)])
+            self.assertEqual(len(client.peers), 1)
+            self.assertEqual(await client.broadcast({"big": "y" * 100000}), 1)
+            await client.request('127.0.0.1', server.port, "sync")
+            self.assertEqual(received[-2]["big"], "y" * 100000)
+            await client.close()
+            await server.close()
+        asyncio.run(scenario())
+
+    def test_failed_requests_keep_connection_usable(self):
+        """Test that an unserializable request and a failing handler leave responses in step."""
+        def handler(message, conn):
+            if message == "boom":
+                raise RuntimeError("handler failed")
+            return {"echo": message}
+
+        async def scenario():
+            server = AsyncNodeTransport('127.0.0.1', 0, handler=handler)
+            await server.start()
+            client = AsyncNodeTransport('127.0.0.1', 0)
+            self.assertEqual(await client.request('127.0.0.1', server.port, 1), {"echo": 1})
+            with self.assertRaises(TypeError):
+                await client.request('127.0.0.1', server.port, {1, 2})
+            with self.assertRaises(RequestError):
+                await client.request('127.0.0.1', server.port, "boom")
+            self.assertEqual(await client.request('127.0.0.1', server.port, 2, timeout=5), {"echo": 2})
+            self.assertEqual(len(client.peers), 1)
+            await client.close()
+            await server.close()
+        asyncio.run(scenario())
+
+class TestNodeCommunication(unittest.TestCase):
+    def test_nodes_exchange_messages(self):
+        """Test the synchronous NodeCommunication API over the async transport."""
+        server = NodeCommunication(host='127.0.0.1', port=0)
+        client = NodeCommunication(host='127.0.0.1', port=0)
+        server.start_server()
+        try:
+            peer = client.connect_to_node('127.0.0.1', server.port)
+            self.assertEqual(client.connect_to_node('127.0.0.1', server.port), peer)
+            response = client.request({"message": "hello"}, peer)
+            self.assertEqual(response, {"status": "received", "data": {"message": "hello"}})
+            self.assertEqual(client.broadcast_message({"message": "all"}), 1)
+
+            with socket.create_connection(('127.0.0.1', server.port)) as raw:
+                raw.sendall(encode_frame({"message": "raw"}, KIND_REQUEST))
+                decoder = FrameDecoder()
+                frames = []
+                while not frames:
+                    frames = decoder.feed(raw.recv(4096))
+                self.assertEqual(frames[0][1]["data"], {"message": "raw"})
+        finally:
+            client.stop()
+            server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
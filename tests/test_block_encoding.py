@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch
+from core.blockchain import Block
+from core.encoding import encode_value, decode_value
+
+class TestBlockEncoding(unittest.TestCase):
+    def setUp(self):
+        """Set up a block with a couple of transactions."""
+        self.transactions = [
+            {'sender': 'ab' * 32, 'recipient': 'Bob', 'amount': 50, 'signature': 'cd' * 32},
+            {'sender': 'ef' * 32, 'recipient': 'Charlie', 'amount': 2.5, 'signature': '01' * 32},
+        ]
+        self.block = Block(index=2, previous_hash='00' * 32, timestamp=1633072800.5,
+                           transactions=self.transactions, nonce=7)
+
+    def test_value_round_trip(self):
+        """Test that the canonical codec round-trips JSON-like values."""
+        value = {'b': [1, -2, 3.5, None, True, False], 'a': 'text', 'c': b'\x00\x01', 'd': 2 ** 70}
+        encoded = encode_value(value)
+        decoded, offset = decode_value(encoded)
+        self.assertEqual(decoded, value)
+        self.assertEqual(offset, len(encoded))
+
+    def test_encoding_is_canonical(self):
+        """Test that key order does not change the encoding."""
+        self.assertEqual(encode_value({'x': 1, 'y': 2}), encode_value({'y': 2, 'x': 1}))
+
+    def test_block_round_trip(self):
+        """Test that a block decodes to the same hash and transactions."""
+        decoded = Block.from_bytes(self.block.to_bytes())
+        self.assertEqual(decoded.hash, self.block.hash)
+        self.assertEqual(list(decoded.transactions), self.transactions)
+        self.assertEqual(decoded.nonce, 7)
+
+    def test_tampered_body_rejected(self):
+        """Test that a body that no longer matches the header is rejected."""
+        data = bytearray(self.block.to_bytes())
+        data[-1] ^= 0xFF
+        with self.assertRaises(ValueError):
+            Block.from_bytes(bytes(data))
+
+    def test_nonce_change_reuses_merkle_root(self):
+        """Test that changing the nonce rehashes the header without touching the transactions."""
+        original = self.block.calculate_hash()
+        with patch('core.merkle.leaf_hash', side_effect=AssertionError("transactions re-hashed")):
+            self.block.nonce = 8
+            self.assertNotEqual(self.block.calculate_hash(), original)
+
+    def test_transaction_change_invalidates_hash(self):
+        """Test that replacing transactions changes the calculated hash."""
+        self.block.transactions = self.transactions[:1]
+        self.assertNotEqual(self.block.calculate_hash(), self.block.hash)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import unittest
+from core.blockchain import Block, Blockchain
+from core.block_store import BlockStore, INDEX_FILE, INDEX_ENTRY
+
+def make_block(index, previous_hash):
+    transactions = [{'sender': f'S{index}', 'recipient': 'R', 'amount': index, 'signature': 'sig'}]
+    return Block(index=index, previous_hash=previous_hash, timestamp=1633072800.0 + index, transactions=transactions)
+
+class TestBlockStore(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary store directory."""
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def fill(self, store, count):
+        previous_hash = '1'
+        for index in range(1, count + 1):
+            block = make_block(index, previous_hash)
+            store.append(block)
+            previous_hash = block.hash
+        return previous_hash
+
+    def test_append_and_lookup(self):
+        """Test height and hash lookups across segment rollovers."""
+        store = BlockStore(self.path, segment_size=600)
+        last_hash = self.fill(store, 10)
+        self.assertGreater(len(store._segments()), 1)
+        self.assertEqual(len(store), 10)
+        self.assertEqual(store[-1].hash, last_hash)
+        self.assertEqual(store.height_of(last_hash), 9)
+        self.assertEqual(store.get_by_hash(store[3].hash).index, 4)
+        store.close()
+
+    def test_reopen_reads_index(self):
+        """Test that reopening restores all blocks from the index."""
+        store = BlockStore(self.path, segment_size=600)
+        last_hash = self.fill(store, 10)
+        store.close()
+        reopened = BlockStore(self.path, segment_size=600)
+        self.assertEqual(len(reopened), 10)
+        self.assertEqual(reopened[9].hash, last_hash)
+        self.assertEqual([block.index for block in reopened], list(range(1, 11)))
+        reopened.close()
+
+    def test_recovers_unindexed_and_torn_records(self):
+        """Test recovery from a lagging index and a torn segment tail."""
+        store = BlockStore(self.path)
+        self.fill(store, 5)
+        store.close()
+        index_path = os.path.join(self.path, INDEX_FILE)
+        with open(index_path, 'r+b') as file:
+            file.truncate(3 * INDEX_ENTRY.size + 5)  # Lose two entries and tear the third
+        segment_path = os.path.join(self.path, 'segment_000000.dat')
+        with open(segment_path, 'ab') as file:
+            file.write(b'BLK1\x00\x00')  # Torn record header
+
+        reopened = BlockStore(self.path)
+        self.assertEqual(len(reopened), 5)
+        self.assertEqual(os.path.getsize(index_path), 5 * INDEX_ENTRY.size)
+        self.assertEqual(reopened[4].index, 5)
+        reopened.close()
+
+    def test_blockchain_on_store(self):
+        """Test that a blockchain backed by a store survives a restart."""
+        blockchain = Blockchain(difficulty=1, block_store=BlockStore(self.path))
+        blockchain.create_block()
+        last_hash = blockchain.last_block.hash
+        blockchain.chain.close()
+
+        restarted = Blockchain(difficulty=1, block_store=BlockStore(self.path))
+        self.assertEqual(len(restarted.chain), 2)
+        self.assertEqual(restarted.last_block.hash, last_hash)
+        self.assertEqual(restarted.get_block_by_hash(last_hash).index, 2)
+        restarted.chain.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import threading
+import unittest
+from modules.execution.smart_contracts import GAS_COSTS, OutOfGas, SmartContract
+
+class TestSmartContractExecution(unittest.TestCase):
+    def setUp(self):
+        self.contract = SmartContract("code")
+        self.events = []
+        self.contract.add_event_listener(lambda name, args: self.events.append((name, args)))
+
+    def test_dispatch_gas_and_profile(self):
+        """Test dispatch through the static table, gas accounting and per-function profiling."""
+        self.contract.execute("set_value", "a", 1)
+        self.assertEqual(self.contract.execute("get_value", "a"), 1)
+        self.assertIsNone(self.contract.execute("missing"))
+        expected_set = GAS_COSTS['call'] + GAS_COSTS['write'] + GAS_COSTS['event']
+        expected_get = GAS_COSTS['call'] + GAS_COSTS['read'] + GAS_COSTS['event']
+        self.assertEqual(self.contract.gas_used, expected_set + expected_get)
+        self.assertEqual(self.contract.profile["set_value"]["calls"], 1)
+        self.assertEqual(self.contract.profile["get_value"]["gas"], expected_get)
+        self.contract.flush_events()
+        self.assertEqual(self.events, [("set_value", ("a", 1)), ("get_value", ("a",))])
+
+    def test_events_delivered_off_the_calling_thread(self):
+        """Test that listeners run on the event worker, not inside execute."""
+        threads = []
+        self.contract.add_event_listener(lambda name, args: threads.append(threading.current_thread()))
+        self.contract.execute("set_value", "a", 1)
+        self.contract.flush_events()
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_batch_commits_once(self):
+        """Test that a batch returns every result and delivers its events after committing."""
+        calls = [("set_value", (f"k{i}", i)) for i in range(100)] + [("get_value", ("k42",))]
+        results = self.contract.execute_batch(calls)
+        self.assertEqual(results[-1], 42)
+        self.assertEqual(len(self.contract.state), 100)
+        self.contract.flush_events()
+        self.assertEqual(len(self.events), 101)
+
+    def test_failed_batch_rolls_back(self):
+        """Test that an exception or running out of gas undoes the batch and drops its events."""
+        self.contract.execute("set_value", "keep", 1)
+        with self.assertRaises(TypeError):
+            self.contract.execute_batch([("set_value", ("a", 1)), ("set_value", ("missing-value",))])
+        with self.assertRaises(OutOfGas):
+            self.contract.execute_batch([("set_value", (f"k{i}", i)) for i in range(10)], gas_limit=20)
+        self.assertEqual(self.contract.state, {"keep": 1})
+        self.contract.flush_events()
+        self.assertEqual(self.events, [("set_value", ("keep", 1))])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import unittest
+from modules.execution.contract_state import SNAPSHOT_FILE, WAL_FILE, VersionedState
+from modules.execution.smart_contracts import SmartContract
+
+class TestVersionedState(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_overlays_commit_and_rollback(self):
+        """Test copy-on-write reads, nested commits and rollback without touching the base."""
+        state = VersionedState()
+        state["a"] = 1
+        state["b"] = 2
+        state.begin()
+        state["a"] = 10
+        del state["b"]
+        state.begin()
+        state["c"] = 3
+        self.assertEqual(state.to_dict(), {"a": 10, "c": 3})
+        state.rollback()
+        self.assertNotIn("c", state)
+        self.assertEqual(state.base, {"a": 1, "b": 2})
+        state.commit()
+        self.assertEqual(state, {"a": 10})
+        self.assertEqual(state.version, 3)
+
+    def test_restart_replays_log_tail_after_snapshot(self):
+        """Test that reopening loads the latest snapshot plus only the deltas logged after it."""
+        state = VersionedState(self.path, snapshot_interval=3, fsync=False)
+        for block in range(5):
+            state.begin()
+            state[f"k{block}"] = block
+            if block == 2:
+                del state["k0"]
+            state.commit()
+        state.close()
+        with open(os.path.join(self.path, WAL_FILE)) as file:
+            self.assertEqual(len(file.readlines()), 2)  # Versions 4 and 5; 1-3 are in the snapshot
+        self.assertTrue(os.path.exists(os.path.join(self.path, SNAPSHOT_FILE)))
+
+        reopened = VersionedState(self.path, snapshot_interval=3, fsync=False)
+        self.assertEqual(reopened.version, 5)
+        self.assertEqual(reopened, {"k1": 1, "k2": 2, "k3": 3, "k4": 4})
+        reopened.close()
+
+    def test_torn_log_tail_is_discarded(self):
+        """Test that a partially written last record is truncated on open."""
+        state = VersionedState(self.path, fsync=False)
+        state["a"] = 1
+        state.close()
+        with open(os.path.join(self.path, WAL_FILE), 'a') as file:
+            file.write('{"version":2,"set":{"b"')
+        reopened = VersionedState(self.path, fsync=False)
+        self.assertEqual(reopened, {"a": 1})
+        reopened["c"] = 3
+        reopened.close()
+        self.assertEqual(VersionedState(self.path, fsync=False).to_dict(), {"a": 1, "c": 3})
+
+class TestContractBlocks(unittest.TestCase):
+    def test_block_rollback_and_persistence(self):
+        """Test block-level rollback on a contract with persistent state."""
+        path = tempfile.mkdtemp()
+        try:
+            contract = SmartContract("code", state_path=path)
+            contract.begin_block()
+            contract.execute("set_value", "a", 1)
+            contract.commit_block()
+            contract.begin_block()
+            contract.execute("set_value", "a", 2)
+            contract.rollback_block()
+            self.assertEqual(contract.execute("get_value", "a"), 1)
+            contract.state.close()
+            self.assertEqual(SmartContract("code", state_path=path).state.to_dict(), {"a": 1})
+        finally:
+            shutil.rmtree(path)
+
+    def test_load_state_keeps_persistence(self):
+        """Test that loading a saved state into a persistent contract is logged and survives a reopen."""
+        path = tempfile.mkdtemp()
+        try:
+            source = SmartContract("code")
+            source.execute("set_value", "b", 2)
+            saved = os.path.join(path, "saved.json")
+            source.save_state(saved)
+            contract = SmartContract("code", state_path=os.path.join(path, "state"))
+            contract.execute("set_value", "a", 1)
+            contract.load_state(saved)
+            self.assertEqual(contract.state.to_dict(), {"b": 2})
+            self.assertEqual(contract.state.version, 2)
+            contract.state.close()
+            self.assertEqual(SmartContract("code", state_path=os.path.join(path, "state")).state.to_dict(), {"b": 2})
+        finally:
+            shutil.rmtree(path)
+
+if __name__ == '__main__':
+    unittest.main()
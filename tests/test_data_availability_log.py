@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from cryptography.fernet import Fernet
+from modules.data_availability.data_availability import DataAvailability
+from modules.data_availability.encrypted_log import EncryptedLog
+
+class TestEncryptedLog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "store.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_reopen_rebuilds_index(self):
+        """Test that overwrites and deletes survive a reopen."""
+        log = EncryptedLog(self.path, sync=False)
+        log.put_many([("a", b"1"), ("b", b"2"), ("a", b"3")])
+        self.assertEqual(log.delete_many(["b", "missing"]), ["b"])
+        log.close()
+        reopened = EncryptedLog(self.path, sync=False)
+        self.assertEqual(list(reopened), ["a"])
+        self.assertEqual(reopened.get("a"), b"3")
+        self.assertIsNone(reopened.get("b"))
+        reopened.close()
+
+    def test_torn_tail_and_compaction(self):
+        """Test that a partial record is discarded and compaction keeps only live values."""
+        log = EncryptedLog(self.path, sync=False, min_compaction_bytes=10 ** 9)
+        for round_ in range(5):
+            log.put_many((f"k{i}", f"v{round_}-{i}".encode()) for i in range(50))
+        log.close()
+        with open(self.path, "ab") as file:
+            file.write(b"\x00\x01\x02")
+        log = EncryptedLog(self.path, sync=False)
+        size_before = os.path.getsize(self.path)
+        log.compact()
+        self.assertLess(os.path.getsize(self.path), size_before / 4)
+        self.assertEqual(log.get("k7"), b"v4-7")
+        log.close()
+        self.assertEqual(EncryptedLog(self.path, sync=False).get("k49"), b"v4-49")
+
+    def test_automatic_compaction(self):
+        """Test that dead space triggers a background compaction."""
+        log = EncryptedLog(self.path, sync=False, compaction_ratio=0.5, min_compaction_bytes=1)
+        log.put_many([("k", b"x" * 100)])
+        log.put_many([("k", b"y" * 100)])
+        log.wait_for_compaction()
+        self.assertEqual(log.dead_bytes, 0)
+        self.assertEqual(log.get("k"), b"y" * 100)
+        log.close()
+
+    def test_writes_during_compaction_are_kept(self):
+        """Test that records appended while compaction copies live values survive it and a reopen."""
+        class InterleavedLog(EncryptedLog):
+            during_copy = None
+
+            def _encode(self, operation, key, value):
+                writes, self.during_copy = self.during_copy, None
+                if writes:  # Runs once the copy has started, outside the write lock
+                    writes()
+                return EncryptedLog._encode(operation, key, value)
+
+        log = InterleavedLog(self.path, sync=False, min_compaction_bytes=10 ** 9)
+        log.put_many((f"k{i}", b"old") for i in range(10))
+        log.put_many((f"k{i}", b"newer") for i in range(5))
+        log.during_copy = lambda: (log.put_many([("k1", b"during"), ("k20", b"added")]), log.delete_many(["k8"]))
+        log.compact()
+        expected = {f"k{i}": b"newer" if i < 5 else b"old" for i in range(10) if i != 8}
+        expected.update({"k1": b"during", "k20": b"added"})
+        self.assertEqual({key: log.get(key) for key in log}, expected)
+        self.assertEqual(log.live_bytes + log.dead_bytes, os.path.getsize(self.path))
+        log.close()
+        reopened = EncryptedLog(self.path, sync=False)
+        self.assertEqual({key: reopened.get(key) for key in reopened}, expected)
+        self.assertEqual(reopened.live_bytes + reopened.dead_bytes, os.path.getsize(self.path))
+        reopened.close()
+
+class TestDataAvailability(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.storage_path = os.path.join(self.directory, "data_storage.json")
+        self.key = Fernet.generate_key()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_batched_writes_and_restart(self):
+        """Test store_many/delete_many and that values decrypt after a restart."""
+        store = DataAvailability(self.storage_path, self.key, sync=False)
+        store.store_many({f"k{i}": f"value {i}" for i in range(100)})
+        store.store_data("k1", "updated")
+        store.delete_many(["k2", "k3"])
+        store.close()
+        store = DataAvailability(self.storage_path, self.key, sync=False)
+        self.assertEqual(store.retrieve_data("k1"), "updated")
+        self.assertFalse(store.check_data_availability("k2"))
+        self.assertEqual(len(store.log), 98)
+        with open(store.log_path, "rb") as file:
+            self.assertNotIn(b"value 50", file.read())  # Values are encrypted at rest
+        store.close()
+
+    def test_migrates_legacy_json_store(self):
+        """Test that an existing whole-file JSON store is imported into the log."""
+        cipher = Fernet(self.key)
+        with open(self.storage_path, "w") as file:
+            json.dump({"old": cipher.encrypt(b"legacy").decode()}, file)
+        store = DataAvailability(self.storage_path, self.key, sync=False)
+        self.assertEqual(store.retrieve_data("old"), "legacy")
+        store.delete_data("old")
+        store.close()
+        self.assertFalse(os.path.exists(self.storage_path))
+        store = DataAvailability(self.storage_path, self.key, sync=False)
+        self.assertFalse(store.check_data_availability("old"))  # Deleted keys are not migrated again
+        store.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from holographic_data_storage.edge_integration import (FRAME_DATA, FRAME_ERROR, FRAME_GET, FRAME_OK, FRAME_PUT,
+                                                       EdgeIntegration, EdgeStreamClient, StreamProtocolError)
+from holographic_data_storage.holographic_storage import HolographicStorage
+
+class TestEdgeStreaming(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.storage = HolographicStorage(10 * 1024 * 1024, storage_path=self.directory, page_file_size=1024 * 1024)
+        self.edge = EdgeIntegration(self.storage, port=0)
+
+    def tearDown(self):
+        self.storage.close()
+        shutil.rmtree(self.directory)
+
+    async def client(self, chunk_size=4096):
+        client = EdgeStreamClient(port=self.edge.port, chunk_size=chunk_size)
+        await client.connect()
+        return client
+
+    def test_pipelined_transfers_from_concurrent_clients(self):
+        """Test uploads and downloads interleaved on one connection and across clients."""
+        blobs = {f"blob{i}": os.urandom(50000 + i) for i in range(4)}
+
+        async def scenario():
+            await self.edge.start_streaming_server()
+            first, second = await self.client(), await self.client()
+            results = await asyncio.gather(*(
+                (first if i % 2 else second).upload(name, [blob], len(blob))
+                for i, (name, blob) in enumerate(blobs.items())))
+            self.assertEqual(sorted(result['identifier'] for result in results), sorted(blobs))
+            downloads = await asyncio.gather(*(first.download_bytes(name) for name in blobs),
+                                             second.download_bytes("blob2", offset=1000))
+            with self.assertRaises(StreamProtocolError):
+                await second.download_bytes("missing")
+            await first.close()
+            await second.close()
+            await self.edge.stop_streaming_server()
+            return downloads
+
+        downloads = asyncio.run(scenario())
+        self.assertEqual(downloads[:4], list(blobs.values()))
+        self.assertEqual(downloads[4], blobs["blob2"][1000:])
+        self.assertEqual(self.storage.retrieve_data("blob3"), blobs["blob3"])
+
+    def test_interrupted_upload_resumes(self):
+        """Test that an upload cut off part way continues from the server's offset."""
+        blob = os.urandom(100000)
+
+        async def scenario():
+            await self.edge.start_streaming_server()
+            client = await self.client()
+            stream_id, queue = client._open_stream()
+            await client._send(FRAME_PUT, stream_id, b'{"identifier": "big", "size": 100000}')
+            await queue.get()
+            await client._send(FRAME_DATA, stream_id, blob[:30000])
+            await client.close()  # Dropped before the upload finished
+            while self.edge.uploads["big"].written < 30000 or self.edge.upload_owners:
+                await asyncio.sleep(0.01)
+            self.assertNotIn("big", self.storage.stored_data)
+
+            client = await self.client()
+            result = await client.upload("big", [blob[i:i + 10000] for i in range(0, len(blob), 10000)], len(blob))
+            await client.close()
+            await self.edge.stop_streaming_server()
+            return result
+
+        self.assertEqual(asyncio.run(scenario())['size'], 100000)
+        self.assertEqual(self.storage.retrieve_data("big"), blob)
+        self.assertEqual(self.edge.uploads, {})
+
+    def test_retry_after_capacity_failure(self):
+        """Test that an upload aborted at commit is not resumed and its extent is not reused."""
+        blob = os.urandom(5000)
+
+        def shrinking_chunks():
+            self.storage.storage_capacity = 1000  # Storage fills up while the upload is in flight
+            yield blob
+
+        async def scenario():
+            await self.edge.start_streaming_server()
+            client = await self.client()
+            with self.assertRaises(StreamProtocolError):
+                await client.upload("b", shrinking_chunks(), len(blob))
+            self.assertEqual(self.edge.uploads, {})
+            self.storage.storage_capacity = 10 * 1024 * 1024
+            result = await client.upload("b", [blob], len(blob))
+            await client.close()
+            await self.edge.stop_streaming_server()
+            return result
+
+        self.assertEqual(asyncio.run(scenario())['size'], 5000)
+        self.assertTrue(self.storage.store_data("d", b"q" * 5000))
+        self.assertEqual(self.storage.retrieve_data("b"), blob)
+        self.assertEqual(self.storage.reserved, 0)
+
+    def test_one_writer_per_identifier_and_idle_expiry(self):
+        """Test that a second client cannot join an active upload and that abandoned ones expire."""
+        async def put(client, identifier, size):
+            stream_id, queue = client._open_stream()
+            await client._send(FRAME_PUT, stream_id, json.dumps({'identifier': identifier, 'size': size}).encode('utf-8'))
+            return stream_id, (await asyncio.wait_for(queue.get(), 5))[0]
+
+        async def scenario():
+            await self.edge.start_streaming_server()
+            first, second = await self.client(), await self.client()
+            stream_id, kind = await put(first, "x", 1000)
+            self.assertEqual(kind, FRAME_OK)
+            self.assertEqual((await put(second, "x", 1000))[1], FRAME_ERROR)
+            await first._send(FRAME_DATA, stream_id, b"a" * 100)
+            await first.close()
+            while self.edge.upload_owners:
+                await asyncio.sleep(0.01)
+            self.assertEqual(self.storage.reserved, 1000)  # Abandoned, but kept for resumption
+            self.assertEqual(self.edge.expire_uploads(), 0)
+            self.assertEqual(self.edge.expire_uploads(self.edge.uploads["x"].last_active + 300), 1)
+            self.assertEqual(self.storage.reserved, 0)
+            self.assertEqual(self.edge.uploads, {})
+            await second.close()
+            await self.edge.stop_streaming_server()
+
+        asyncio.run(scenario())
+
+    def test_invalid_requests_are_rejected(self):
+        """Test that negative sizes, offsets and chunk sizes get an error instead of being served."""
+        self.storage.store_data("blob", b"x" * 100)
+        with self.assertRaises(ValueError):
+            self.storage.open_writer("bad", -1)
+
+        async def scenario():
+            await self.edge.start_streaming_server()
+            client = await self.client()
+            replies = []
+            for kind, request in ((FRAME_PUT, {'identifier': 'bad', 'size': -1000000}),
+                                  (FRAME_GET, {'identifier': 'blob', 'chunk_size': 0}),
+                                  (FRAME_GET, {'identifier': 'blob', 'offset': -10})):
+                stream_id, queue = client._open_stream()
+                await client._send(kind, stream_id, json.dumps(request).encode('utf-8'))
+                replies.append((await asyncio.wait_for(queue.get(), 5))[0])
+            self.assertEqual(await client.download_bytes("blob"), b"x" * 100)  # The connection is still usable
+            await client.close()
+            await self.edge.stop_streaming_server()
+            return replies
+
+        self.assertEqual(asyncio.run(scenario()), [FRAME_ERROR] * 3)
+        self.assertEqual(self.storage.reserved, 0)
+
+if __name__ == '__main__':
+    unittest.main()
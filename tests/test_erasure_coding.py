@@ -0,0 +1,75 @@
+import itertools
+import os
+import random
+import unittest
+import numpy as np
+from modules.data_availability.erasure_coding import (ErasureCodedStore, ErasureCoder, gf_inverse, gf_matrix_inverse,
+                                                      gf_mul)
+
+class DictBackend:
+    """In-memory backend with the LevelDBStorage put/get interface."""
+    def __init__(self):
+        self.data = {}
+
+    def put(self, key, value):
+        self.data[key] = value
+
+    def get(self, key):
+        return self.data.get(key)
+
+class TestGaloisField(unittest.TestCase):
+    def test_inverse_and_matrix_inverse(self):
+        """Test field inverses and that a Cauchy-extended generator submatrix inverts."""
+        for a in range(1, 256):
+            self.assertEqual(gf_mul(a, gf_inverse(a)), 1)
+        coder = ErasureCoder(4, 8)
+        submatrix = coder.generator[[1, 4, 6, 7]]
+        inverse = gf_matrix_inverse(submatrix)
+        product = np.array([[np.bitwise_xor.reduce([gf_mul(int(inverse[i, t]), int(submatrix[t, j])) for t in range(4)])
+                             for j in range(4)] for i in range(4)])
+        np.testing.assert_array_equal(product, np.eye(4, dtype=np.uint8))
+
+class TestErasureCoder(unittest.TestCase):
+    def test_any_k_chunks_reconstruct(self):
+        """Test decoding from every 3-of-6 subset, including odd blob lengths."""
+        coder = ErasureCoder(3, 6)
+        blob = os.urandom(1001)
+        chunks = coder.encode(blob)
+        self.assertEqual(len(chunks), 6)
+        self.assertEqual(chunks[0] + chunks[1] + chunks[2][:1001 - 2 * len(chunks[0])], blob)  # Systematic
+        for subset in itertools.combinations(range(6), 3):
+            self.assertEqual(coder.decode({i: chunks[i] for i in subset}, len(blob)), blob)
+        with self.assertRaises(ValueError):
+            coder.decode({0: chunks[0], 5: chunks[5]}, len(blob))
+
+    def test_empty_blob(self):
+        """Test that an empty blob round-trips."""
+        coder = ErasureCoder(2, 4)
+        self.assertEqual(coder.decode(dict(enumerate(coder.encode(b""))), 0), b"")
+
+class TestErasureCodedStore(unittest.TestCase):
+    def setUp(self):
+        self.backends = [DictBackend() for _ in range(4)]
+        self.store = ErasureCodedStore(self.backends, k=4, n=8)
+        self.blob = os.urandom(10000)
+        self.encoded = self.store.store_blob(self.blob)
+
+    def test_reconstruct_after_losing_a_backend_and_corruption(self):
+        """Test reconstruction with one backend gone and a corrupted chunk."""
+        self.backends[0].data.clear()  # Chunks 0 and 4
+        self.backends[1].data[self.encoded.chunk_key(1)] = {'chunk': 'AAAA'}
+        self.assertEqual(self.store.reconstruct(self.encoded), self.blob)
+
+    def test_sampling_detects_unavailable_blob(self):
+        """Test that sampling passes for a healthy blob and fails once too many chunks are lost."""
+        rng = random.Random(0)
+        self.assertTrue(self.store.sample_availability(self.encoded, samples=4, rng=rng))
+        for backend in self.backends[:3]:
+            backend.data.clear()
+        results = [self.store.sample_availability(self.encoded, samples=4, rng=rng) for _ in range(50)]
+        self.assertFalse(any(results))
+        with self.assertRaises(ValueError):
+            self.store.reconstruct(self.encoded)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import threading
+import time
+import unittest
+from core.event_scheduler import EventScheduler, PeriodicTimer, TimerWheel
+
+class TestTimerWheel(unittest.TestCase):
+    def test_expiry_across_rounds(self):
+        """Test that timers expire on the right tick, including delays longer than one revolution."""
+        wheel = TimerWheel(tick=1.0, slots=4)
+        short, long = PeriodicTimer("short", 2, 2), PeriodicTimer("long", 9, 9)
+        wheel.add(short, 0.0)
+        wheel.add(long, 0.0)
+        fired = {}
+        for tick in range(1, 12):
+            for timer in wheel.advance():
+                fired.setdefault(timer.event, tick)
+        self.assertEqual(fired, {"short": 2, "long": 9})
+        self.assertEqual(len(wheel), 0)
+
+class TestEventScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = EventScheduler(tick=0.01)
+        self.thread = threading.Thread(target=self.scheduler.run, daemon=True)
+
+    def tearDown(self):
+        self.scheduler.stop()
+        self.thread.join(2)
+
+    def wait_for(self, condition, timeout=2.0):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            time.sleep(0.005)
+        return condition()
+
+    def test_signalled_dispatch_and_metrics(self):
+        """Test that handlers run only when signalled, in order, with per-handler metrics."""
+        received = []
+        self.scheduler.add_handler("tx", received.append)
+        self.scheduler.signal("tx", "early")  # Buffered until the loop starts
+        self.thread.start()
+        for i in range(100):
+            self.scheduler.signal("tx", i)
+        self.assertTrue(self.wait_for(lambda: len(received) == 101))
+        self.assertEqual(received, ["early"] + list(range(100)))
+        metrics = self.scheduler.get_metrics()
+        self.assertEqual(metrics["dispatched"], 101)
+        self.assertEqual(metrics["handlers"]["tx"]["calls"], 101)
+        self.assertEqual(metrics["timer_fires"], 0)
+
+    def test_periodic_handler_and_failures(self):
+        """Test periodic timers, lag metrics and that a failing handler does not stop the loop."""
+        ticks = []
+        self.scheduler.add_handler("tick", lambda: ticks.append(time.perf_counter()), interval=0.02)
+        self.scheduler.add_handler("boom", lambda: 1 / 0)
+        self.thread.start()
+        self.scheduler.signal("boom")
+        self.assertTrue(self.wait_for(lambda: len(ticks) >= 5))
+        self.scheduler.remove_handler("tick")
+        metrics = self.scheduler.get_metrics()
+        self.assertEqual(metrics["handlers"]["boom"]["errors"], 1)
+        self.assertGreaterEqual(metrics["timer_fires"], 5)
+        self.assertLess(metrics["loop_lag_avg"], 0.05)
+
+    def test_idle_loop_does_not_spin(self):
+        """Test that an idle scheduler uses almost no CPU."""
+        self.thread.start()
+        self.assertTrue(self.wait_for(lambda: self.scheduler.running))
+        start_cpu = time.process_time()
+        time.sleep(0.3)
+        self.assertLess(time.process_time() - start_cpu, 0.05)
+
+    def test_stop_before_run(self):
+        """Test that a stop requested before the loop starts is not lost."""
+        self.scheduler.signal("tx", 1)
+        self.scheduler.stop()
+        self.thread.start()
+        self.thread.join(1)
+        self.assertFalse(self.thread.is_alive())
+        self.assertFalse(self.scheduler.running)
+        self.assertEqual(self.scheduler.get_metrics()["queued"], 1)  # Still pending for the next run
+
+    def test_stop_after_run_does_not_block_restart(self):
+        """Test that stopping an already finished scheduler does not end its next run."""
+        self.thread.start()
+        self.assertTrue(self.wait_for(lambda: self.scheduler.running))
+        self.scheduler.stop()
+        self.thread.join(1)
+        self.scheduler.stop()
+        self.thread = threading.Thread(target=self.scheduler.run, daemon=True)
+        self.thread.start()
+        self.assertTrue(self.wait_for(lambda: self.scheduler.running))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 # tests/test_generative_ai/test_dao_voting.py
 
+import os
+import tempfile
+import threading
 import unittest
 from src.generative_ai.dao_voting import DAOVoting
 
@@ -70,5 +73,43 @@ class TestDAOVoting(unittest.TestCase):
             self.dao_voting.get_results(999)  # Non-existent proposal ID
         self.assertEqual(str(context.exception), "Proposal not found.")
 
+    def test_ids_are_stable_after_removal(self):
+        """Test that removing a proposal never causes an ID to be reused."""
+        first = self.dao_voting.propose_feature("First")
+        second = self.dao_voting.propose_feature("Second")
+        self.assertTrue(self.dao_voting.remove_proposal(first))
+        self.assertFalse(self.dao_voting.remove_proposal(first))
+        third = self.dao_voting.propose_feature("Third")
+        self.assertEqual((first, second, third), (1, 2, 3))
+        self.assertEqual([p['id'] for p in self.dao_voting.proposals], [2, 3])
+
+    def test_concurrent_votes_are_all_counted(self):
+        """Test that votes from many threads are not lost."""
+        proposal_id = self.dao_voting.propose_feature("Contended feature")
+
+        def cast():
+            for i in range(2000):
+                self.dao_voting.vote(proposal_id, 'yes' if i % 2 else 'no')
+
+        threads = [threading.Thread(target=cast) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.dao_voting.get_results(proposal_id), {'yes': 8000, 'no': 8000})
+
+    def test_snapshot_round_trip(self):
+        """Test that proposals, votes and the next ID survive a snapshot."""
+        path = os.path.join(tempfile.mkdtemp(), "dao.json")
+        voting = DAOVoting(self.voting_system, snapshot_path=path)
+        kept = voting.propose_feature("Kept")
+        voting.remove_proposal(voting.propose_feature("Removed"))
+        voting.vote(kept, 'yes')
+        voting.save_snapshot()
+        restored = DAOVoting(self.voting_system, snapshot_path=path)
+        self.assertEqual(restored.get_results(kept), {'yes': 1, 'no': 0})
+        self.assertEqual(restored.propose_feature("Next"), 3)
+        os.remove(path)
+
 if __name__ == '__main__':
     unittest.main()
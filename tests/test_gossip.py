@@ -0,0 +1,83 @@
+import random
+import threading
+import unittest
+from cryptography.fernet import Fernet
+from network.gossip import GossipProtocol, SeenCache
+from network.gossip_simulator import simulate
+from network.p2p import P2PNetwork
+
+class TestSeenCache(unittest.TestCase):
+    def test_bounded_lru(self):
+        """Test that the cache reports duplicates and evicts the least recently seen ID."""
+        cache = SeenCache(capacity=2)
+        self.assertTrue(cache.add("a"))
+        self.assertTrue(cache.add("b"))
+        self.assertFalse(cache.add("a"))
+        self.assertTrue(cache.add("c"))
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+
+class TestGossipProtocol(unittest.TestCase):
+    def test_forward_once_with_ttl(self):
+        """Test fanout, sender exclusion, duplicate suppression and the hop limit."""
+        protocol = GossipProtocol("me", fanout=2, ttl=3, rng=random.Random(1))
+        peers = ["a", "b", "c", "d"]
+        deliver, forwarded, targets = protocol.receive({"id": "m1", "ttl": 2, "sender": "a", "payload": 1}, peers)
+        self.assertTrue(deliver)
+        self.assertEqual(forwarded["ttl"], 1)
+        self.assertEqual(forwarded["sender"], "me")
+        self.assertEqual(len(targets), 2)
+        self.assertNotIn("a", targets)
+        self.assertEqual(protocol.receive({"id": "m1", "ttl": 2, "sender": "b", "payload": 1}, peers), (False, None, []))
+        self.assertEqual(protocol.duplicates, 1)
+        self.assertEqual(protocol.receive({"id": "m2", "ttl": 0, "sender": "b", "payload": 1}, peers), (True, None, []))
+
+class TestGossipSimulator(unittest.TestCase):
+    def test_gossip_covers_network_with_fewer_bytes(self):
+        """Test that gossip reaches nearly every peer while sending far less than flooding."""
+        gossip = simulate(1000, fanout=6, seed=3)
+        flood = simulate(1000, fanout=None, seed=3)
+        self.assertGreater(gossip.coverage, 0.99)
+        self.assertEqual(flood.coverage, 1.0)
+        self.assertLess(gossip.bytes_sent, flood.bytes_sent / 2)
+        self.assertLessEqual(gossip.messages_sent, 1000 * 6)
+
+    def test_ttl_limits_spread(self):
+        """Test that a hop limit of one stops the message after the first relay."""
+        result = simulate(500, fanout=3, ttl=1, seed=1)
+        self.assertLessEqual(result.coverage * 500, 1 + 3 + 9)
+
+class TestP2PGossip(unittest.TestCase):
+    def test_gossip_over_sessions(self):
+        """Test a message gossiped along a chain of P2P nodes is delivered once by each node."""
+        key = Fernet.generate_key()
+        nodes = [P2PNetwork('127.0.0.1', 0, key=key, gossip_fanout=2) for _ in range(3)]
+        received = {i: [] for i in range(3)}
+        done = threading.Event()
+
+        def collector(i):
+            def process(message):
+                received[i].append(message)
+                if received[1] and received[2]:
+                    done.set()
+            return process
+
+        for i, node in enumerate(nodes):
+            node.process_message = collector(i)
+            node.start()
+            node.peers.update(('127.0.0.1', other.port) for other in nodes if other is not node)
+        try:
+            nodes[0].broadcast({"type": "block", "height": 7})
+            self.assertTrue(done.wait(5))
+            for node in nodes:
+                node.flush()
+            self.assertEqual(received[1], [{"type": "block", "height": 7}])
+            self.assertEqual(received[2], [{"type": "block", "height": 7}])
+            self.assertEqual(received[0], [])
+        finally:
+            for node in nodes:
+                node.stop()
+
+if __name__ == '__main__':
+    unittest.main()
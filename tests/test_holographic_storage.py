@@ -55,5 +55,15 @@ class TestHolographicStorage(unittest.TestCase):
         self.assertEqual(self.holographic_storage.get_storage_usage(), 0)
         self.assertNotIn(identifier, self.holographic_storage.stored_data)
 
+    def test_replacement_frees_old_size(self):
+        """Test that replacing data counts only the new size, as disk-backed storage does."""
+        self.assertTrue(self.holographic_storage.store_data('replaced', b'A' * 600))
+        self.assertTrue(self.holographic_storage.store_data('replaced', b'B' * 900))
+        self.assertEqual(self.holographic_storage.get_storage_usage(), 900)
+        writer = self.holographic_storage.open_writer('replaced', 1000)
+        writer.write(b'C' * 1000)
+        self.assertTrue(writer.commit())
+        self.assertEqual(self.holographic_storage.get_storage_usage(), 1000)
+
 if __name__ == "__main__":
     unittest.main()
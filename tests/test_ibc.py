@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+import unittest
+from modules.interoperability.ibc import IBC, Packet
+
+class TestPacket(unittest.TestCase):
+    def test_ids_unique_within_a_second(self):
+        """Test that packets created back to back get distinct IDs."""
+        ids = {Packet("ZoneA", "ZoneB", {}).packet_id for _ in range(1000)}
+        self.assertEqual(len(ids), 1000)
+
+    def test_round_trip_keeps_sequence(self):
+        """Test that serialization preserves the channel sequence."""
+        packet = Packet("ZoneA", "ZoneB", {"n": 1}, sequence=7)
+        self.assertEqual(Packet.from_dict(packet.to_dict()).sequence, 7)
+
+class TestChannels(unittest.TestCase):
+    def setUp(self):
+        self.ibc = IBC(channel_capacity=3)
+        self.ibc.create_channel("ZoneB")
+
+    def test_sequences_and_incremental_drain(self):
+        """Test monotonic sequences, incremental reads and cumulative acknowledgement."""
+        packets = [Packet("ZoneA", "ZoneB", {"n": i}) for i in range(3)]
+        self.assertTrue(all(self.ibc.send_packet(p) for p in packets))
+        self.assertEqual([p.sequence for p in packets], [1, 2, 3])
+        self.assertEqual(self.ibc.get_channel_packets("ZoneB", after_sequence=1, limit=1), [packets[1]])
+        self.ibc.acknowledge_packets("ZoneB", 2)
+        self.assertEqual(self.ibc.get_channel_packets("ZoneB"), [packets[2]])
+        self.assertFalse(self.ibc.send_packet(Packet("ZoneA", "Missing", {})))
+
+    def test_backpressure(self):
+        """Test that a full channel rejects, then accepts once space is acknowledged."""
+        for i in range(3):
+            self.assertTrue(self.ibc.send_packet(Packet("ZoneA", "ZoneB", {"n": i})))
+        start = time.time()
+        self.assertFalse(self.ibc.send_packet(Packet("ZoneA", "ZoneB", {}), timeout=0.05))
+        self.assertGreaterEqual(time.time() - start, 0.04)
+        threading.Timer(0.05, self.ibc.acknowledge_packets, args=("ZoneB", 1)).start()
+        self.assertTrue(self.ibc.send_packet(Packet("ZoneA", "ZoneB", {}), timeout=2))
+
+class TestRelay(unittest.TestCase):
+    def test_batched_relay_with_retry(self):
+        """Test that packets move in batches, failed batches are retried and redeliveries are skipped."""
+        source = IBC(retry_backoff=0.001)
+        destination = IBC()
+        source.create_channel("ZoneB")
+        processed = []
+        destination.process_packet = lambda packet: processed.append(packet.data["n"])
+        for i in range(10):
+            source.send_packet(Packet("ZoneA", "ZoneB", {"n": i}))
+
+        calls = []
+
+        async def flaky_transport(batch):
+            calls.append(len(batch))
+            acknowledged = await destination.receive_packets(batch)
+            if len(calls) == 1:
+                raise ConnectionError("lost acknowledgement")
+            return acknowledged
+
+        acknowledged = asyncio.run(source.relay("ZoneB", flaky_transport, batch_size=4))
+        self.assertEqual(acknowledged, 10)
+        self.assertEqual(calls, [4, 4, 4, 2])
+        self.assertEqual(processed, list(range(10)))
+        self.assertEqual(source.get_channel_packets("ZoneB"), [])
+
+    def test_relay_gives_up_and_keeps_packets(self):
+        """Test that a batch that keeps failing stays queued."""
+        source = IBC(retry_limit=2, retry_backoff=0.001)
+        source.create_channel("ZoneB")
+        source.send_packet(Packet("ZoneA", "ZoneB", {"n": 1}))
+
+        async def down(batch):
+            raise ConnectionError("zone unreachable")
+
+        self.assertEqual(asyncio.run(source.relay("ZoneB", down)), 0)
+        self.assertEqual(len(source.get_channel_packets("ZoneB")), 1)
+
+    def test_relay_stops_when_acknowledgement_frees_nothing(self):
+        """Test that a stale acknowledgement ends the relay instead of resending the batch forever."""
+        source = IBC()
+        source.create_channel("ZoneB")
+        for i in range(3):
+            source.send_packet(Packet("ZoneA", "ZoneB", {"n": i}))
+        calls = []
+
+        async def stale(batch):
+            calls.append(len(batch))
+            return batch[0].sequence - 1
+
+        self.assertEqual(asyncio.run(source.relay("ZoneB", stale)), 0)
+        self.assertEqual(calls, [3])
+        self.assertEqual(len(source.get_channel_packets("ZoneB")), 3)
+
+if __name__ == '__main__':
+    unittest.main()
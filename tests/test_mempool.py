@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+from core.blockchain import Blockchain
+from core.mempool import Mempool
+
+def make_tx(sender, amount, fee=None, nonce=None):
+    transaction = {'sender': sender, 'recipient': 'Bob', 'amount': amount, 'signature': f'{sender}-{amount}'}
+    if fee is not None:
+        transaction['fee'] = fee
+    if nonce is not None:
+        transaction['nonce'] = nonce
+    return transaction
+
+class TestMempool(unittest.TestCase):
+    def setUp(self):
+        """Set up an empty mempool."""
+        self.mempool = Mempool(max_transactions=100, max_bytes=1_000_000)
+
+    def test_deduplication(self):
+        """Test that the same transaction is only pooled once."""
+        self.assertTrue(self.mempool.add(make_tx('Alice', 1)))
+        self.assertFalse(self.mempool.add(make_tx('Alice', 1)))
+        self.assertEqual(len(self.mempool), 1)
+
+    def test_select_orders_by_fee(self):
+        """Test that higher-fee transactions are selected first."""
+        self.mempool.add(make_tx('Alice', 1, fee=1))
+        self.mempool.add(make_tx('Bob', 2, fee=5))
+        self.mempool.add(make_tx('Carol', 3, fee=3))
+        senders = [entry.sender for entry in self.mempool.select()]
+        self.assertEqual(senders, ['Bob', 'Carol', 'Alice'])
+
+    def test_sender_nonce_order(self):
+        """Test that a sender's transactions are released in nonce order even if later ones pay more."""
+        self.mempool.add(make_tx('Alice', 1, fee=1, nonce=1))
+        self.mempool.add(make_tx('Alice', 2, fee=9, nonce=2))
+        self.mempool.add(make_tx('Bob', 3, fee=5, nonce=0))
+        selected = [(entry.sender, entry.nonce) for entry in self.mempool.select()]
+        self.assertEqual(selected, [('Bob', 0), ('Alice', 1), ('Alice', 2)])
+
+    def test_replace_by_fee(self):
+        """Test that a same-nonce transaction replaces the pending one only with a higher fee."""
+        self.mempool.add(make_tx('Alice', 1, fee=2, nonce=0))
+        self.assertFalse(self.mempool.add(make_tx('Alice', 2, fee=1, nonce=0)))
+        self.assertTrue(self.mempool.add(make_tx('Alice', 3, fee=5, nonce=0)))
+        self.assertEqual([tx['amount'] for tx in self.mempool], [3])
+
+    def test_eviction_when_full(self):
+        """Test that the lowest fee-rate transaction is evicted with its later nonces."""
+        mempool = Mempool(max_transactions=3, max_bytes=1_000_000)
+        mempool.add(make_tx('Alice', 1, fee=1, nonce=0))
+        mempool.add(make_tx('Alice', 2, fee=8, nonce=1))
+        mempool.add(make_tx('Bob', 3, fee=5))
+        self.assertFalse(mempool.add(make_tx('Carol', 4, fee=0.5)))
+        self.assertTrue(mempool.add(make_tx('Carol', 5, fee=6)))
+        self.assertEqual(sorted(tx['sender'] for tx in mempool), ['Bob', 'Carol'])
+        self.assertEqual(mempool.total_bytes, sum(entry.size for entry in mempool.by_hash.values()))
+
+    def test_pop_block_respects_budgets(self):
+        """Test block selection under count and byte budgets."""
+        for i in range(10):
+            self.mempool.add(make_tx(f'S{i}', i, fee=i))
+        size = next(iter(self.mempool.by_hash.values())).size
+        transactions, tree = self.mempool.pop_block(max_count=5, max_bytes=size * 3 + 1)
+        self.assertEqual(len(transactions), 3)
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(len(self.mempool), 7)
+
+class TestBlockchainMempool(unittest.TestCase):
+    @patch('core.blockchain.Blockchain.verify_signature', return_value=True)
+    def test_add_transaction_pools_signature_fee_and_nonce(self, mock_verify):
+        """Test that Blockchain.add_transaction pools the signed fields and reports rejections with -1."""
+        blockchain = Blockchain(difficulty=1)
+        self.assertEqual(blockchain.add_transaction("Alice", "Bob", 50, "sig", 2, 0), blockchain.last_block.index + 1)
+        pooled = list(blockchain.mempool)
+        self.assertEqual([(tx['signature'], tx['fee'], tx['nonce']) for tx in pooled], [("sig", 2, 0)])
+        self.assertEqual(blockchain.add_transaction("Alice", "Bob", 50, "sig", 2, 0), -1)  # Duplicate
+        self.assertEqual(blockchain.add_transaction("Alice", "Bob", 60, "sig2", 1, 0), -1)  # Underpriced replacement
+        self.assertEqual(len(blockchain.mempool), 1)
+
+if __name__ == '__main__':
+    unittest.main()
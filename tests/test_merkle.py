@@ -0,0 +1,59 @@
+import unittest
+from core.blockchain import Block, Blockchain
+from core.merkle import MerkleTree, EMPTY_ROOT, leaf_hash, node_hash, verify_proof
+
+def reference_root(leaves):
+    """RFC 6962 Merkle tree hash computed recursively."""
+    if len(leaves) == 1:
+        return leaves[0]
+    split = 1 << ((len(leaves) - 1).bit_length() - 1)
+    return node_hash(reference_root(leaves[:split]), reference_root(leaves[split:]))
+
+class TestMerkleTree(unittest.TestCase):
+    def setUp(self):
+        """Create a batch of sample transactions."""
+        self.transactions = [{'sender': f'S{i}', 'recipient': 'R', 'amount': i, 'signature': ''} for i in range(37)]
+
+    def test_empty_root(self):
+        """Test the root of an empty tree."""
+        self.assertEqual(MerkleTree().root(), EMPTY_ROOT)
+
+    def test_incremental_root_matches_reference(self):
+        """Test the incrementally maintained root at every size."""
+        tree = MerkleTree()
+        leaves = []
+        for transaction in self.transactions:
+            tree.append(transaction)
+            leaves.append(leaf_hash(transaction))
+            self.assertEqual(tree.root(), reference_root(leaves))
+
+    def test_proofs_verify_for_every_leaf(self):
+        """Test that each leaf's proof verifies and is logarithmic in size."""
+        tree = MerkleTree(self.transactions)
+        for index, transaction in enumerate(self.transactions):
+            proof = tree.proof(index)
+            self.assertLessEqual(len(proof), 6)
+            self.assertTrue(verify_proof(transaction, proof, tree.root()))
+
+    def test_proof_rejects_other_transaction(self):
+        """Test that a proof does not verify a different transaction."""
+        tree = MerkleTree(self.transactions)
+        self.assertFalse(verify_proof(self.transactions[1], tree.proof(0), tree.root()))
+
+    def test_block_header_commits_to_root(self):
+        """Test that a light client can verify inclusion from the header alone."""
+        blockchain = Blockchain(difficulty=1)
+        blockchain.verify_signature = lambda sender, signature, message: True
+        for transaction in self.transactions[:5]:
+            blockchain.add_transaction(transaction['sender'], transaction['recipient'],
+                                       transaction['amount'], transaction['signature'])
+        block = blockchain.create_block()
+        self.assertEqual(block.merkle_root(), MerkleTree(block.transactions).root())
+
+        header = Block.decode_header(block.to_bytes())
+        self.assertEqual(header['hash'], block.hash)
+        proof = block.merkle_proof(3)
+        self.assertTrue(verify_proof(block.transactions[3], proof, header['merkle_root']))
+
+if __name__ == '__main__':
+    unittest.main()
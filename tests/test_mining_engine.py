@@ -0,0 +1,41 @@
+import hashlib
+import unittest
+from core.mining_engine import MiningEngine, difficulty_target, meets_target
+from core.blockchain import Blockchain
+
+class TestMiningEngine(unittest.TestCase):
+    def test_difficulty_target_matches_hex_prefix(self):
+        """Test that the byte target agrees with the leading-hex-zeros rule."""
+        target = difficulty_target(2)
+        for nonce in range(2000):
+            digest = hashlib.sha256(f"7{nonce}".encode()).digest()
+            self.assertEqual(meets_target(digest, target), digest.hex().startswith("00"))
+
+    def test_inline_search(self):
+        """Test single-worker search returns the first valid nonce."""
+        engine = MiningEngine(workers=1)
+        result = engine.search(prefix="42", difficulty=3)
+        expected = 0
+        while not hashlib.sha256(f"42{expected}".encode()).hexdigest().startswith("000"):
+            expected += 1
+        self.assertEqual(result.nonce, expected)
+        self.assertEqual(result.hashes, expected + 1)
+
+    def test_parallel_search_with_suffix(self):
+        """Test that a parallel search finds a valid nonce and stops all workers."""
+        engine = MiningEngine(workers=2, batch_size=1000, inline_difficulty=0)
+        result = engine.search(prefix="1", suffix="block data", difficulty=3)
+        digest = hashlib.sha256(f"1{result.nonce}block data".encode()).hexdigest()
+        self.assertTrue(digest.startswith("000"))
+        self.assertEqual(result.hash, digest)
+        self.assertEqual(result.workers, 2)
+        self.assertGreater(result.hashes, 0)
+
+    def test_blockchain_proof_of_work(self):
+        """Test that Blockchain.proof_of_work produces a proof accepted by valid_proof."""
+        blockchain = Blockchain(difficulty=3, mining_workers=2)
+        nonce = blockchain.proof_of_work(blockchain.last_block.nonce)
+        self.assertTrue(blockchain.valid_proof(blockchain.last_block.nonce, nonce))
+
+if __name__ == '__main__':
+    unittest.main()
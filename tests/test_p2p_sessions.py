@@ -0,0 +1,84 @@
+import socket
+import threading
+import unittest
+from cryptography.fernet import Fernet
+from network.p2p import P2PNetwork
+
+class TestP2PSessions(unittest.TestCase):
+    def setUp(self):
+        key = Fernet.generate_key()
+        self.received = []
+        self.done = threading.Event()
+        self.receiver = P2PNetwork('127.0.0.1', 0, key=key)
+        self.receiver.process_message = self.collect
+        self.receiver.start()
+        self.sender = P2PNetwork('127.0.0.1', 0, key=key, batch_window=0.05)
+
+    def tearDown(self):
+        self.sender.stop()
+        self.receiver.stop()
+
+    def collect(self, message):
+        self.received.append(message)
+        if len(self.received) >= self.expected:
+            self.done.set()
+
+    def test_messages_share_one_batched_session(self):
+        """Test that a burst of messages reuses one connection and is coalesced into few frames."""
+        self.expected = 200
+        peer = ('127.0.0.1', self.receiver.port)
+        for i in range(self.expected):
+            self.sender.send_message(peer, {"type": "tx", "n": i})
+        self.sender.flush()
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual([m["n"] for m in self.received], list(range(self.expected)))
+        health = self.sender.peer_health()[peer]
+        self.assertEqual(len(self.sender.sessions.sessions), 1)
+        self.assertEqual(health['messages_sent'], self.expected)
+        self.assertLess(health['frames_sent'], 10)
+        self.assertTrue(health['healthy'])
+
+    def test_broadcast_and_unhealthy_peer_removal(self):
+        """Test broadcast fan-out and that failing peers are dropped by the health check."""
+        self.expected = 1
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            dead_peer = probe.getsockname()
+        live_peer = ('127.0.0.1', self.receiver.port)
+        self.sender.peers.update({live_peer, dead_peer})
+        self.sender.sessions.session_options['max_failures'] = 1
+        self.sender.broadcast({"type": "block", "height": 1})
+        self.sender.flush()
+        self.assertTrue(self.done.wait(5))
+        self.sender.check_peers()
+        self.assertEqual(self.sender.peers, {live_peer})
+        self.assertNotIn(dead_peer, self.sender.sessions.sessions)
+
+    def test_unserializable_message_is_rejected_at_send(self):
+        """Test that a bad message raises to the caller and does not stall later messages."""
+        self.expected = 1
+        peer = ('127.0.0.1', self.receiver.port)
+        with self.assertRaises(TypeError):
+            self.sender.send_message(peer, {"type": "tx", "inputs": {1, 2}})
+        self.sender.send_message(peer, {"type": "tx", "n": 1})
+        self.sender.flush()
+        self.assertTrue(self.done.wait(5))
+        self.assertTrue(self.sender.sessions.get(peer).writer.is_alive())
+
+    def test_check_peers_probes_peers_without_sessions(self):
+        """Test that the health check probes session-less peers without opening sessions and drops dead ones."""
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            dead_peer = probe.getsockname()
+        live_peer = ('127.0.0.1', self.receiver.port)
+        self.sender.peers.update({live_peer, dead_peer})
+        self.sender.sessions.session_options['max_failures'] = 2
+        self.sender.check_peers()
+        self.assertEqual(self.sender.peers, {live_peer, dead_peer})
+        self.sender.check_peers()
+        self.assertEqual(self.sender.peers, {live_peer})
+        self.assertEqual(self.sender.sessions.sessions, {})
+        self.assertEqual(self.sender.probe_failures, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from holographic_data_storage.holographic_storage import HolographicStorage
+from holographic_data_storage.page_file_backend import FreeSpace, PageFileBackend
+
+class TestFreeSpace(unittest.TestCase):
+    def test_release_coalesces_neighbours(self):
+        """Test that freed extents merge back into a single run."""
+        space = FreeSpace(100)
+        offsets = [space.allocate(25) for _ in range(4)]
+        self.assertEqual(offsets, [0, 25, 50, 75])
+        self.assertIsNone(space.allocate(1))
+        for offset in (25, 75, 50, 0):
+            space.release(offset, 25)
+        self.assertEqual(space.runs, [[0, 100]])
+
+class TestPageFileBackend(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_persistence_and_space_reuse(self):
+        """Test that blobs survive a reopen and that deleted extents are reused."""
+        backend = PageFileBackend(self.directory, page_file_size=16 * 1024, block_size=1024)
+        backend.write("a", b"x" * 3000)
+        backend.write("b", b"y" * 100)
+        backend.write("a", b"z" * 10)  # Replacement releases the old extent
+        backend.delete("b")
+        backend.write("big", os.urandom(40 * 1024))  # Larger than a page file
+        backend.close()
+
+        backend = PageFileBackend(self.directory, page_file_size=16 * 1024, block_size=1024)
+        self.assertEqual(bytes(backend.view("a")), b"z" * 10)
+        self.assertNotIn("b", backend)
+        self.assertEqual(backend.size_of("big"), 40 * 1024)
+        self.assertEqual(backend.index["a"][:2], (0, 4096))
+        backend.write("c", b"w" * 2000)
+        self.assertEqual(backend.index["c"][:2], (0, 0))  # Old "a" and "b" extents, coalesced
+        backend.close()
+
+    def test_views_are_zero_copy_and_streamable(self):
+        """Test that views alias the mapping and chunked reads cover the blob."""
+        backend = PageFileBackend(self.directory, page_file_size=64 * 1024)
+        payload = os.urandom(10000)
+        backend.write("blob", payload)
+        array = backend.array("blob")
+        self.assertFalse(array.flags.writeable)
+        writer = backend.open_writer("blob", 10000)
+        number, offset, _ = backend.index["blob"]
+        self.assertNotEqual((writer.number, writer.offset), (number, offset))
+        self.assertEqual(writer.write(payload[:5000]), 5000)
+        self.assertEqual(writer.write_at(writer.written, payload[5000:]), 10000)  # As a resumed upload would
+        writer.commit()
+        chunks = list(backend.iter_chunks("blob", chunk_size=4096, offset=1000))
+        self.assertEqual([len(chunk) for chunk in chunks], [4096, 4096, 808])
+        self.assertEqual(b"".join(chunks), payload[1000:])
+        backend.close()  # Live views keep their mapping
+        self.assertEqual(array.tobytes(), payload)
+
+    def test_streamed_extent_is_not_reused_until_finished(self):
+        """Test that overwriting a blob mid-stream does not hand its extent to another write."""
+        backend = PageFileBackend(self.directory, page_file_size=64 * 1024, block_size=1024)
+        original = os.urandom(8192)
+        backend.write("blob", original)
+        extent = backend.index["blob"][:2]
+        chunks = backend.iter_chunks("blob", chunk_size=1024)
+        received = [bytes(next(chunks))]
+        backend.write("blob", b"n" * 8192)
+        backend.write("other", b"o" * 8192)
+        self.assertNotEqual(backend.index["other"][:2], extent)
+        received.extend(bytes(chunk) for chunk in chunks)
+        self.assertEqual(b"".join(received), original)
+        backend.write("third", b"t" * 8192)
+        self.assertEqual(backend.index["third"][:2], extent)  # Released once the stream finished
+        backend.close()
+
+class TestDiskBackedHolographicStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_store_retrieve_and_restart(self):
+        """Test the HolographicStorage API on top of page files, including capacity and restart."""
+        storage = HolographicStorage(1024, storage_path=self.directory, page_file_size=4096)
+        self.assertTrue(storage.store_data("one", b"A" * 600))
+        self.assertFalse(storage.store_data("two", b"B" * 600))
+        self.assertTrue(storage.store_data("one", b"C" * 900))  # Replacing frees the old size
+        self.assertEqual(storage.get_storage_usage(), 900)
+        view = storage.retrieve_view("one")
+        self.assertEqual(view.shape, (900, 1))
+        np.testing.assert_array_equal(view[:, 0], np.full(900, ord("C"), dtype=np.uint8))
+        storage.close()
+
+        storage = HolographicStorage(1024, storage_path=self.directory, page_file_size=4096)
+        self.assertEqual(storage.retrieve_data("one"), b"C" * 900)
+        self.assertEqual(storage.get_storage_usage(), 900)
+        self.assertEqual(b"".join(storage.stream_data("one", chunk_size=256)), b"C" * 900)
+        storage.clear_storage()
+        self.assertIsNone(storage.retrieve_data("one"))
+        storage.close()
+
+    def test_writers_reserve_capacity(self):
+        """Test that open writers hold capacity and that closed writers refuse further use."""
+        storage = HolographicStorage(1024, storage_path=self.directory, page_file_size=4096)
+        first = storage.open_writer("one", 600)
+        self.assertIsNone(storage.open_writer("two", 600))
+        self.assertFalse(storage.store_data("two", b"B" * 600))
+        first.write(b"A" * 600)
+        storage.storage_capacity = 500
+        self.assertFalse(first.commit())
+        self.assertTrue(first.closed)
+        self.assertFalse(first.commit())
+        with self.assertRaises(ValueError):
+            first.write(b"A")
+        storage.storage_capacity = 1024
+        self.assertEqual(storage.reserved, 0)
+        self.assertNotIn("one", storage.stored_data)
+        self.assertTrue(storage.store_data("two", b"B" * 600))
+        storage.close()
+
+if __name__ == '__main__':
+    unittest.main()
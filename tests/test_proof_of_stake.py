@@ -0,0 +1,100 @@
+import random
+import unittest
+from collections import Counter
+from modules.consensus.proof_of_stake import ProofOfStake
+from modules.consensus.stake_index import StakeIndex
+
+class TestStakeIndex(unittest.TestCase):
+    def test_find_matches_linear_walk(self):
+        """Test that Fenwick lookups agree with a linear walk over cumulative stakes in id order, across growth."""
+        rng = random.Random(5)
+        index = StakeIndex(capacity=2)
+        weights = {}
+        for i in range(300):
+            weights[f"v{i}"] = rng.choice([0.0, rng.uniform(1, 100)])
+            index.set(f"v{i}", weights[f"v{i}"])
+        index.set("v7", 0.0)
+        weights["v7"] = 0.0
+        self.assertAlmostEqual(index.total, sum(weights.values()), places=6)
+        for _ in range(500):
+            point = rng.uniform(0, index.total * 0.999999)
+            cumulative = 0.0
+            for validator, weight in sorted(weights.items()):
+                cumulative += weight
+                if cumulative > point:
+                    break
+            self.assertEqual(index.find(point), validator)
+
+    def test_registration_order_does_not_change_picks(self):
+        """Test that two indexes reaching the same stakes by different histories make identical seeded picks."""
+        rng = random.Random(9)
+        stakes = {f"v{i}": rng.uniform(1, 100) for i in range(200)}
+        first, second = StakeIndex(capacity=2), StakeIndex()
+        for validator, stake in stakes.items():
+            first.set(validator, stake)
+        for validator in sorted(stakes, reverse=True):
+            second.set(validator, stakes[validator] / 3)
+            second.sample(seed=validator)
+            second.set(validator, stakes[validator])
+        self.assertEqual(first.total, second.total)
+        for round_ in range(200):
+            self.assertEqual(first.sample(seed=str(round_)), second.sample(seed=str(round_)))
+            self.assertEqual(first.sample_distinct(5, seed=str(round_)), second.sample_distinct(5, seed=str(round_)))
+
+    def test_sample_distinct_restores_weights(self):
+        """Test committee draws are distinct and leave the index unchanged."""
+        index = StakeIndex()
+        for i in range(10):
+            index.set(i, i + 1.0)
+        committee = index.sample_distinct(4, seed=b"block")
+        self.assertEqual(len(set(committee)), 4)
+        self.assertEqual(index.total, 55.0)
+        self.assertEqual(index.weight(3), 4.0)
+        self.assertEqual(sorted(index.sample_distinct(50, seed=b"block")), list(range(10)))
+
+    def test_sample_distinct_leaves_tree_exact(self):
+        """Test that repeated committee draws leave the tree bit for bit unchanged."""
+        index = StakeIndex()
+        for i in range(100):
+            index.set(i, 0.1 * i + 0.3)
+        index.sample(seed="first")  # Merges the new registrations into the tree
+        tree, total = list(index._tree), index.total
+        for round_ in range(200):
+            index.sample_distinct(7, seed=str(round_))
+        self.assertEqual(index._tree, tree)
+        self.assertEqual(index.total, total)
+
+class TestProofOfStake(unittest.TestCase):
+    def setUp(self):
+        self.pos = ProofOfStake(rng=random.Random(1))
+        self.pos.register_stake("Alice", 50)
+        self.pos.register_stake("Bob", 30)
+        self.pos.register_stake("Charlie", 20)
+
+    def test_seeded_selection_is_deterministic(self):
+        """Test that selection from a previous block hash is reproducible on another node."""
+        other = ProofOfStake()
+        for validator, stake in self.pos.stakes.items():
+            other.register_stake(validator, stake)
+        for block_hash in ("00ab", "00cd", "00ef"):
+            self.assertEqual(self.pos.select_validator(block_hash), other.select_validator(block_hash))
+            self.assertEqual(self.pos.select_committee(2, block_hash), other.select_committee(2, block_hash))
+
+    def test_selection_is_stake_weighted(self):
+        """Test that draws follow stake proportions and rewards update the weights."""
+        counts = Counter(self.pos.select_validator() for _ in range(20000))
+        self.assertAlmostEqual(counts["Alice"] / 20000, 0.5, delta=0.02)
+        self.assertAlmostEqual(counts["Charlie"] / 20000, 0.2, delta=0.02)
+        self.pos.distribute_rewards("Charlie", 100)
+        self.assertEqual(self.pos.total_stake, 200)
+        self.assertEqual(self.pos.index.weight("Charlie"), 120)
+
+    def test_committee_unique_and_bounded(self):
+        """Test that committees contain distinct validators and cap at the validator count."""
+        committee = self.pos.select_committee(2, "seed")
+        self.assertEqual(len(set(committee)), 2)
+        self.assertEqual(sorted(self.pos.select_committee(10, "seed")), ["Alice", "Bob", "Charlie"])
+        self.assertEqual(ProofOfStake().select_committee(3), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from quantum_network.qkd import BB84Engine, QuantumKeyDistribution, toeplitz_hash
+
+class TestToeplitzHash(unittest.TestCase):
+    def test_matches_explicit_matrix(self):
+        """Test the FFT Toeplitz product against the matrix definition over GF(2)."""
+        rng = np.random.default_rng(1)
+        bits = rng.integers(0, 2, 300, dtype=np.uint8)
+        seed = rng.integers(0, 2, 300 + 40 - 1, dtype=np.uint8)
+        matrix = np.array([[seed[i - j + 299] for j in range(300)] for i in range(40)], dtype=np.int64)
+        np.testing.assert_array_equal(toeplitz_hash(bits, seed, 40), (matrix @ bits) % 2)
+
+class TestBB84Engine(unittest.TestCase):
+    def test_seeded_runs_are_reproducible_and_sift_half(self):
+        """Test that a seed fixes the key and that about half the qubits survive sifting."""
+        first = BB84Engine(rng=7).run(100_000)
+        second = BB84Engine(rng=7).run(100_000)
+        np.testing.assert_array_equal(first.key, second.key)
+        self.assertAlmostEqual(first.sifted_length / 100_000, 0.5, delta=0.01)
+        self.assertEqual(first.qber, 0.0)
+        self.assertEqual(len(first.key), first.sifted_length - first.sample_size - 64)
+
+    def test_error_estimation_and_abort(self):
+        """Test that channel noise is measured and that an eavesdropper causes an abort."""
+        noisy = BB84Engine(rng=3, channel_error=0.03).run(200_000)
+        self.assertAlmostEqual(noisy.qber, 0.03, delta=0.005)
+        self.assertFalse(noisy.aborted)
+        self.assertLess(len(noisy.key), noisy.sifted_length - noisy.sample_size)  # Shrunk for the leakage
+        attacked = BB84Engine(rng=3, eavesdropper=True).run(200_000)
+        self.assertAlmostEqual(attacked.qber, 0.25, delta=0.01)
+        self.assertTrue(attacked.aborted)
+        self.assertEqual(len(attacked.key), 0)
+
+    def test_session_key_length(self):
+        """Test that a 256-bit session key comes back as 32 bytes."""
+        qkd = QuantumKeyDistribution("Alice", "Bob", verbose=False, rng=11)
+        key = qkd.generate_session_key(256)
+        self.assertEqual(len(key), 32)
+        self.assertEqual(len(qkd.shared_key), 256)
+
+if __name__ == '__main__':
+    unittest.main()
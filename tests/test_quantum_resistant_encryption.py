@@ -0,0 +1,53 @@
+import os
+import unittest
+import numpy as np
+from bqpl.quantum_resistant_encryption import QuantumResistantEncryption, cyclic_convolve
+
+class TestCyclicConvolve(unittest.TestCase):
+    def test_matches_ring_definition(self):
+        """Test the FFT product against the definition in Z[x]/(x^N - 1), single and batched."""
+        rng = np.random.default_rng(0)
+        N = 37
+        a = rng.integers(-1000, 1000, N)
+        b = rng.integers(-3, 4, (5, N))
+        expected = np.array([[sum(a[j] * row[(k - j) % N] for j in range(N)) for k in range(N)] for row in b])
+        np.testing.assert_array_equal(cyclic_convolve(a, b, N), expected)
+
+class TestQuantumResistantEncryption(unittest.TestCase):
+    def test_keys_are_inverse_related(self):
+        """Test that f * f^-1 = 1 mod q for the private key."""
+        qre = QuantumResistantEncryption(seed=1)
+        product = cyclic_convolve(qre.private_key, qre._private_inverse_q, qre.N) % qre.q
+        np.testing.assert_array_equal(product, np.eye(1, qre.N, dtype=np.int64)[0])
+
+    def test_batch_round_trip(self):
+        """Test that batches of random messages decrypt exactly at N = 509 and N = 677."""
+        for N in (509, 677):
+            qre = QuantumResistantEncryption(N=N, seed=N)
+            messages = np.random.default_rng(N).integers(0, 2, (200, N))
+            ciphertexts = qre.encrypt_batch(messages)
+            self.assertEqual(ciphertexts.shape, (200, N))
+            np.testing.assert_array_equal(qre.decrypt_batch(ciphertexts), messages)
+
+    def test_binary_string_round_trip(self):
+        """Test the single-message API, including the small parameters used by the examples."""
+        for params in ({}, {'p': 3, 'q': 32, 'N': 11}):
+            qre = QuantumResistantEncryption(seed=2, **params)
+            plaintext = "1101010110"
+            self.assertEqual(qre.decrypt(qre.encrypt(plaintext), len(plaintext)), plaintext)
+        with self.assertRaises(ValueError):
+            qre.encrypt("1" * 12)
+
+    def test_stream_and_bytes_round_trip(self):
+        """Test that payloads of any length survive chunked streaming."""
+        qre = QuantumResistantEncryption(seed=3)
+        payload = os.urandom(100_000)
+        chunks = [payload[i:i + 7000] for i in range(0, len(payload), 7000)]
+        batches = list(qre.encrypt_stream(chunks, batch_size=64))
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(b"".join(qre.decrypt_stream(batches)), payload)
+        self.assertEqual(qre.decrypt_bytes(qre.encrypt_bytes(b"")), b"")
+        self.assertEqual(qre.decrypt_bytes(qre.encrypt_bytes(b"abc")), b"abc")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from ecdsa import SigningKey, SECP256k1
+from core.blockchain import Blockchain
+from core.signature_verification import SignatureVerifier, load_ecdsa_key
+
+class TestSignatureVerifier(unittest.TestCase):
+    def setUp(self):
+        """Create ECDSA keys and signed payloads."""
+        self.signing_keys = [SigningKey.generate(curve=SECP256k1) for _ in range(3)]
+        self.items = []
+        for i in range(12):
+            key = self.signing_keys[i % 3]
+            payload = f"payload-{i}".encode()
+            self.items.append((payload, key.sign(payload).hex(), key.get_verifying_key().to_string().hex()))
+        self.verifier = SignatureVerifier(workers=2, min_pool_batch=4)
+
+    def tearDown(self):
+        self.verifier.close()
+
+    def test_verify_single(self):
+        """Test verifying a valid and a tampered ECDSA signature."""
+        payload, signature, public_key = self.items[0]
+        self.assertTrue(self.verifier.verify(payload, signature, public_key))
+        self.assertFalse(self.verifier.verify(b"tampered", signature, public_key))
+
+    def test_batch_preserves_order(self):
+        """Test that pooled batch verification flags exactly the bad signatures."""
+        items = list(self.items)
+        items[5] = (b"tampered", items[5][1], items[5][2])
+        results = self.verifier.verify_batch(items)
+        self.assertEqual(results, [i != 5 for i in range(12)])
+        metrics = self.verifier.get_metrics()
+        self.assertEqual(metrics['pooled_batches'], 1)
+        self.assertEqual(metrics['invalid'], 1)
+
+    def test_key_cache(self):
+        """Test that repeated keys are parsed once."""
+        load_ecdsa_key.cache_clear()
+        self.verifier.verify_batch(self.items[:3])
+        self.verifier.verify_batch(self.items[3:6])
+        self.assertEqual(load_ecdsa_key.cache_info().misses, 3)
+
+    def test_rsa_key_objects(self):
+        """Test RSA-PSS verification with cryptography key objects, in-process and pooled."""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pss = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH)
+        items = [(b"msg%d" % i, private_key.sign(b"msg%d" % i, pss, hashes.SHA256()), private_key.public_key())
+                 for i in range(4)]
+        self.assertEqual(self.verifier.verify_batch(items), [True] * 4)
+        self.assertFalse(self.verifier.verify(b"other", items[0][1], items[0][2]))
+
+    def test_blockchain_ingest(self):
+        """Test that Blockchain accepts correctly signed transactions in single and batch form."""
+        blockchain = Blockchain(difficulty=1)
+        private_key, public_key = blockchain.generate_keypair()
+        signing_key = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
+        signature = signing_key.sign(Blockchain.transaction_payload(public_key, "Bob", 50)).hex()
+        self.assertEqual(blockchain.add_transaction(public_key, "Bob", 50, signature), 2)
+
+        batch = [
+            {'sender': public_key, 'recipient': "Carol", 'amount': 5,
+             'signature': signing_key.sign(Blockchain.transaction_payload(public_key, "Carol", 5)).hex()},
+            {'sender': public_key, 'recipient': "Dave", 'amount': 7, 'signature': signature},
+        ]
+        self.assertEqual(blockchain.add_transactions(batch), [2, -1])
+        self.assertEqual(len(blockchain.current_transactions), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import time
+import unittest
+from src.space.governance import GalacticGovernanceFramework
+
+class TestGovernanceFinalization(unittest.TestCase):
+    def setUp(self):
+        self.governance = GalacticGovernanceFramework(quorum_percentage=0.5, workers=2, min_pool_batch=10)
+
+    def tearDown(self):
+        self.governance.close()
+
+    def cast(self, proposal_id, votes_for, votes_against):
+        for i in range(votes_for):
+            self.governance.vote(proposal_id, f"for-{i}", "for")
+        for i in range(votes_against):
+            self.governance.vote(proposal_id, f"against-{i}", "against")
+
+    def test_sweep_finalizes_only_expired_proposals(self):
+        """Test that one sweep decides expired proposals from their decrypted votes."""
+        for proposal_id, expiration in (("P1", 10), ("P2", 20), ("P3", 3600), ("P4", 5)):
+            self.governance.create_proposal(proposal_id, "Description", "Council", expiration_time=expiration)
+        self.cast("P1", 12, 3)
+        self.cast("P2", 2, 9)
+        self.cast("P3", 5, 0)
+        self.governance.finalize_proposal("P4")  # No votes: stays pending
+
+        results = self.governance.finalize_expired(now=time.time() + 60)
+        self.assertEqual(results, {"P4": None, "P1": "approved", "P2": "rejected"})
+        self.assertEqual(self.governance.get_proposal_status("P3"), "pending")
+        self.assertEqual(self.governance.finalize_expired(now=time.time() + 60), {})
+        self.assertEqual(len(self.governance.expiry_heap), 1)
+
+    def test_batch_decryption_matches_single_proposal(self):
+        """Test pooled and in-process decryption against decrypt_votes."""
+        self.governance.create_proposal("P1", "Description", "Council")
+        self.governance.create_proposal("P2", "Description", "Council")
+        self.cast("P1", 8, 7)
+        self.cast("P2", 1, 0)
+        pooled = self.governance.decrypt_votes_many(["P1", "P2", "missing"])
+        self.assertEqual(pooled, {"P1": self.governance.decrypt_votes("P1"), "P2": self.governance.decrypt_votes("P2")})
+        self.assertIsNotNone(self.governance._executor)
+        self.assertEqual(self.governance.decrypt_votes_many(["P2"])["P2"], [("for-0", "for")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from ggf.voting_system import VotingSystem
+
+class TestVotingSystem(unittest.TestCase):
+    def setUp(self):
+        self.voting = VotingSystem()
+        self.voting.propose("p1", "Raise the block size")
+        self.voting.propose("p2", "Lower fees")
+
+    def test_duplicate_votes_are_rejected(self):
+        """Test that a voter is counted once per proposal but may vote on others."""
+        self.assertTrue(self.voting.vote("p1", "alice", True))
+        self.assertFalse(self.voting.vote("p1", "alice", False))
+        self.assertTrue(self.voting.vote("p2", "alice", False))
+        self.assertFalse(self.voting.vote("missing", "alice", True))
+        self.assertEqual(self.voting.tally_votes("p1"), {"yes": 1, "no": 0, "total": 1})
+
+    def test_vote_many_keeps_running_tallies(self):
+        """Test bulk ingestion against the tallies and the recorded votes."""
+        ballots = [("p1", f"v{i}", i % 3 == 0) for i in range(30)]
+        ballots += [("p1", "v0", False), ("p2", "v0", False), ("missing", "v1", True)]
+        self.assertEqual(self.voting.vote_many(ballots), 31)
+        self.assertEqual(self.voting.tally_votes("p1"), {"yes": 10, "no": 20, "total": 30})
+        self.assertEqual(self.voting.tally_votes("p2"), {"yes": 0, "no": 1, "total": 1})
+        self.assertEqual(len(self.voting.votes["p1"]), 30)
+        self.voting.decide("p1", self.voting.tally_votes("p1"))
+        self.assertEqual(self.voting.get_proposal_status("p1"), "rejected")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import logging
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives import serialization
+from core.signature_verification import get_default_verifier
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -10,6 +11,7 @@ class TransactionSigning:
     def __init__(self, key_manager):
         """Initialize transaction signing with a key manager."""
         self.key_manager = key_manager
+        self.verifier = get_default_verifier()
 
     def sign_transaction(self, transaction_data: dict, private_key) -> str:
         """Sign a transaction using the private key."""
@@ -28,21 +30,17 @@ class TransactionSigning:
     def verify_signature(self, transaction_data: dict, signature: str, public_key) -> bool:
         """Verify the signature of a transaction."""
         transaction_string = str(transaction_data).encode()
-        try:
-            public_key.verify(
-                bytes.fromhex(signature),
-                transaction_string,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
+        if self.verifier.verify(transaction_string, signature, public_key):
             logging.info("Signature verified successfully.")
             return True
-        except Exception as e:
-            logging.error(f"Signature verification failed: {e}")
-            return False
+        logging.error("Signature verification failed.")
+        return False
+
+    def verify_signatures(self, transactions: list) -> list:
+        """Verify many (transaction_data, signature, public_key) tuples in one batch."""
+        items = [(str(transaction_data).encode(), signature, public_key)
+                 for transaction_data, signature, public_key in transactions]
+        return self.verifier.verify_batch(items)
 
     def sign_multisig_transaction(self, transaction_data: dict, private_keys: list) -> list:
         """Sign a transaction with multiple private keys for multi-signature support."""